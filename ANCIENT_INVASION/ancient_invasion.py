@@ -20,7 +20,11 @@ import uuid
 import pickle
 import copy
 import random
-from datetime import datetime
+import heapq
+from enum import IntEnum
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from datetime import datetime, timedelta
 import os
 from functools import reduce
 
@@ -30,6 +34,144 @@ from tabulate import tabulate
 mp.pretty = True
 
 
+# Creating codes for the vocabularies of the game. Values are compared as codes rather than as strings, and saved
+# games storing the old string values are converted to the codes when they are loaded.
+
+
+class GameCode(IntEnum):
+    """
+    This class contains attributes of a code standing for a value in one of the vocabularies of the game.
+    """
+
+    def __str__(self):
+        return self.name.replace("_", " ")
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    @classmethod
+    def get_code(cls, value, default=None):
+        # type: (object, GameCode or None) -> GameCode or None
+        # Converting the string value 'value' (as used in menus and in older saved games) to its code
+        if isinstance(value, cls):
+            return value
+
+        return cls.__members__.get(str(value).replace(" ", "_"), default)
+
+
+class Element(GameCode):
+    FIRE = 0
+    WATER = 1
+    WIND = 2
+    LIGHT = 3
+    DARK = 4
+    NEUTRAL = 5
+
+
+class ActionName(GameCode):
+    NORMAL_ATTACK = 0
+    NORMAL_HEAL = 1
+    USE_SKILL = 2
+
+
+class ActiveSkillType(GameCode):
+    ATTACK = 0
+    HEAL = 1
+    ALLIES_EFFECT = 2
+    ENEMIES_EFFECT = 3
+
+
+class BeneficialEffectName(GameCode):
+    INCREASE_ATK = 0
+    INCREASE_DEF = 1
+    INCREASE_SPD = 2
+    INCREASE_CRIT_RATE = 3
+    IMMUNITY = 4
+    INVINCIBILITY = 5
+    HEAL_OVER_TIME = 6
+    COUNTER = 7
+    REFLECT = 8
+    VAMPIRE = 9
+    INCREASE_CRIT_RESIST = 10
+    SHIELD = 11
+    ENDURE = 12
+
+    def __str__(self):
+        return self.name
+
+
+class HarmfulEffectName(GameCode):
+    DECREASE_ATK = 0
+    DECREASE_DEF = 1
+    GLANCING = 2
+    DECREASE_SPD = 3
+    BLOCK_BENEFICIAL_EFFECTS = 4
+    BRAND = 5
+    UNRECOVERABLE = 6
+    OBLIVION = 7
+    SILENCE = 8
+    DAMAGE_OVER_TIME = 9
+    STUN = 10
+
+    def __str__(self):
+        return self.name
+
+
+def load_saved_codes(obj, state, code_attributes):
+    # type: (object, dict, dict) -> None
+    """
+    Restoring 'obj' from the saved state 'state', converting the values of the attributes in 'code_attributes'
+    (attribute -> code type) which older saved games store as strings to their codes.
+    :return: None
+    """
+
+    for attribute, code_type in code_attributes.items():
+        if attribute in state.keys():
+            state[attribute] = code_type.get_code(state[attribute], state[attribute])
+
+    obj.__dict__.update(state)
+
+
+# Creating the table of matchups between elements, indexed by the codes of the attacking and the defending elements.
+
+
+class ElementMatchup:
+    """
+    This class contains attributes of the matchup between the element of an attacking legendary creature and the
+    element of the legendary creature it attacks.
+    """
+
+    # Element -> element it has an advantage over
+    ADVANTAGES: dict = {Element.WATER: Element.FIRE, Element.WIND: Element.WATER, Element.FIRE: Element.WIND}
+    DISADVANTAGE_GLANCING_HIT_CHANCE_UP: mpf = mpf("0.3")
+
+    def __init__(self, attacking_element, defending_element):
+        # type: (Element, Element) -> None
+        self.attacking_element: Element = attacking_element
+        self.defending_element: Element = defending_element
+        self.has_advantage: bool = self.ADVANTAGES.get(attacking_element) == defending_element
+        self.has_disadvantage: bool = self.ADVANTAGES.get(defending_element) == attacking_element
+        self.glancing_hit_chance_up: mpf = self.DISADVANTAGE_GLANCING_HIT_CHANCE_UP if self.has_disadvantage else \
+            mpf("0")
+        self.can_crush: bool = self.has_advantage
+
+    def __str__(self):
+        return '%s(%s)' % (
+            type(self).__name__,
+            ', '.join('%s=%s' % item for item in vars(self).items())
+        )
+
+    def clone(self):
+        # type: () -> ElementMatchup
+        return copy.deepcopy(self)
+
+
+# ELEMENT_MATCHUPS[attacking element][defending element] is the matchup between the two elements, and
+# ELEMENT_MATCHUPS[attacking element] gives the matchups against every element at once.
+ELEMENT_MATCHUPS: list = [[ElementMatchup(attacking_element, defending_element) for defending_element in Element]
+                          for attacking_element in Element]
+
+
 # Creating static functions to be used in this game.
 
 
@@ -45,6 +187,42 @@ def triangular(n: int) -> int:
     return int(n * (n - 1) / 2)
 
 
+def triangular_product(start: int, count: int) -> mpf:
+    # Product of triangular(n) for n in [start, start + count), computed in closed form with rising factorials
+    return mp.rf(start, count) * mp.rf(start - 1, count) / mpf("2") ** count
+
+
+def level_up_exp_exponent(level: int, levels_gained: int) -> int:
+    # The required EXP is multiplied by 10 ** (new level) on every level up, so levelling up 'levels_gained' times
+    # from 'level' multiplies it by 10 to the power of the sum of the new levels reached.
+    return levels_gained * level + levels_gained * (levels_gained + 1) // 2
+
+
+def level_ups_for_exp(level, exp, required_exp, max_level=float('inf')):
+    # type: (int, mpf, mpf, int or float) -> int
+    """
+    Counting the number of level ups gained with 'exp' EXP at level 'level' when 'required_exp' EXP is needed for the
+    next level. The count is the root of a quadratic equation, so it takes the same time for any amount of EXP.
+    :return: the number of level ups
+    """
+
+    if exp < required_exp or level >= max_level:
+        return 0
+
+    # Finding the largest n such that the EXP required after n level ups does not exceed 'exp'
+    b: int = 2 * level + 1
+    n: int = int(mp.floor((mp.sqrt(b ** 2 + 8 * (mp.log10(exp) - mp.log10(required_exp))) - b) / 2))
+
+    # Correcting rounding errors from the logarithms
+    while n > 0 and required_exp * mpf("10") ** level_up_exp_exponent(level, n) > exp:
+        n -= 1
+
+    while required_exp * mpf("10") ** level_up_exp_exponent(level, n + 1) <= exp:
+        n += 1
+
+    return int(min(n + 1, max_level - level))
+
+
 def mpf_sum_of_list(a_list: list) -> mpf:
     return mpf(str(sum(mpf(str(elem)) for elem in a_list if is_number(str(elem)))))
 
@@ -73,6 +251,65 @@ def clear():
         os.system('clear')  # For Linux System
 
 
+def get_legendary_creature_choices(legendary_creature_inventory, page_number, placement=None,
+                                   excluded_legendary_creatures=None):
+    # type: (LegendaryCreatureInventory, int, str or None, list or None) -> list
+    page_size: int = LegendaryCreatureInventory.DEFAULT_PAGE_SIZE
+    if excluded_legendary_creatures is None or len(excluded_legendary_creatures) == 0:
+        return legendary_creature_inventory.get_page(page_number, placement=placement)
+
+    # Fetching enough legendary creatures to fill the page after the excluded ones are dropped
+    legendary_creatures: list = legendary_creature_inventory.get_page(
+        1, page_number * page_size + len(excluded_legendary_creatures), placement=placement)
+    return [legendary_creature for legendary_creature in legendary_creatures if legendary_creature not in
+            excluded_legendary_creatures][(page_number - 1) * page_size:page_number * page_size]
+
+
+def print_legendary_creature_choices(legendary_creatures, first_index):
+    # type: (list, int) -> None
+    rows: list = [["INDEX", "NAME", "ELEMENT", "RATING", "LEVEL", "PLACEMENT"]]
+    for index, legendary_creature in enumerate(legendary_creatures, first_index):
+        rows.append([index, legendary_creature.name, str(legendary_creature.element), legendary_creature.rating,
+                     legendary_creature.level, LegendaryCreatureInventory.get_placement(legendary_creature)])
+
+    print(str(tabulate(rows, headers='firstrow', tablefmt='fancy_grid')) + "\n")
+
+
+def choose_legendary_creature(legendary_creature_inventory, action, placement=None,
+                              excluded_legendary_creatures=None):
+    # type: (LegendaryCreatureInventory, str, str or None, list or None) -> LegendaryCreature
+    """
+    Asking the player to choose a legendary creature with the given placement from the legendary creature inventory,
+    apart from the excluded ones. The choices are shown one page at a time and entering 'P' followed by a page
+    number shows another page.
+    :return: the chosen legendary creature
+    """
+
+    page_size: int = LegendaryCreatureInventory.DEFAULT_PAGE_SIZE
+    num_choices: int = len(legendary_creature_inventory.find_legendary_creatures(placement=placement)) - \
+        (0 if excluded_legendary_creatures is None else len(excluded_legendary_creatures))
+    num_pages: int = max(1, -(-num_choices // page_size))
+    print_legendary_creature_choices(get_legendary_creature_choices(legendary_creature_inventory, 1, placement,
+                                                                    excluded_legendary_creatures), 1)
+    prompt: str = "Please enter the index of the legendary creature you want to " + str(action) + " (1 - " + \
+                  str(num_choices) + "), or 'P' followed by a page number to view another page (1 - " + \
+                  str(num_pages) + "): "
+    choice: str = str(input(prompt))
+    while True:
+        if choice[:1] == "P" and choice[1:].isdigit() and 1 <= int(choice[1:]) <= num_pages:
+            page_number: int = int(choice[1:])
+            print_legendary_creature_choices(get_legendary_creature_choices(
+                legendary_creature_inventory, page_number, placement, excluded_legendary_creatures),
+                (page_number - 1) * page_size + 1)
+            choice = str(input(prompt))
+        elif choice.isdigit() and 1 <= int(choice) <= num_choices:
+            index: int = int(choice) - 1
+            return get_legendary_creature_choices(legendary_creature_inventory, index // page_size + 1, placement,
+                                                  excluded_legendary_creatures)[index % page_size]
+        else:
+            choice = str(input("Sorry, invalid input! " + prompt))
+
+
 def resistance_accuracy_rule(accuracy: mpf, resistance: mpf) -> mpf:
     if resistance - accuracy <= mpf("0.15"):
         return mpf("0.15")
@@ -80,26 +317,13 @@ def resistance_accuracy_rule(accuracy: mpf, resistance: mpf) -> mpf:
         return resistance - accuracy
 
 
-def glancing_hit_chance_by_elements(element1: str, element2: str) -> mpf:
-    if element1 == "FIRE" and element2 == "WATER":
-        return mpf("0.3")
-    elif element1 == "WATER" and element2 == "WIND":
-        return mpf("0.3")
-    elif element1 == "WIND" and element2 == "FIRE":
-        return mpf("0.3")
-    else:
-        return mpf("0")
+def glancing_hit_chance_by_elements(element1: Element, element2: Element) -> mpf:
+    return ELEMENT_MATCHUPS[element1][element2].glancing_hit_chance_up
 
 
 def crushing_hit_chance_by_elements(legendary_creature1, legendary_creature2):
     # type: (LegendaryCreature, LegendaryCreature) -> mpf
-    if legendary_creature1.element == "WATER" and legendary_creature2.element == "FIRE":
-        return mpf("1") - (legendary_creature1.crit_rate + legendary_creature1.crit_rate_up -
-                           legendary_creature2.crit_resist - legendary_creature2.crit_resist_up)
-    elif legendary_creature1.element == "WIND" and legendary_creature2.element == "WATER":
-        return mpf("1") - (legendary_creature1.crit_rate + legendary_creature1.crit_rate_up -
-                           legendary_creature2.crit_resist - legendary_creature2.crit_resist_up)
-    elif legendary_creature1.element == "FIRE" and legendary_creature2.element == "WIND":
+    if ELEMENT_MATCHUPS[legendary_creature1.element][legendary_creature2.element].can_crush:
         return mpf("1") - (legendary_creature1.crit_rate + legendary_creature1.crit_rate_up -
                            legendary_creature2.crit_resist - legendary_creature2.crit_resist_up)
     else:
@@ -118,7 +342,7 @@ class Action:
 
     def __init__(self, name):
         # type: (str) -> None
-        self.name: str = name if name in self.POSSIBLE_NAMES else self.POSSIBLE_NAMES[0]
+        self.name: ActionName = ActionName.get_code(name, ActionName.NORMAL_ATTACK)
 
     def __str__(self):
         return '%s(%s)' % (
@@ -126,9 +350,45 @@ class Action:
             ', '.join('%s=%s' % item for item in vars(self).items())
         )
 
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        load_saved_codes(self, state, {"name": ActionName})
+
+    @staticmethod
+    def __apply_passive_skills_to_enemy(user, enemy):
+        # type: (LegendaryCreature, LegendaryCreature) -> None
+        passive_skill_effect: PassiveSkillEffect = user.get_passive_skill_effect()
+        if enemy.can_receive_harmful_effect:
+            resist_chance: mpf = resistance_accuracy_rule(user.accuracy + user.accuracy_up,
+                                                          enemy.resistance + enemy.resistance_up)
+            for harmful_effect in passive_skill_effect.get_harmful_effects_to_enemies():
+                # Add negative effects to the enemy
+                if random.random() >= resist_chance:
+                    if not (harmful_effect.name == HarmfulEffectName.OBLIVION
+                            and enemy.legendary_creature_type == "BOSS"):
+                        enemy.add_harmful_effect(harmful_effect)
+
+            if passive_skill_effect.enemies_attack_gauge_down > 0 and random.random() >= resist_chance:
+                enemy.attack_gauge -= passive_skill_effect.enemies_attack_gauge_down
+
+    @staticmethod
+    def __apply_passive_skills_to_allies(user):
+        # type: (LegendaryCreature) -> None
+        passive_skill_effect: PassiveSkillEffect = user.get_passive_skill_effect()
+        for legendary_creature in user.corresponding_team.get_legendary_creatures():
+            if legendary_creature.can_receive_beneficial_effect:
+                for beneficial_effect in passive_skill_effect.get_beneficial_effects_to_allies():
+                    legendary_creature.add_beneficial_effect(beneficial_effect)
+
+            legendary_creature.attack_gauge += passive_skill_effect.allies_attack_gauge_up
+            if legendary_creature.can_be_healed and passive_skill_effect.heal_amount_to_allies > 0:
+                legendary_creature.curr_hp += passive_skill_effect.heal_amount_to_allies
+                if legendary_creature.curr_hp >= legendary_creature.max_hp:
+                    legendary_creature.curr_hp = legendary_creature.max_hp
+
     def execute(self, user, target, skill_to_use=None):
         # type: (LegendaryCreature, LegendaryCreature, Skill or None) -> bool
-        if self.name == "NORMAL ATTACK":
+        if self.name == ActionName.NORMAL_ATTACK:
             if user == target:
                 return False
 
@@ -141,7 +401,7 @@ class Action:
             print(str(user.name) + " dealt " + str(damage) + " damage on " + str(target.name) + "!")
             return True
 
-        elif self.name == "NORMAL HEAL":
+        elif self.name == ActionName.NORMAL_HEAL:
             if user != target:
                 return False
 
@@ -149,12 +409,12 @@ class Action:
             user.curr_hp += heal_amount
             return True
 
-        elif self.name == "USE SKILL":
+        elif self.name == ActionName.USE_SKILL:
             if isinstance(skill_to_use, ActiveSkill):
                 if not skill_to_use.is_active:
                     return False
 
-                if skill_to_use.active_skill_type == "ATTACK":
+                if skill_to_use.active_skill_type == ActiveSkillType.ATTACK:
                     if user == target or user.corresponding_team == target.corresponding_team:
                         return False
 
@@ -186,7 +446,7 @@ class Action:
                                                                               enemy.resistance + enemy.resistance_up)
                                 for harmful_effect in skill_to_use.get_harmful_effects_to_enemies():
                                     if random.random() >= resist_chance:
-                                        if not (harmful_effect.name == "OBLIVION"
+                                        if not (harmful_effect.name == HarmfulEffectName.OBLIVION
                                                 and enemy.legendary_creature_type == "BOSS"):
                                             enemy.add_harmful_effect(harmful_effect)
 
@@ -198,55 +458,11 @@ class Action:
                             # Resetting user's attack gauge to zero at first
                             user.attack_gauge = user.MIN_ATTACK_GAUGE
 
-                            # Consider effect of passive skills of the user
-                            # 1. Beneficial effects to allies
-                            for legendary_creature in user.corresponding_team.get_legendary_creatures():
-                                if legendary_creature.can_receive_beneficial_effect:
-                                    for skill in user.get_skills():
-                                        if isinstance(skill, PassiveSkill):
-                                            for beneficial_effect in \
-                                                    skill.passive_skill_effect.get_beneficial_effects_to_allies():
-                                                legendary_creature.add_beneficial_effect(beneficial_effect)
-
-                            # 2. Harmful effects to enemies
-                            if enemy.can_receive_harmful_effect:
-                                for skill in user.get_skills():
-                                    if isinstance(skill, PassiveSkill):
-                                        resist_chance = resistance_accuracy_rule(
-                                            user.accuracy + user.accuracy_up,
-                                            enemy.resistance + enemy.resistance_up)
-                                        for harmful_effect in \
-                                                skill.passive_skill_effect.get_harmful_effects_to_enemies():
-                                            # Add negative effects to the enemy
-                                            if random.random() >= resist_chance:
-                                                if not (harmful_effect.name == "OBLIVION"
-                                                        and enemy.legendary_creature_type == "BOSS"):
-                                                    enemy.add_harmful_effect(harmful_effect)
-
-                            # 3. Increase allies' attack gauge
-                            for legendary_creature in user.corresponding_team.get_legendary_creatures():
-                                for skill in user.get_skills():
-                                    if isinstance(skill, PassiveSkill):
-                                        legendary_creature.attack_gauge += skill.passive_skill_effect.allies_attack_gauge_up
-
-                            # 4. Decrease enemies' attack gauge
-                            if enemy.can_receive_harmful_effect:
-                                for skill in user.get_skills():
-                                    if isinstance(skill, PassiveSkill):
-                                        resist_chance = resistance_accuracy_rule(
-                                            user.accuracy + user.accuracy_up,
-                                            enemy.resistance + enemy.resistance_up)
-                                        if random.random() >= resist_chance:
-                                            enemy.attack_gauge -= skill.passive_skill_effect.enemies_attack_gauge_down
-
-                            # 5. Heal allies
-                            for legendary_creature in user.corresponding_team.get_legendary_creatures():
-                                if legendary_creature.can_be_healed:
-                                    for skill in user.get_skills():
-                                        if isinstance(skill, PassiveSkill):
-                                            legendary_creature.curr_hp += skill.passive_skill_effect.heal_amount_to_allies
-                                            if legendary_creature.curr_hp >= legendary_creature.max_hp:
-                                                legendary_creature.curr_hp = legendary_creature.max_hp
+                            # Consider effect of passive skills of the user on the enemy
+                            self.__apply_passive_skills_to_enemy(user, enemy)
+
+                        # Consider effect of passive skills of the user on its allies, once for all the enemies
+                        self.__apply_passive_skills_to_allies(user)
                     else:
                         damage: mpf = skill_to_use.damage_multiplier.calculate_raw_damage(user, target,
                                                                                           skill_to_use.does_ignore_enemies_defense,
@@ -273,7 +489,7 @@ class Action:
                                                                           target.resistance + target.resistance_up)
                             for harmful_effect in skill_to_use.get_harmful_effects_to_enemies():
                                 if random.random() >= resist_chance:
-                                    if not (harmful_effect.name == "OBLIVION"
+                                    if not (harmful_effect.name == HarmfulEffectName.OBLIVION
                                             and target.legendary_creature_type == "BOSS"):
                                         target.add_harmful_effect(harmful_effect)
 
@@ -286,54 +502,10 @@ class Action:
                         user.attack_gauge = user.MIN_ATTACK_GAUGE
 
                         # Consider effect of passive skills of the user
-                        # 1. Beneficial effects to allies
-                        for legendary_creature in user.corresponding_team.get_legendary_creatures():
-                            if legendary_creature.can_receive_beneficial_effect:
-                                for skill in user.get_skills():
-                                    if isinstance(skill, PassiveSkill):
-                                        for beneficial_effect in \
-                                                skill.passive_skill_effect.get_beneficial_effects_to_allies():
-                                            legendary_creature.add_beneficial_effect(beneficial_effect)
-
-                        # 2. Harmful effects to enemies
-                        if target.can_receive_harmful_effect:
-                            for skill in user.get_skills():
-                                if isinstance(skill, PassiveSkill):
-                                    resist_chance = resistance_accuracy_rule(user.accuracy + user.accuracy_up,
-                                                                             target.resistance + target.resistance_up)
-                                    for harmful_effect in \
-                                            skill.passive_skill_effect.get_harmful_effects_to_enemies():
-                                        # Add negative effects to the enemy
-                                        if random.random() >= resist_chance:
-                                            if not (harmful_effect.name == "OBLIVION"
-                                                    and target.legendary_creature_type == "BOSS"):
-                                                target.add_harmful_effect(harmful_effect)
-
-                        # 3. Increase allies' attack gauge
-                        for legendary_creature in user.corresponding_team.get_legendary_creatures():
-                            for skill in user.get_skills():
-                                if isinstance(skill, PassiveSkill):
-                                    legendary_creature.attack_gauge += skill.passive_skill_effect.allies_attack_gauge_up
-
-                        # 4. Decrease enemies' attack gauge
-                        if target.can_receive_harmful_effect:
-                            for skill in user.get_skills():
-                                if isinstance(skill, PassiveSkill):
-                                    resist_chance = resistance_accuracy_rule(user.accuracy + user.accuracy_up,
-                                                                             target.resistance + target.resistance_up)
-                                    if random.random() >= resist_chance:
-                                        target.attack_gauge -= skill.passive_skill_effect.enemies_attack_gauge_down
-
-                        # 5. Heal allies
-                        for legendary_creature in user.corresponding_team.get_legendary_creatures():
-                            if legendary_creature.can_be_healed:
-                                for skill in user.get_skills():
-                                    if isinstance(skill, PassiveSkill):
-                                        legendary_creature.curr_hp += skill.passive_skill_effect.heal_amount_to_allies
-                                        if legendary_creature.curr_hp >= legendary_creature.max_hp:
-                                            legendary_creature.curr_hp = legendary_creature.max_hp
-
-                elif skill_to_use.active_skill_type == "HEAL":
+                        self.__apply_passive_skills_to_enemy(user, target)
+                        self.__apply_passive_skills_to_allies(user)
+
+                elif skill_to_use.active_skill_type == ActiveSkillType.HEAL:
                     if user.corresponding_team != target.corresponding_team:
                         return False
 
@@ -350,7 +522,7 @@ class Action:
                             if target.curr_hp >= target.max_hp:
                                 target.curr_hp = target.max_hp
 
-                elif skill_to_use.active_skill_type == "ALLIES EFFECT":
+                elif skill_to_use.active_skill_type == ActiveSkillType.ALLIES_EFFECT:
                     if user.corresponding_team != target.corresponding_team:
                         return False
 
@@ -369,7 +541,7 @@ class Action:
 
                         target.attack_gauge += skill_to_use.allies_attack_gauge_up
 
-                elif skill_to_use.active_skill_type == "ENEMIES EFFECT":
+                elif skill_to_use.active_skill_type == ActiveSkillType.ENEMIES_EFFECT:
                     if user == target or user.corresponding_team == target.corresponding_team:
                         return False
 
@@ -498,6 +670,26 @@ class Battle:
                                                       in self.team2.get_legendary_creatures()))
         self.whose_turn: LegendaryCreature or None = None
         self.winner: Team or None = None
+        self.has_started: bool = False
+        self.__teams: dict = {}  # legendary creature -> team of the legendary creature in the battle
+        self.__alive_counts: dict = {}  # initial value
+        for team in [self.team1, self.team2]:
+            self.__alive_counts[team] = 0
+            for legendary_creature in team.get_legendary_creatures():
+                self.__teams[legendary_creature] = team
+                legendary_creature.set_battle(self)
+                if legendary_creature.get_is_alive():
+                    self.__alive_counts[team] += 1
+
+        self.update_winner()
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        if self.winner is None:
+            # Legendary creatures do not keep the battle they are in when they are copied or saved
+            for legendary_creature in self.__teams.keys():
+                legendary_creature.set_battle(self)
 
     def __str__(self):
         return '%s(%s)' % (
@@ -505,24 +697,76 @@ class Battle:
             ', '.join('%s=%s' % item for item in vars(self).items())
         )
 
+    def start(self):
+        # type: () -> bool
+        """
+        Applying the leader skills of the leader of each team to all the legendary creatures in the team, once at the
+        start of the battle. The modifiers last until the legendary creatures are restored after the battle.
+        :return: True if the battle has not started before, False otherwise
+        """
+
+        if self.has_started:
+            return False
+
+        for team in [self.team1, self.team2]:
+            if team.leader is not None:
+                leader_skill_effect: LeaderSkillEffect = team.leader.get_leader_skill_effect()
+                for legendary_creature in team.get_legendary_creatures():
+                    legendary_creature.apply_leader_skill_effect(leader_skill_effect)
+
+        self.has_started = True
+        return True
+
+    def get_alive_count(self, team):
+        # type: (Team) -> int
+        return self.__alive_counts[team]
+
+    def update_alive_count(self, legendary_creature):
+        # type: (LegendaryCreature) -> None
+        """
+        Updating the number of legendary creatures alive in the team of a legendary creature whose HP has just crossed
+        zero, and setting the winner of the battle once a team has no legendary creatures alive.
+        :return: None
+        """
+
+        self.__alive_counts[self.__teams[legendary_creature]] += 1 if legendary_creature.get_is_alive() else -1
+        self.update_winner()
+
+    def update_winner(self):
+        # type: () -> None
+        if self.winner is None:
+            if self.__alive_counts[self.team2] == 0:
+                self.winner = self.team1
+            elif self.__alive_counts[self.team1] == 0:
+                self.winner = self.team2
+
+            if self.winner is not None:
+                # The battle is over, so HP changes no longer need to be counted
+                for legendary_creature in self.__teams.keys():
+                    legendary_creature.set_battle(None)
+
+    def get_alive_legendary_creatures(self):
+        # type: () -> list
+        return [legendary_creature for legendary_creature in self.team1.get_legendary_creatures() +
+                self.team2.get_legendary_creatures() if legendary_creature.get_is_alive()]
+
     def get_someone_to_move(self):
         # type: () -> None
         """
-        Getting a legendary creature to move and have its turn.
+        Getting a legendary creature which is still alive to move and have its turn. Nobody moves once the battle has
+        a winner.
         :return: None
         """
 
+        if self.winner is not None:
+            self.whose_turn = None
+            return
+
         # Finding out which legendary creature moves
         full_attack_gauge_list: list = []  # initial value
         while len(full_attack_gauge_list) == 0:
-            for legendary_creature in self.team1.get_legendary_creatures():
-                if legendary_creature.attack_gauge >= legendary_creature.FULL_ATTACK_GAUGE and legendary_creature not \
-                        in full_attack_gauge_list:
-                    full_attack_gauge_list.append(legendary_creature)
-
-            for legendary_creature in self.team2.get_legendary_creatures():
-                if legendary_creature.attack_gauge >= legendary_creature.FULL_ATTACK_GAUGE and legendary_creature not \
-                        in full_attack_gauge_list:
+            for legendary_creature in self.get_alive_legendary_creatures():
+                if legendary_creature.attack_gauge >= legendary_creature.FULL_ATTACK_GAUGE:
                     full_attack_gauge_list.append(legendary_creature)
 
             self.tick()
@@ -535,14 +779,12 @@ class Battle:
     def tick(self):
         # type: () -> None
         """
-        The clock ticks when battles are carried out.
+        The clock ticks when battles are carried out. Only legendary creatures which are still alive fill their
+        attack gauges.
         :return: None
         """
 
-        for legendary_creature in self.team1.get_legendary_creatures():
-            legendary_creature.attack_gauge += legendary_creature.attack_speed * 0.07
-
-        for legendary_creature in self.team2.get_legendary_creatures():
+        for legendary_creature in self.get_alive_legendary_creatures():
             legendary_creature.attack_gauge += legendary_creature.attack_speed * 0.07
 
     def clone(self):
@@ -652,12 +894,16 @@ class Level:
 
     def strengthen_enemies(self):
         # type: () -> None
+        level_ups: int = 2 ** self.times_beaten
         for stage in self.__stages:
             for enemy in stage.get_enemies_list():
-                level_ups: int = 2 ** self.times_beaten
-                for i in range(level_ups):
+                levels_gained: int = enemy.level_up_by(level_ups)
+
+                # The EXP of the enemy is topped up to its required EXP before each of the 'level_ups' level ups
+                if levels_gained < level_ups:
                     enemy.exp = enemy.required_exp
-                    enemy.level_up()
+                else:
+                    enemy.exp = enemy.required_exp / mpf("10") ** enemy.level
 
     def clone(self):
         # type: () -> Level
@@ -689,6 +935,94 @@ class Stage:
         return copy.deepcopy(self)
 
 
+class ScheduledEvent:
+    """
+    This class contains attributes of an event which happens periodically in this game.
+    """
+
+    def __init__(self, next_time, interval, action, owner=None):
+        # type: (datetime, timedelta, callable, object) -> None
+        self.next_time: datetime = next_time
+        self.interval: timedelta = interval
+        self.action: callable = action  # called with the current time whenever the event is due
+        self.owner: object = owner  # the object (e.g. a building) the event belongs to
+        self.cancelled: bool = False
+
+    def __str__(self):
+        return '%s(%s)' % (
+            type(self).__name__,
+            ', '.join('%s=%s' % item for item in vars(self).items())
+        )
+
+    def clone(self):
+        # type: () -> ScheduledEvent
+        return copy.deepcopy(self)
+
+
+class EventScheduler:
+    """
+    This class contains attributes of the scheduler of periodic events in this game. Events are kept in a heap ordered
+    by the next time they are due, so only due events are looked at.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.__events: list = []  # heap of (next time, sequence number, event) tuples
+        self.__sequence_number: int = 0  # used to order events which are due at the same time
+
+    def __str__(self):
+        return '%s(%s)' % (
+            type(self).__name__,
+            ', '.join('%s=%s' % item for item in vars(self).items())
+        )
+
+    def get_events(self):
+        # type: () -> list
+        return [entry[2] for entry in self.__events if not entry[2].cancelled]
+
+    def schedule(self, event):
+        # type: (ScheduledEvent) -> None
+        heapq.heappush(self.__events, (event.next_time, self.__sequence_number, event))
+        self.__sequence_number += 1
+
+    def cancel(self, owner):
+        # type: (object) -> bool
+        event_cancelled: bool = False
+        for entry in self.__events:
+            if entry[2].owner is owner:
+                entry[2].cancelled = True
+                event_cancelled = True
+
+        return event_cancelled
+
+    def run_due_events(self, time_now):
+        # type: (datetime) -> int
+        """
+        Running all events which are due at 'time_now' and scheduling them again.
+        :return: the number of events run
+        """
+
+        events_run: int = 0
+        while len(self.__events) > 0 and self.__events[0][0] <= time_now:
+            event: ScheduledEvent = heapq.heappop(self.__events)[2]
+            if event.cancelled:
+                continue
+
+            event.action(time_now)
+            events_run += 1
+
+            # Skipping the times the event was due while the player was away, so each event runs once per call
+            times_missed: int = (time_now - event.next_time) // event.interval
+            event.next_time += event.interval * (times_missed + 1)
+            self.schedule(event)
+
+        return events_run
+
+    def clone(self):
+        # type: () -> EventScheduler
+        return copy.deepcopy(self)
+
+
 class Player:
     """
     This class contains attributes of the player in this game.
@@ -713,6 +1047,10 @@ class Player:
         self.item_inventory: ItemInventory = ItemInventory()
         self.legendary_creature_inventory: LegendaryCreatureInventory = LegendaryCreatureInventory()
         self.player_base: PlayerBase = PlayerBase()
+        self.last_active_time: datetime = datetime.now()
+        self.scheduler: EventScheduler = EventScheduler()
+        self.building_bonuses: BuildingBonuses = BuildingBonuses()
+        self.__idle_legendary_creatures: list = []  # legendary creatures with a non-zero EXP per second
 
     def __str__(self):
         return '%s(%s)' % (
@@ -720,6 +1058,58 @@ class Player:
             ', '.join('%s=%s' % item for item in vars(self).items())
         )
 
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+
+        # Players saved by older versions of the game do not keep track of when they were last active, the periodic
+        # events of their buildings, the bonuses from their buildings or their legendary creatures in training areas
+        if "last_active_time" not in state.keys():
+            self.last_active_time = datetime.now()
+
+        if "scheduler" not in state.keys():
+            self.scheduler = EventScheduler()
+            for temple_of_wishes in self.player_base.get_buildings(TempleOfWishes):
+                self.__schedule_daily_reset(temple_of_wishes)
+
+        if "building_bonuses" not in state.keys():
+            self.building_bonuses = BuildingBonuses()
+            for building_type in BuildingBonuses.BUILDING_TYPES:
+                for building in self.player_base.get_buildings(building_type):
+                    self.building_bonuses.add_building(building)
+
+            for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
+                # The bonuses used to be added to the default values of the legendary creatures themselves
+                for attribute in ["DEFAULT_MAX_HP_PERCENTAGE_UP", "DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP",
+                                  "DEFAULT_ATTACK_POWER_PERCENTAGE_UP", "DEFAULT_ATTACK_SPEED_PERCENTAGE_UP",
+                                  "DEFAULT_DEFENSE_PERCENTAGE_UP"]:
+                    if attribute in vars(legendary_creature).keys():
+                        delattr(legendary_creature, attribute)
+
+                legendary_creature.building_bonuses = self.building_bonuses
+
+        if "_Player__idle_legendary_creatures" not in state.keys():
+            self.__idle_legendary_creatures = []
+            for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
+                self.__update_idle_legendary_creature(legendary_creature)
+
+    def __schedule_daily_reset(self, temple_of_wishes):
+        # type: (TempleOfWishes) -> None
+        self.scheduler.schedule(ScheduledEvent(temple_of_wishes.get_next_reset_time(self.last_active_time),
+                                               timedelta(days=1), temple_of_wishes.reset_daily, temple_of_wishes))
+
+    def get_idle_legendary_creatures(self):
+        # type: () -> list
+        return self.__idle_legendary_creatures
+
+    def __update_idle_legendary_creature(self, legendary_creature):
+        # type: (LegendaryCreature) -> None
+        if legendary_creature.exp_per_second != 0:
+            if legendary_creature not in self.__idle_legendary_creatures:
+                self.__idle_legendary_creatures.append(legendary_creature)
+        elif legendary_creature in self.__idle_legendary_creatures:
+            self.__idle_legendary_creatures.remove(legendary_creature)
+
     def claim_reward(self, reward):
         # type: (Reward) -> None
         self.exp += reward.player_reward_exp
@@ -729,23 +1119,15 @@ class Player:
         for legendary_creature in self.battle_team.get_legendary_creatures():
             legendary_creature.exp += reward.legendary_creature_reward_exp
             legendary_creature.level_up()
+            self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
 
         self.battle_team.recover_all()
         for item in reward.get_player_reward_items():
-            self.add_item_to_inventory(item)
+            self.add_item_to_inventory(item.clone())
 
     def make_a_wish(self, temple_of_wishes):
         # type: (TempleOfWishes) -> bool
-        temple_of_wishes_exists: bool = False
-        for island in self.player_base.get_islands():
-            for y in range(island.ISLAND_HEIGHT):
-                for x in range(island.ISLAND_WIDTH):
-                    curr_tile: IslandTile = island.get_tile_at(x, y)
-                    if curr_tile.building == temple_of_wishes:
-                        temple_of_wishes_exists = True
-                        break
-
-        if not temple_of_wishes_exists:
+        if not self.player_base.has_building(temple_of_wishes):
             return False
 
         if temple_of_wishes.wishes_left <= 0:
@@ -755,7 +1137,7 @@ class Player:
         object_obtained: Item or Reward or LegendaryCreature = \
             potential_objects[random.randint(0, len(potential_objects) - 1)]
         if isinstance(object_obtained, Item):
-            self.add_item_to_inventory(object_obtained)
+            self.add_item_to_inventory(object_obtained.clone())
         elif isinstance(object_obtained, Reward):
             self.exp += object_obtained.player_reward_exp
             self.level_up()
@@ -764,11 +1146,12 @@ class Player:
             for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
                 legendary_creature.exp += object_obtained.legendary_creature_reward_exp
                 legendary_creature.level_up()
+                self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
 
             for item in object_obtained.get_player_reward_items():
-                self.add_item_to_inventory(item)
+                self.add_item_to_inventory(item.clone())
         elif isinstance(object_obtained, LegendaryCreature):
-            self.add_legendary_creature(object_obtained)
+            self.add_legendary_creature(object_obtained.clone())
         else:
             pass
 
@@ -777,19 +1160,10 @@ class Player:
     def fuse_legendary_creatures(self, material_legendary_creatures, chosen_fusion_legendary_creature, fusion_center):
         # type: (list, FusionLegendaryCreature, FusionCenter) -> bool
         for material_legendary_creature in material_legendary_creatures:
-            if material_legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures():
+            if not self.legendary_creature_inventory.has_legendary_creature(material_legendary_creature):
                 return False
 
-        fusion_center_exists: bool = False
-        for island in self.player_base.get_islands():
-            for y in range(island.ISLAND_HEIGHT):
-                for x in range(island.ISLAND_WIDTH):
-                    curr_tile: IslandTile = island.get_tile_at(x, y)
-                    if curr_tile.building == fusion_center:
-                        fusion_center_exists = True
-                        break
-
-        if not fusion_center_exists:
+        if not self.player_base.has_building(fusion_center):
             return False
 
         # Checking whether the materials match the materials for the chosen fusion legendary creature or not
@@ -804,7 +1178,7 @@ class Player:
                 return False
 
         # Add the fusion legendary creature to player's legendary creature inventory and remove the fusion materials
-        self.add_legendary_creature(chosen_fusion_legendary_creature)
+        self.add_legendary_creature(chosen_fusion_legendary_creature.clone())
         for material_legendary_creature in material_legendary_creatures:
             self.remove_legendary_creature(material_legendary_creature)
 
@@ -812,56 +1186,51 @@ class Player:
 
     def summon_legendary_creature(self, scroll, summonhenge):
         # type: (Scroll, Summonhenge) -> bool
-        if scroll not in self.item_inventory.get_items():
+        if not self.item_inventory.has_item(scroll):
             return False
 
-        summonhenge_exists: bool = False
-        for island in self.player_base.get_islands():
-            for y in range(island.ISLAND_HEIGHT):
-                for x in range(island.ISLAND_WIDTH):
-                    curr_tile: IslandTile = island.get_tile_at(x, y)
-                    if curr_tile.building == summonhenge:
-                        summonhenge_exists = True
-                        break
-
-        if not summonhenge_exists:
+        if not self.player_base.has_building(summonhenge):
             return False
 
         summoned_legendary_creature_index: int = random.randint(0, len(scroll.get_potential_legendary_creatures()) - 1)
         summoned_legendary_creature: LegendaryCreature = \
             scroll.get_potential_legendary_creatures()[summoned_legendary_creature_index]
         print("You have summoned " + str(summoned_legendary_creature.name) + "!!!")
-        self.add_legendary_creature(summoned_legendary_creature)
+        self.add_legendary_creature(summoned_legendary_creature.clone())
         self.remove_item_from_inventory(scroll)
         return True
 
     def give_item_to_legendary_creature(self, item, legendary_creature):
         # type: (Item, LegendaryCreature) -> bool
-        if item not in self.item_inventory.get_items():
+        if not self.item_inventory.has_item(item):
             return False
 
-        if legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures():
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             return False
 
         if isinstance(item, EXPShard):
             legendary_creature.exp += item.exp_granted
             legendary_creature.level_up()
+            self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
             self.remove_item_from_inventory(item)
             return True
         elif isinstance(item, LevelUpShard):
             legendary_creature.exp = legendary_creature.required_exp
             legendary_creature.level_up()
+            self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
             self.remove_item_from_inventory(item)
             return True
         elif isinstance(item, SkillLevelUpShard):
             skill_index: int = random.randint(0, len(legendary_creature.get_skills()) - 1)
             curr_skill: Skill = legendary_creature.get_skills()[skill_index]
             curr_skill.level_up()
+            legendary_creature.update_passive_skill_effect()
             self.remove_item_from_inventory(item)
             return True
         elif isinstance(item, AwakenShard):
             if item.legendary_creature_name == legendary_creature.name:
                 legendary_creature.awaken()
+                self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
                 self.remove_item_from_inventory(item)
                 return True
             return False
@@ -874,19 +1243,10 @@ class Player:
                 power_up_circle.MAX_MATERIAL_LEGENDARY_CREATURES:
             return False
 
-        if legendary_creature_to_power_up not in self.legendary_creature_inventory.get_legendary_creatures():
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature_to_power_up):
             return False
 
-        power_up_circle_exists: bool = False
-        for island in self.player_base.get_islands():
-            for y in range(island.ISLAND_HEIGHT):
-                for x in range(island.ISLAND_WIDTH):
-                    curr_tile: IslandTile = island.get_tile_at(x, y)
-                    if curr_tile.building == power_up_circle:
-                        power_up_circle_exists = True
-                        break
-
-        if not power_up_circle_exists:
+        if not self.player_base.has_building(power_up_circle):
             return False
 
         power_up_circle.deselect_legendary_creature_to_power_up()
@@ -894,6 +1254,7 @@ class Player:
         power_up_circle.set_material_legendary_creatures(material_legendary_creatures)
         legendary_creature_to_power_up = power_up_circle.execute_power_up()
         assert isinstance(legendary_creature_to_power_up, LegendaryCreature), "Legendary creature power-up failed!"
+        self.legendary_creature_inventory.update_legendary_creature(legendary_creature_to_power_up)
         for legendary_creature in material_legendary_creatures:
             self.remove_legendary_creature(legendary_creature)
 
@@ -906,19 +1267,10 @@ class Player:
                 power_up_circle.MAX_MATERIAL_LEGENDARY_CREATURES:
             return False
 
-        if legendary_creature_to_evolve not in self.legendary_creature_inventory.get_legendary_creatures():
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature_to_evolve):
             return False
 
-        power_up_circle_exists: bool = False
-        for island in self.player_base.get_islands():
-            for y in range(island.ISLAND_HEIGHT):
-                for x in range(island.ISLAND_WIDTH):
-                    curr_tile: IslandTile = island.get_tile_at(x, y)
-                    if curr_tile.building == power_up_circle:
-                        power_up_circle_exists = True
-                        break
-
-        if not power_up_circle_exists:
+        if not self.player_base.has_building(power_up_circle):
             return False
 
         power_up_circle.deselect_legendary_creature_to_power_up()
@@ -926,6 +1278,7 @@ class Player:
         power_up_circle.set_material_legendary_creatures(material_legendary_creatures)
         legendary_creature_to_evolve = power_up_circle.execute_evolution()
         assert isinstance(legendary_creature_to_evolve, LegendaryCreature), "Legendary creature evolution failed!"
+        self.legendary_creature_inventory.update_legendary_creature(legendary_creature_to_evolve)
         for legendary_creature in material_legendary_creatures:
             self.remove_legendary_creature(legendary_creature)
 
@@ -933,57 +1286,43 @@ class Player:
 
     def add_legendary_creature_to_training_area(self, legendary_creature, training_area):
         # type: (LegendaryCreature, TrainingArea) -> bool
-        if legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures() or \
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature) or \
                 legendary_creature in self.battle_team.get_legendary_creatures():
             return False
 
-        training_area_exists: bool = False
-        for island in self.player_base.get_islands():
-            for y in range(island.ISLAND_HEIGHT):
-                for x in range(island.ISLAND_WIDTH):
-                    curr_tile: IslandTile = island.get_tile_at(x, y)
-                    if curr_tile.building == training_area:
-                        training_area_exists = True
-                        break
-
-        if not training_area_exists:
+        if not self.player_base.has_building(training_area):
             return False
 
         if training_area.add_legendary_creature(legendary_creature):
             legendary_creature.exp_per_second += training_area.legendary_creature_exp_per_second
             legendary_creature.placed_in_training_area = True
+            self.__update_idle_legendary_creature(legendary_creature)
+            self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
             return True
         return False
 
     def remove_legendary_creature_from_training_area(self, legendary_creature, training_area):
         # type: (LegendaryCreature, TrainingArea) -> bool
-        if legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures() or \
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature) or \
                 legendary_creature in self.battle_team.get_legendary_creatures():
             return False
 
-        training_area_exists: bool = False
-        for island in self.player_base.get_islands():
-            for y in range(island.ISLAND_HEIGHT):
-                for x in range(island.ISLAND_WIDTH):
-                    curr_tile: IslandTile = island.get_tile_at(x, y)
-                    if curr_tile.building == training_area:
-                        training_area_exists = True
-                        break
-
-        if not training_area_exists:
+        if not self.player_base.has_building(training_area):
             return False
 
         if training_area.remove_legendary_creature(legendary_creature):
             legendary_creature.exp_per_second -= training_area.legendary_creature_exp_per_second
             legendary_creature.placed_in_training_area = False
+            self.__update_idle_legendary_creature(legendary_creature)
+            self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
             return True
         return False
 
-    def add_island_to_player_base(self):
-        # type: () -> bool
+    def add_island_to_player_base(self, width=None, height=None):
+        # type: (int or None, int or None) -> bool
         if self.gold >= self.player_base.island_build_gold_cost:
             self.gold -= self.player_base.island_build_gold_cost
-            self.player_base.add_island()
+            self.player_base.add_island(width, height)
             return True
         return False
 
@@ -1000,98 +1339,45 @@ class Player:
                 if self.gold < curr_building.upgrade_gold_cost or self.gems < curr_building.upgrade_gem_cost:
                     return False
 
-                self.gold -= curr_building.upgrade_gold_cost
-                self.gems -= curr_building.upgrade_gem_cost
-
-                if isinstance(curr_building, Guardstone):
-                    for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                        assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                                  "legendary creatures in player's " \
-                                                                                  "legendary creature inventory."
-                        initial_legendary_creature_defense_percentage_up: mpf = \
-                            curr_building.legendary_creature_defense_percentage_up
-                        curr_building.level_up()
-                        legendary_creature.DEFAULT_DEFENSE_PERCENTAGE_UP += \
-                            (curr_building.legendary_creature_defense_percentage_up -
-                             initial_legendary_creature_defense_percentage_up)
-                        legendary_creature.defense_percentage_up += \
-                            (curr_building.legendary_creature_defense_percentage_up -
-                             initial_legendary_creature_defense_percentage_up)
-                elif isinstance(curr_building, LegendaryCreatureSanctuary):
-                    for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                        assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                                  "legendary creatures in player's " \
-                                                                                  "legendary creature inventory."
-                        initial_legendary_creature_attack_power_percentage_up: mpf = \
-                            curr_building.legendary_creature_attack_power_percentage_up
-                        curr_building.level_up()
-                        legendary_creature.DEFAULT_ATTACK_POWER_PERCENTAGE_UP += \
-                            (curr_building.legendary_creature_attack_power_percentage_up -
-                             initial_legendary_creature_attack_power_percentage_up)
-                        legendary_creature.attack_power_percentage_up += \
-                            (curr_building.legendary_creature_attack_power_percentage_up -
-                             initial_legendary_creature_attack_power_percentage_up)
-                elif isinstance(curr_building, SurvivalAltar):
-                    for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                        assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                                  "legendary creatures in player's " \
-                                                                                  "legendary creature inventory."
-                        initial_legendary_creature_max_hp_percentage_up: mpf = \
-                            curr_building.legendary_creature_max_hp_percentage_up
-                        curr_building.level_up()
-                        legendary_creature.DEFAULT_MAX_HP_PERCENTAGE_UP += \
-                            (curr_building.legendary_creature_max_hp_percentage_up -
-                             initial_legendary_creature_max_hp_percentage_up)
-                        legendary_creature.max_hp_percentage_up += \
-                            (curr_building.legendary_creature_max_hp_percentage_up -
-                             initial_legendary_creature_max_hp_percentage_up)
-                elif isinstance(curr_building, MagicAltar):
-                    for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                        assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                                  "legendary creatures in player's " \
-                                                                                  "legendary creature inventory."
-                        initial_legendary_creature_max_magic_points_percentage_up: mpf = \
-                            curr_building.legendary_creature_max_magic_points_percentage_up
-                        curr_building.level_up()
-                        legendary_creature.DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP += \
-                            (curr_building.legendary_creature_max_magic_points_percentage_up -
-                             initial_legendary_creature_max_magic_points_percentage_up)
-                        legendary_creature.max_magic_points_percentage_up += \
-                            (curr_building.legendary_creature_max_magic_points_percentage_up -
-                             initial_legendary_creature_max_magic_points_percentage_up)
-                elif isinstance(curr_building, BoosterTower):
-                    for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                        assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                                  "legendary creatures in player's " \
-                                                                                  "legendary creature inventory."
-                        initial_legendary_creature_attack_speed_percentage_up: mpf = \
-                            curr_building.legendary_creature_attack_speed_percentage_up
-                        curr_building.level_up()
-                        legendary_creature.DEFAULT_ATTACK_SPEED_PERCENTAGE_UP += \
-                            (curr_building.legendary_creature_attack_speed_percentage_up -
-                             initial_legendary_creature_attack_speed_percentage_up)
-                        legendary_creature.attack_speed_percentage_up += \
-                            (curr_building.legendary_creature_attack_speed_percentage_up -
-                             initial_legendary_creature_attack_speed_percentage_up)
-                elif isinstance(curr_building, PlayerEXPTower):
-                    initial_exp_per_second: mpf = curr_building.exp_per_second
-                    curr_building.level_up()
-                    self.exp_per_second += (curr_building.exp_per_second - initial_exp_per_second)
-                elif isinstance(curr_building, GoldMine):
-                    initial_gold_per_second: mpf = curr_building.gold_per_second
-                    curr_building.level_up()
-                    self.gold_per_second += (curr_building.gold_per_second - initial_gold_per_second)
-                elif isinstance(curr_building, GemMine):
-                    initial_gems_per_second: mpf = curr_building.gem_per_second
-                    curr_building.level_up()
-                    self.gems_per_second += (curr_building.gem_per_second - initial_gems_per_second)
-                else:
-                    curr_building.level_up()
+                self.__level_up_building(corresponding_island, curr_building)
                 return True
 
             return False
         return False
 
+    def __level_up_building(self, corresponding_island, curr_building):
+        # type: (Island, Building) -> None
+        self.gold -= curr_building.upgrade_gold_cost
+        self.gems -= curr_building.upgrade_gem_cost
+        corresponding_island.clear_rendered_tiles()
+
+        if isinstance(curr_building, BuildingBonuses.BUILDING_TYPES):
+            self.building_bonuses.remove_building(curr_building)
+            curr_building.level_up()
+            self.building_bonuses.add_building(curr_building)
+            self.battle_team.recover_all()
+        elif isinstance(curr_building, PlayerEXPTower):
+            initial_exp_per_second: mpf = curr_building.exp_per_second
+            curr_building.level_up()
+            self.exp_per_second += (curr_building.exp_per_second - initial_exp_per_second)
+        elif isinstance(curr_building, GoldMine):
+            initial_gold_per_second: mpf = curr_building.gold_per_second
+            curr_building.level_up()
+            self.gold_per_second += (curr_building.gold_per_second - initial_gold_per_second)
+        elif isinstance(curr_building, GemMine):
+            initial_gems_per_second: mpf = curr_building.gem_per_second
+            curr_building.level_up()
+            self.gems_per_second += (curr_building.gem_per_second - initial_gems_per_second)
+        elif isinstance(curr_building, TrainingArea):
+            initial_legendary_creature_exp_per_second: mpf = \
+                curr_building.legendary_creature_exp_per_second
+            curr_building.level_up()
+            for legendary_creature in curr_building.get_legendary_creatures_placed():
+                legendary_creature.exp_per_second += (curr_building.legendary_creature_exp_per_second -
+                                                      initial_legendary_creature_exp_per_second)
+        else:
+            curr_building.level_up()
+
     def build_at_island_tile(self, island_index, tile_x, tile_y, building):
         # type: (int, int, int, Building) -> bool
         if island_index < 0 or island_index >= len(self.player_base.get_islands()):
@@ -1106,67 +1392,34 @@ class Player:
             if self.gold < building.gold_cost or self.gems < building.gem_cost:
                 return False
 
-            self.gold -= building.gold_cost
-            self.gems -= building.gem_cost
-
-            if isinstance(building, Guardstone):
-                for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                    assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                              "legendary creatures in player's " \
-                                                                              "legendary creature inventory."
-                    legendary_creature.DEFAULT_DEFENSE_PERCENTAGE_UP += \
-                        building.legendary_creature_defense_percentage_up
-                    legendary_creature.defense_percentage_up += building.legendary_creature_defense_percentage_up
-            elif isinstance(building, LegendaryCreatureSanctuary):
-                for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                    assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                              "legendary creatures in player's " \
-                                                                              "legendary creature inventory."
-                    legendary_creature.DEFAULT_ATTACK_POWER_PERCENTAGE_UP += \
-                        building.legendary_creature_attack_power_percentage_up
-                    legendary_creature.attack_power_percentage_up += \
-                        building.legendary_creature_attack_power_percentage_up
-            elif isinstance(building, SurvivalAltar):
-                for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                    assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                              "legendary creatures in player's " \
-                                                                              "legendary creature inventory."
-                    legendary_creature.DEFAULT_MAX_HP_PERCENTAGE_UP += \
-                        building.legendary_creature_max_hp_percentage_up
-                    legendary_creature.max_hp_percentage_up += \
-                        building.legendary_creature_max_hp_percentage_up
-            elif isinstance(building, MagicAltar):
-                for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                    assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                              "legendary creatures in player's " \
-                                                                              "legendary creature inventory."
-                    legendary_creature.DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP += \
-                        building.legendary_creature_max_magic_points_percentage_up
-                    legendary_creature.max_magic_points_percentage_up += \
-                        building.legendary_creature_max_magic_points_percentage_up
-            elif isinstance(building, BoosterTower):
-                for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                    assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                              "legendary creatures in player's " \
-                                                                              "legendary creature inventory."
-                    legendary_creature.DEFAULT_ATTACK_SPEED_PERCENTAGE_UP += \
-                        building.legendary_creature_attack_speed_percentage_up
-                    legendary_creature.attack_speed_percentage_up += \
-                        building.legendary_creature_attack_speed_percentage_up
-            elif isinstance(building, PlayerEXPTower):
-                self.exp_per_second += building.exp_per_second
-            elif isinstance(building, GoldMine):
-                self.gold_per_second += building.gold_per_second
-            elif isinstance(building, GemMine):
-                self.gems_per_second += building.gem_per_second
-            elif isinstance(building, Obstacle):
+            if isinstance(building, Obstacle):
                 # Cannot build obstacle
                 return False
 
-            curr_tile.building = building
+            self.__build(corresponding_island, island_index, tile_x, tile_y, building)
             return True
         return False
 
+    def __build(self, corresponding_island, island_index, tile_x, tile_y, building):
+        # type: (Island, int, int, int, Building) -> None
+        self.gold -= building.gold_cost
+        self.gems -= building.gem_cost
+
+        if isinstance(building, BuildingBonuses.BUILDING_TYPES):
+            self.building_bonuses.add_building(building)
+            self.battle_team.recover_all()
+        elif isinstance(building, PlayerEXPTower):
+            self.exp_per_second += building.exp_per_second
+        elif isinstance(building, GoldMine):
+            self.gold_per_second += building.gold_per_second
+        elif isinstance(building, GemMine):
+            self.gems_per_second += building.gem_per_second
+        elif isinstance(building, TempleOfWishes):
+            self.__schedule_daily_reset(building)
+
+        corresponding_island.set_building_at(tile_x, tile_y, building)
+        self.player_base.add_building_location(building, island_index, tile_x, tile_y)
+
     def remove_building_from_island_tile(self, island_index, tile_x, tile_y):
         # type: (int, int, int) -> bool
         if island_index < 0 or island_index >= len(self.player_base.get_islands()):
@@ -1176,81 +1429,131 @@ class Player:
         if isinstance(corresponding_island.get_tile_at(tile_x, tile_y), IslandTile):
             curr_tile: IslandTile = corresponding_island.get_tile_at(tile_x, tile_y)
             if isinstance(curr_tile.building, Building):
-                curr_building: Building = curr_tile.building
-                self.gold += curr_building.sell_gold_gain
-                self.gems += curr_building.sell_gem_gain
-
-                if isinstance(curr_building, Guardstone):
-                    for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                        assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                                  "legendary creatures in player's " \
-                                                                                  "legendary creature inventory."
-                        legendary_creature.DEFAULT_DEFENSE_PERCENTAGE_UP -= \
-                            curr_building.legendary_creature_defense_percentage_up
-                        legendary_creature.defense_percentage_up -= \
-                            curr_building.legendary_creature_defense_percentage_up
-                elif isinstance(curr_building, LegendaryCreatureSanctuary):
-                    for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                        assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                                  "legendary creatures in player's " \
-                                                                                  "legendary creature inventory."
-                        legendary_creature.DEFAULT_ATTACK_POWER_PERCENTAGE_UP -= \
-                            curr_building.legendary_creature_attack_power_percentage_up
-                        legendary_creature.attack_power_percentage_up -= \
-                            curr_building.legendary_creature_attack_power_percentage_up
-                elif isinstance(curr_building, SurvivalAltar):
-                    for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                        assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                                  "legendary creatures in player's " \
-                                                                                  "legendary creature inventory."
-                        legendary_creature.DEFAULT_MAX_HP_PERCENTAGE_UP -= \
-                            curr_building.legendary_creature_max_hp_percentage_up
-                        legendary_creature.max_hp_percentage_up -= \
-                            curr_building.legendary_creature_max_hp_percentage_up
-                elif isinstance(curr_building, MagicAltar):
-                    for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                        assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                                  "legendary creatures in player's " \
-                                                                                  "legendary creature inventory."
-                        legendary_creature.DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP -= \
-                            curr_building.legendary_creature_max_magic_points_percentage_up
-                        legendary_creature.max_magic_points_percentage_up -= \
-                            curr_building.legendary_creature_max_magic_points_percentage_up
-                elif isinstance(curr_building, BoosterTower):
-                    for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                        assert isinstance(legendary_creature, LegendaryCreature), "Invalid argument in the list of " \
-                                                                                  "legendary creatures in player's " \
-                                                                                  "legendary creature inventory."
-                        legendary_creature.DEFAULT_ATTACK_SPEED_PERCENTAGE_UP -= \
-                            curr_building.legendary_creature_attack_speed_percentage_up
-                        legendary_creature.attack_speed_percentage_up -= \
-                            curr_building.legendary_creature_attack_speed_percentage_up
-                elif isinstance(curr_building, PlayerEXPTower):
-                    self.exp_per_second -= curr_building.exp_per_second
-                elif isinstance(curr_building, GoldMine):
-                    self.gold_per_second -= curr_building.gold_per_second
-                elif isinstance(curr_building, GemMine):
-                    self.gems_per_second -= curr_building.gem_per_second
-                elif isinstance(curr_building, Obstacle):
-                    self.gold += curr_building.remove_gold_gain
-                    self.gems += curr_building.remove_gem_gain
-
-                curr_tile.building = None
+                self.__remove_building(corresponding_island, tile_x, tile_y, curr_tile.building)
                 return True
             return False
         return False
 
+    def __remove_building(self, corresponding_island, tile_x, tile_y, curr_building):
+        # type: (Island, int, int, Building) -> None
+        self.gold += curr_building.sell_gold_gain
+        self.gems += curr_building.sell_gem_gain
+
+        if isinstance(curr_building, BuildingBonuses.BUILDING_TYPES):
+            self.building_bonuses.remove_building(curr_building)
+            self.battle_team.recover_all()
+        elif isinstance(curr_building, PlayerEXPTower):
+            self.exp_per_second -= curr_building.exp_per_second
+        elif isinstance(curr_building, GoldMine):
+            self.gold_per_second -= curr_building.gold_per_second
+        elif isinstance(curr_building, GemMine):
+            self.gems_per_second -= curr_building.gem_per_second
+        elif isinstance(curr_building, TrainingArea):
+            for legendary_creature in curr_building.get_legendary_creatures_placed():
+                legendary_creature.exp_per_second -= curr_building.legendary_creature_exp_per_second
+                legendary_creature.placed_in_training_area = False
+                self.__update_idle_legendary_creature(legendary_creature)
+                self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
+        elif isinstance(curr_building, TempleOfWishes):
+            self.scheduler.cancel(curr_building)
+        elif isinstance(curr_building, Obstacle):
+            self.gold += curr_building.remove_gold_gain
+            self.gems += curr_building.remove_gem_gain
+
+        corresponding_island.remove_building_at(tile_x, tile_y)
+        self.player_base.remove_building_location(curr_building)
+
+    def manage_player_base(self, operations):
+        # type: (list) -> bool
+        """
+        Applying a batch of operations on the tiles of the player's base. The operations are validated in order and
+        their total gold and gem costs are checked once, after which they are applied without checking them again.
+        Either all operations are applied or none of them are, and whether each operation is valid is stored in its
+        'succeeded' attribute.
+        :return: a boolean value indicating whether the operations were applied
+        """
+
+        planned_buildings: dict = {}  # (island index, x, y) -> building planned to be on the tile
+        planned_level_ups: dict = {}  # (island index, x, y) -> number of level ups planned for the building on the tile
+        total_gold_cost: mpf = mpf("0")
+        total_gem_cost: mpf = mpf("0")
+        for operation in operations:
+            assert isinstance(operation, BaseOperation), "Invalid argument in the list of operations."
+            operation.succeeded = False
+            if operation.island_index < 0 or operation.island_index >= len(self.player_base.get_islands()):
+                continue
+
+            curr_tile: IslandTile or None = self.player_base.get_islands()[operation.island_index]. \
+                get_tile_at(operation.tile_x, operation.tile_y)
+            if curr_tile is None:
+                continue
+
+            location: tuple = (operation.island_index, operation.tile_x, operation.tile_y)
+            curr_building: Building or None = planned_buildings[location] if location in planned_buildings.keys() \
+                else curr_tile.building
+            if operation.action == "BUILD":
+                # A building can only be on one tile at a time
+                if curr_building is not None or not isinstance(operation.building, Building) or \
+                        isinstance(operation.building, Obstacle) or \
+                        self.player_base.has_building(operation.building) or \
+                        any(building is operation.building for building in planned_buildings.values()):
+                    continue
+
+                total_gold_cost += operation.building.gold_cost
+                total_gem_cost += operation.building.gem_cost
+                planned_buildings[location] = operation.building
+                planned_level_ups.pop(location, None)
+            elif operation.action == "LEVEL UP":
+                if not isinstance(curr_building, Building) or isinstance(curr_building, Obstacle) or \
+                        not curr_building.can_level_up():
+                    continue
+
+                # The building is levelled up after the level ups planned on the tile so far
+                upgrade_gold_cost, upgrade_gem_cost = \
+                    curr_building.get_upgrade_costs_after(planned_level_ups.get(location, 0))
+                total_gold_cost += upgrade_gold_cost
+                total_gem_cost += upgrade_gem_cost
+                planned_level_ups[location] = planned_level_ups.get(location, 0) + 1
+            elif operation.action == "REMOVE":
+                if not isinstance(curr_building, Building):
+                    continue
+
+                planned_buildings[location] = None
+                planned_level_ups.pop(location, None)
+            else:
+                continue
+
+            operation.succeeded = True
+
+        if not all(operation.succeeded for operation in operations) or self.gold < total_gold_cost or \
+                self.gems < total_gem_cost:
+            return False
+
+        for operation in operations:
+            corresponding_island: Island = self.player_base.get_islands()[operation.island_index]
+            if operation.action == "BUILD":
+                self.__build(corresponding_island, operation.island_index, operation.tile_x, operation.tile_y,
+                             operation.building)
+            elif operation.action == "LEVEL UP":
+                self.__level_up_building(corresponding_island,
+                                         corresponding_island.get_tile_at(operation.tile_x, operation.tile_y).building)
+            else:
+                self.__remove_building(corresponding_island, operation.tile_x, operation.tile_y,
+                                       corresponding_island.get_tile_at(operation.tile_x, operation.tile_y).building)
+
+        return True
+
     def place_rune_on_legendary_creature(self, legendary_creature, rune):
         # type: (LegendaryCreature, Rune) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures() and rune in \
-                self.item_inventory.get_items():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature) and \
+                self.item_inventory.has_item(rune):
             legendary_creature.place_rune(rune)
             return True
         return False
 
     def remove_rune_from_legendary_creature(self, legendary_creature, slot_number):
         # type: (LegendaryCreature, int) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             if slot_number in legendary_creature.get_runes().keys():
                 legendary_creature.remove_rune(slot_number)
                 return True
@@ -1259,22 +1562,57 @@ class Player:
 
     def level_up(self):
         # type: () -> None
-        while self.exp >= self.required_exp:
-            self.level += 1
-            self.required_exp *= mpf("10") ** self.level
+        levels_gained: int = level_ups_for_exp(self.level, self.exp, self.required_exp)
+        self.required_exp *= mpf("10") ** level_up_exp_exponent(self.level, levels_gained)
+        self.level += levels_gained
+
+    def gain_idle_progress(self, seconds):
+        # type: (mpf) -> None
+        """
+        Adding the EXP, gold and gems produced in 'seconds' seconds to the player and its legendary creatures.
+        :return: None
+        """
+
+        self.exp += self.exp_per_second * seconds
+        self.level_up()
+        self.gold += self.gold_per_second * seconds
+        self.gems += self.gems_per_second * seconds
+
+        # Only the legendary creatures gaining EXP in training areas are visited, and each of them levels up in one
+        # step however many levels it gains
+        for legendary_creature in self.__idle_legendary_creatures:
+            legendary_creature.exp += legendary_creature.exp_per_second * seconds
+            levels: int = level_ups_for_exp(legendary_creature.level, legendary_creature.exp,
+                                            legendary_creature.required_exp, legendary_creature.max_level)
+            if levels > 0:
+                legendary_creature.level_up_by(levels)
+                self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
+
+    def catch_up(self, time_now):
+        # type: (datetime) -> None
+        """
+        Catching up on the progress made since the player was last active, including any number of days spent away
+        from the game, and running the periodic events (e.g. resetting temples of wishes) which became due.
+        :return: None
+        """
+
+        seconds: mpf = mpf(str(max(0.0, (time_now - self.last_active_time).total_seconds())))
+        self.last_active_time = time_now
+        self.gain_idle_progress(seconds)
+        self.scheduler.run_due_events(time_now)
 
     def purchase_item(self, item):
         # type: (Item) -> bool
         if self.gold >= item.gold_cost and self.gems >= item.gem_cost:
             self.gold -= item.gold_cost
             self.gems -= item.gem_cost
-            self.add_item_to_inventory(item)
+            self.add_item_to_inventory(item.clone())
             return True
         return False
 
     def sell_item(self, item):
         # type: (Item) -> bool
-        if item in self.item_inventory.get_items():
+        if self.item_inventory.has_item(item):
             if isinstance(item, Rune):
                 if item.already_placed:
                     return False
@@ -1293,23 +1631,88 @@ class Player:
             return True
         return False
 
+    def get_legendary_creatures_with_runes(self, runes):
+        # type: (list) -> dict
+        """
+        Getting the legendary creatures of the player on which the runes in 'runes' are placed, in one pass over the
+        runes of the legendary creatures.
+        :return: a dictionary mapping item IDs of the placed runes to the legendary creatures they are placed on
+        """
+
+        item_ids: list = [rune.item_id for rune in runes if rune.already_placed]
+        if len(item_ids) == 0:
+            return {}
+
+        return {rune.item_id: legendary_creature for legendary_creature in
+                self.legendary_creature_inventory.get_legendary_creatures() for rune in
+                legendary_creature.get_runes().values() if rune.item_id in item_ids}
+
     def level_up_rune(self, rune):
         # type: (Rune) -> bool
-        if rune in self.item_inventory.get_items():
-            if self.gold >= rune.level_up_gold_cost:
-                self.gold -= rune.level_up_gold_cost
-                return rune.level_up()
-            return False
-        else:
-            # Check whether a legendary creature has the rune 'rune' or not
-            for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                if rune in legendary_creature.get_runes().values():
-                    if self.gold >= rune.level_up_gold_cost:
-                        self.gold -= rune.level_up_gold_cost
-                        return legendary_creature.level_up_rune(rune.slot_number)
-                    return False
+        legendary_creature: LegendaryCreature or None = self.get_legendary_creatures_with_runes([rune]).get(
+            rune.item_id)
+        if not self.item_inventory.has_item(rune) and legendary_creature is None:
             return False
 
+        if self.gold >= rune.level_up_gold_cost:
+            self.gold -= rune.level_up_gold_cost
+            if legendary_creature is not None:
+                success: bool = legendary_creature.level_up_rune(rune.slot_number)
+            else:
+                success = rune.level_up()
+
+            if success:
+                self.item_inventory.update_rune(rune)
+
+            return success
+        return False
+
+    def level_up_runes(self, runes, target_level, min_gold=mpf("0")):
+        # type: (list, int, mpf) -> dict
+        """
+        Levelling up the runes in 'runes' until each of them reaches level 'target_level' or until the player would
+        have less than 'min_gold' gold left. The stats of the legendary creatures having any of the runes are derived
+        again once all the attempts are made.
+        :return: a dictionary summarising the attempts made
+        """
+
+        legendary_creatures: dict = self.get_legendary_creatures_with_runes(runes)
+        summary: dict = {
+            "ATTEMPTS": 0,
+            "LEVEL UPS": 0,
+            "GOLD SPENT": mpf("0"),
+            "RUNES AT TARGET LEVEL": [],
+            "LEGENDARY CREATURES UPDATED": []
+        }
+        for rune in runes:
+            if not self.item_inventory.has_item(rune) and rune.item_id not in legendary_creatures.keys():
+                continue
+
+            levels_gained: int = 0
+            while rune.level < target_level and self.gold - rune.level_up_gold_cost >= min_gold:
+                self.gold -= rune.level_up_gold_cost
+                summary["ATTEMPTS"] += 1
+                summary["GOLD SPENT"] += rune.level_up_gold_cost
+                if rune.level_up():
+                    levels_gained += 1
+
+            if levels_gained > 0:
+                summary["LEVEL UPS"] += levels_gained
+                self.item_inventory.update_rune(rune)
+                legendary_creature: LegendaryCreature or None = legendary_creatures.get(rune.item_id)
+                if legendary_creature is not None and legendary_creature not in \
+                        summary["LEGENDARY CREATURES UPDATED"]:
+                    summary["LEGENDARY CREATURES UPDATED"].append(legendary_creature)
+
+            if rune.level >= target_level:
+                summary["RUNES AT TARGET LEVEL"].append(rune)
+
+        for legendary_creature in summary["LEGENDARY CREATURES UPDATED"]:
+            legendary_creature.update_rune_bonuses()
+            legendary_creature.restore()
+
+        return summary
+
     def add_item_to_inventory(self, item):
         # type: (Item) -> None
         self.item_inventory.add_item(item)
@@ -1317,36 +1720,45 @@ class Player:
     def remove_item_from_inventory(self, item):
         # type: (Item) -> bool
         if isinstance(item, Rune):
-            for legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
-                if item in legendary_creature.get_runes().values():
-                    return False
+            if item.already_placed:
+                return False
 
         return self.item_inventory.remove_item(item)
 
     def add_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> None
         self.legendary_creature_inventory.add_legendary_creature(legendary_creature)
+        legendary_creature.building_bonuses = self.building_bonuses
+        legendary_creature.restore()
 
     def remove_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
         if legendary_creature in self.battle_team.get_legendary_creatures():
             return False
+
+        if legendary_creature in self.__idle_legendary_creatures:
+            self.__idle_legendary_creatures.remove(legendary_creature)
         return self.legendary_creature_inventory.remove_legendary_creature(legendary_creature)
 
     def add_legendary_creature_to_team(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             if self.battle_team.add_legendary_creature(legendary_creature):
                 legendary_creature.corresponding_team = self.battle_team
+                legendary_creature.restore()
+                self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
                 return True
             return False
         return False
 
     def remove_legendary_creature_from_team(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             legendary_creature.corresponding_team = Team()
-            return self.battle_team.remove_legendary_creature(legendary_creature)
+            if self.battle_team.remove_legendary_creature(legendary_creature):
+                self.legendary_creature_inventory.update_legendary_creature(legendary_creature)
+                return True
+            return False
         return False
 
     def clone(self):
@@ -1378,9 +1790,24 @@ class LegendaryCreatureInventory:
     This class contains attributes of an inventory containing legendary creatures.
     """
 
+    POTENTIAL_PLACEMENTS: list = ["NONE", "TEAM", "TRAINING AREA"]
+    SORT_KEYS: list = ["ACQUIRED", "NAME", "ELEMENT", "RATING", "LEVEL"]
+    DEFAULT_PAGE_SIZE: int = 10
+
     def __init__(self):
         # type: () -> None
-        self.__legendary_creatures: list = []  # initial value
+        self.__legendary_creatures: dict = {}  # legendary creature ID -> legendary creature
+
+        # Indexes of the legendary creatures by name, element, rating, level and placement:
+        # value -> {legendary creature ID -> legendary creature}
+        self.__legendary_creatures_by_name: dict = {}
+        self.__legendary_creatures_by_element: dict = {}
+        self.__legendary_creatures_by_rating: dict = {}
+        self.__legendary_creatures_by_level: dict = {}
+        self.__legendary_creatures_by_placement: dict = {}
+        self.__indexed_values: dict = {}  # legendary creature ID -> values the legendary creature is indexed under
+        self.__acquisition_numbers: dict = {}  # legendary creature ID -> order in which it was added
+        self.__next_acquisition_number: int = 0  # initial value
 
     def __str__(self):
         return '%s(%s)' % (
@@ -1388,20 +1815,170 @@ class LegendaryCreatureInventory:
             ', '.join('%s=%s' % item for item in vars(self).items())
         )
 
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        if isinstance(state["_LegendaryCreatureInventory__legendary_creatures"], list):
+            # Inventories saved by older versions of the game keep a list of legendary creatures without IDs, in which
+            # a legendary creature summoned or wished for more than once appears once for each time. The copies are
+            # neither in a team nor in a training area.
+            self.__init__()
+            for legendary_creature in state["_LegendaryCreatureInventory__legendary_creatures"]:
+                if "legendary_creature_id" not in vars(legendary_creature).keys():
+                    legendary_creature.legendary_creature_id = str(uuid.uuid1())  # generating random ID
+
+                if self.has_legendary_creature(legendary_creature):
+                    legendary_creature = legendary_creature.clone()
+                    legendary_creature.corresponding_team = Team()
+                    legendary_creature.placed_in_training_area = False
+                    legendary_creature.exp_per_second = mpf("0")
+
+                self.add_legendary_creature(legendary_creature)
+        else:
+            self.__dict__.update(state)
+
+    @staticmethod
+    def get_placement(legendary_creature):
+        # type: (LegendaryCreature) -> str
+        if legendary_creature.placed_in_training_area:
+            return "TRAINING AREA"
+        elif legendary_creature in legendary_creature.corresponding_team.get_legendary_creatures():
+            return "TEAM"
+        return "NONE"
+
+    def __get_indexes(self):
+        # type: () -> list
+        return [self.__legendary_creatures_by_name, self.__legendary_creatures_by_element,
+                self.__legendary_creatures_by_rating, self.__legendary_creatures_by_level,
+                self.__legendary_creatures_by_placement]
+
+    def __index_legendary_creature(self, legendary_creature):
+        # type: (LegendaryCreature) -> None
+        values: list = [legendary_creature.name, legendary_creature.element, legendary_creature.rating,
+                        legendary_creature.level, self.get_placement(legendary_creature)]
+        for index, value in zip(self.__get_indexes(), values):
+            if value not in index.keys():
+                index[value] = {}
+
+            index[value][legendary_creature.legendary_creature_id] = legendary_creature
+
+        self.__indexed_values[legendary_creature.legendary_creature_id] = values
+
+    def __unindex_legendary_creature(self, legendary_creature):
+        # type: (LegendaryCreature) -> None
+        values: list = self.__indexed_values.pop(legendary_creature.legendary_creature_id)
+        for index, value in zip(self.__get_indexes(), values):
+            del index[value][legendary_creature.legendary_creature_id]
+            if len(index[value]) == 0:
+                del index[value]
+
     def add_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> None
-        self.__legendary_creatures.append(legendary_creature)
+        if legendary_creature.legendary_creature_id in self.__legendary_creatures.keys():
+            return
+
+        self.__legendary_creatures[legendary_creature.legendary_creature_id] = legendary_creature
+        self.__acquisition_numbers[legendary_creature.legendary_creature_id] = self.__next_acquisition_number
+        self.__next_acquisition_number += 1
+        self.__index_legendary_creature(legendary_creature)
 
     def remove_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.__legendary_creatures:
-            self.__legendary_creatures.remove(legendary_creature)
+        if self.has_legendary_creature(legendary_creature):
+            del self.__legendary_creatures[legendary_creature.legendary_creature_id]
+            del self.__acquisition_numbers[legendary_creature.legendary_creature_id]
+            self.__unindex_legendary_creature(legendary_creature)
             return True
         return False
 
+    def update_legendary_creature(self, legendary_creature):
+        # type: (LegendaryCreature) -> bool
+        """
+        Moving a legendary creature in the inventory to the right index entries after its name, rating, level or
+        placement has changed.
+        :return: a boolean value indicating whether the legendary creature is in the inventory or not
+        """
+
+        if self.has_legendary_creature(legendary_creature):
+            self.__unindex_legendary_creature(legendary_creature)
+            self.__index_legendary_creature(legendary_creature)
+            return True
+        return False
+
+    def has_legendary_creature(self, legendary_creature):
+        # type: (LegendaryCreature) -> bool
+        return isinstance(legendary_creature, LegendaryCreature) and \
+            self.__legendary_creatures.get(legendary_creature.legendary_creature_id) is legendary_creature
+
+    def get_legendary_creature(self, legendary_creature_id):
+        # type: (str) -> LegendaryCreature or None
+        return self.__legendary_creatures.get(legendary_creature_id)
+
     def get_legendary_creatures(self):
         # type: () -> list
-        return self.__legendary_creatures
+        return list(self.__legendary_creatures.values())
+
+    def get_number_of_legendary_creatures(self):
+        # type: () -> int
+        return len(self.__legendary_creatures)
+
+    def find_legendary_creatures(self, name=None, element=None, rating=None, level=None, placement=None):
+        # type: (str or None, Element or str or None, int or None, int or None, str or None) -> list
+        """
+        Getting the legendary creatures in the inventory with the given name, element, rating, level and placement.
+        Criteria which are None are not checked.
+        :return: a list of legendary creatures in the order they were obtained
+        """
+
+        element = Element.get_code(element, element)
+
+        legendary_creatures: dict = self.__legendary_creatures
+        for index, value in zip(self.__get_indexes(), [name, element, rating, level, placement]):
+            if value is not None:
+                matching_legendary_creatures: dict = index.get(value, {})
+                smaller, larger = (matching_legendary_creatures, legendary_creatures) if \
+                    len(matching_legendary_creatures) < len(legendary_creatures) else \
+                    (legendary_creatures, matching_legendary_creatures)
+                legendary_creatures = {legendary_creature_id: legendary_creature for legendary_creature_id,
+                                       legendary_creature in smaller.items() if legendary_creature_id in
+                                       larger.keys()}
+
+        if legendary_creatures is self.__legendary_creatures:
+            return list(legendary_creatures.values())
+
+        # The index entries are not kept in the order the legendary creatures were obtained
+        return sorted(legendary_creatures.values(), key=lambda legendary_creature:
+                      self.__acquisition_numbers[legendary_creature.legendary_creature_id])
+
+    def get_number_of_pages(self, page_size=DEFAULT_PAGE_SIZE, name=None, element=None, rating=None, level=None,
+                            placement=None):
+        # type: (int, str or None, str or None, int or None, int or None, str or None) -> int
+        num_legendary_creatures: int = len(self.find_legendary_creatures(name, element, rating, level, placement))
+        return max(1, -(-num_legendary_creatures // page_size))
+
+    def get_page(self, page_number, page_size=DEFAULT_PAGE_SIZE, sort_by="ACQUIRED", descending=False, name=None,
+                 element=None, rating=None, level=None, placement=None):
+        # type: (int, int, str, bool, str or None, str or None, int or None, int or None, str or None) -> list
+        """
+        Getting one page of the legendary creatures matching the given criteria, sorted by 'sort_by'. Pages are
+        numbered from 1 and only the legendary creatures up to the end of the requested page are sorted.
+        :return: a list of at most 'page_size' legendary creatures
+        """
+
+        if page_number < 1 or page_size < 1:
+            return []
+
+        legendary_creatures: list = self.find_legendary_creatures(name, element, rating, level, placement)
+        end: int = page_number * page_size
+        if sort_by == "ACQUIRED" or sort_by not in self.SORT_KEYS:
+            if descending:
+                legendary_creatures.reverse()
+            return legendary_creatures[end - page_size:end]
+
+        sort_attribute: str = sort_by.lower()
+        key = lambda legendary_creature: getattr(legendary_creature, sort_attribute)
+        top_legendary_creatures: list = heapq.nlargest(end, legendary_creatures, key) if descending else \
+            heapq.nsmallest(end, legendary_creatures, key)
+        return top_legendary_creatures[end - page_size:end]
 
     def clone(self):
         # type: () -> LegendaryCreatureInventory
@@ -1415,7 +1992,19 @@ class ItemInventory:
 
     def __init__(self):
         # type: () -> None
-        self.__items: list = []  # initial value
+        self.__items: dict = {}  # item ID -> item
+        self.__items_by_type: dict = {}  # item class -> {item ID -> item}
+
+        # Indexes of the runes by slot number, set name and main stat: value -> {item ID -> rune}
+        self.__runes_by_slot_number: dict = {}
+        self.__runes_by_set_name: dict = {}
+        self.__runes_by_main_stat: dict = {}
+
+        # Stat vectors of the runes (see Rune.STAT_VECTOR_COLUMNS) stored one after another in a flat array, so that
+        # the values of a column can be read as one slice instead of from the stat increase of each rune
+        self.__rune_stat_vectors: array = array('d')
+        self.__rune_row_item_ids: list = []  # row -> item ID of the rune
+        self.__rune_rows: dict = {}  # item ID -> row
 
     def __str__(self):
         return '%s(%s)' % (
@@ -1423,20 +2012,166 @@ class ItemInventory:
             ', '.join('%s=%s' % item for item in vars(self).items())
         )
 
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        if isinstance(state["_ItemInventory__items"], list):
+            # Inventories saved by older versions of the game keep a list of items without item IDs, in which an item
+            # bought more than once appears once for each purchase
+            self.__init__()
+            for item in state["_ItemInventory__items"]:
+                if "item_id" not in vars(item).keys():
+                    item.item_id = str(uuid.uuid1())  # generating random item ID
+
+                if self.has_item(item):
+                    item = item.clone()
+
+                self.add_item(item)
+        else:
+            self.__dict__.update(state)
+
+    def __get_rune_indexes(self, rune):
+        # type: (Rune) -> list
+        return [(self.__runes_by_slot_number, rune.slot_number), (self.__runes_by_set_name, rune.set_name),
+                (self.__runes_by_main_stat, rune.main_stat)]
+
     def add_item(self, item):
         # type: (Item) -> None
-        self.__items.append(item)
+        if item.item_id in self.__items.keys():
+            return
+
+        self.__items[item.item_id] = item
+        if type(item) not in self.__items_by_type.keys():
+            self.__items_by_type[type(item)] = {}
+
+        self.__items_by_type[type(item)][item.item_id] = item
+        if isinstance(item, Rune):
+            for index, value in self.__get_rune_indexes(item):
+                if value not in index.keys():
+                    index[value] = {}
+
+                index[value][item.item_id] = item
+
+            self.__rune_rows[item.item_id] = len(self.__rune_row_item_ids)
+            self.__rune_row_item_ids.append(item.item_id)
+            self.__rune_stat_vectors.extend(item.get_stat_vector())
 
     def remove_item(self, item):
         # type: (Item) -> bool
-        if item in self.__items:
-            self.__items.remove(item)
+        if self.has_item(item):
+            del self.__items[item.item_id]
+            del self.__items_by_type[type(item)][item.item_id]
+            if isinstance(item, Rune):
+                for index, value in self.__get_rune_indexes(item):
+                    del index[value][item.item_id]
+
+                # Moving the stat vector of the last rune into the row of the removed rune
+                width: int = len(Rune.STAT_VECTOR_COLUMNS)
+                row: int = self.__rune_rows.pop(item.item_id)
+                last_item_id: str = self.__rune_row_item_ids.pop()
+                if last_item_id != item.item_id:
+                    self.__rune_row_item_ids[row] = last_item_id
+                    self.__rune_rows[last_item_id] = row
+                    self.__rune_stat_vectors[row * width:(row + 1) * width] = self.__rune_stat_vectors[-width:]
+
+                del self.__rune_stat_vectors[-width:]
+
             return True
         return False
 
+    def update_rune(self, rune):
+        # type: (Rune) -> bool
+        """
+        Updating the stat vector of 'rune' after its stats have changed (e.g., after levelling it up).
+        :return: True if the rune is in the inventory, False otherwise
+        """
+
+        if not self.has_item(rune) or not isinstance(rune, Rune):
+            return False
+
+        width: int = len(Rune.STAT_VECTOR_COLUMNS)
+        row: int = self.__rune_rows[rune.item_id]
+        self.__rune_stat_vectors[row * width:(row + 1) * width] = array('d', rune.get_stat_vector())
+        return True
+
+    def __get_rune_column(self, column_name):
+        # type: (str) -> array
+        width: int = len(Rune.STAT_VECTOR_COLUMNS)
+        return self.__rune_stat_vectors[Rune.STAT_VECTOR_COLUMNS.index(column_name)::width]
+
+    def score_runes(self, weights):
+        # type: (dict) -> list
+        """
+        Scoring every rune in the inventory by the weighted sum of its stat vector, where 'weights' maps column
+        names in Rune.STAT_VECTOR_COLUMNS to their weights. Columns not in 'weights' have a weight of zero, and the
+        scores are added up one weighted column at a time.
+        :return: a list of tuples of the runes and their scores, from the highest score to the lowest
+        """
+
+        scores: list = [0.0] * len(self.__rune_row_item_ids)
+        for column_name, weight in weights.items():
+            if column_name in Rune.STAT_VECTOR_COLUMNS and weight != 0:
+                scores = [score + float(weight) * value for score, value in
+                          zip(scores, self.__get_rune_column(column_name))]
+
+        return sorted([(self.__items[item_id], score) for item_id, score in zip(self.__rune_row_item_ids, scores)],
+                      key=lambda rune_score: rune_score[1], reverse=True)
+
+    def filter_runes(self, min_values):
+        # type: (dict) -> list
+        """
+        Getting the runes in the inventory whose values in the columns of Rune.STAT_VECTOR_COLUMNS are at least
+        those in 'min_values', checking one column at a time.
+        :return: a list of runes
+        """
+
+        rows: list = list(range(len(self.__rune_row_item_ids)))
+        for column_name, min_value in min_values.items():
+            if column_name in Rune.STAT_VECTOR_COLUMNS:
+                column: array = self.__get_rune_column(column_name)
+                rows = [row for row in rows if column[row] >= min_value]
+
+        return [self.__items[self.__rune_row_item_ids[row]] for row in rows]
+
+    def has_item(self, item):
+        # type: (Item) -> bool
+        return isinstance(item, Item) and self.__items.get(item.item_id) is item
+
+    def get_item(self, item_id):
+        # type: (str) -> Item or None
+        return self.__items.get(item_id)
+
     def get_items(self):
         # type: () -> list
-        return self.__items
+        return list(self.__items.values())
+
+    def get_items_of_type(self, item_type):
+        # type: (type) -> list
+        return [item for curr_type in self.__items_by_type.keys() if issubclass(curr_type, item_type) for item in
+                self.__items_by_type[curr_type].values()]
+
+    def get_items_not_of_type(self, item_type):
+        # type: (type) -> list
+        return [item for curr_type in self.__items_by_type.keys() if not issubclass(curr_type, item_type) for item in
+                self.__items_by_type[curr_type].values()]
+
+    def get_runes(self, slot_number=None, set_name=None, main_stat=None):
+        # type: (int or None, str or None, str or None) -> list
+        """
+        Getting the runes in the inventory with the given slot number, set name and main stat. Criteria which are
+        None are not checked.
+        :return: a list of runes
+        """
+
+        runes: dict = self.__items_by_type.get(Rune, {})
+        for index, value in [(self.__runes_by_slot_number, slot_number), (self.__runes_by_set_name, set_name),
+                             (self.__runes_by_main_stat, main_stat)]:
+            if value is not None:
+                matching_runes: dict = index.get(value, {})
+                smaller, larger = (matching_runes, runes) if len(matching_runes) < len(runes) else \
+                    (runes, matching_runes)
+                runes = {item_id: rune for item_id, rune in smaller.items() if item_id in larger.keys()}
+
+        return list(runes.values())
 
     def clone(self):
         # type: () -> ItemInventory
@@ -1450,6 +2185,7 @@ class Item:
 
     def __init__(self, name, description, gold_cost, gem_cost):
         # type: (str, str, mpf, mpf) -> None
+        self.item_id: str = str(uuid.uuid1())  # generating random item ID
         self.name: str = name
         self.description: str = description
         self.gold_cost: mpf = gold_cost
@@ -1465,7 +2201,10 @@ class Item:
 
     def clone(self):
         # type: () -> Item
-        return copy.deepcopy(self)
+        # The copy is a different item, so it gets its own item ID
+        new_item: Item = copy.deepcopy(self)
+        new_item.item_id = str(uuid.uuid1())
+        return new_item
 
 
 class Rune(Item):
@@ -1483,6 +2222,31 @@ class Rune(Item):
                                   "ACC"]
     MAX_SUB_STATS: int = 4
 
+    # Main stat -> attribute of the stat increase of a rune which the main stat increases
+    MAIN_STAT_ATTRIBUTES: dict = {"HP": "max_hp_up", "HP%": "max_hp_percentage_up", "MP": "max_magic_points_up",
+                                  "MP%": "max_magic_points_percentage_up", "ATK": "attack_up",
+                                  "ATK%": "attack_percentage_up", "DEF": "defense_up",
+                                  "DEF%": "defense_percentage_up", "SPD": "attack_speed_up", "CR": "crit_rate_up",
+                                  "CD": "crit_damage_up", "RES": "resistance_up", "ACC": "accuracy_up"}
+
+    # Main stat -> function giving the initial increase in the main stat of a rune with the given rating
+    MAIN_STAT_BASE_VALUES: dict = {"HP": lambda rating: mpf("10") ** (6 * rating),
+                                   "HP%": lambda rating: mpf(2 * rating),
+                                   "MP": lambda rating: mpf("10") ** (6 * rating),
+                                   "MP%": lambda rating: mpf(2 * rating),
+                                   "ATK": lambda rating: mpf("10") ** (5 * rating),
+                                   "ATK%": lambda rating: mpf(2 * rating),
+                                   "DEF": lambda rating: mpf("10") ** (5 * rating),
+                                   "DEF%": lambda rating: mpf(2 * rating),
+                                   "SPD": lambda rating: mpf(2 * rating),
+                                   "CR": lambda rating: mpf(0.01 * rating),
+                                   "CD": lambda rating: mpf(0.05 * rating),
+                                   "RES": lambda rating: mpf(0.01 * rating),
+                                   "ACC": lambda rating: mpf(0.01 * rating)}
+
+    # Columns of the stat vector of a rune: the stat increases of all main stats and the set of the rune (one-hot)
+    STAT_VECTOR_COLUMNS: list = POTENTIAL_MAIN_STATS + POTENTIAL_SET_NAMES
+
     def __init__(self, name, description, gold_cost, gem_cost, rating, slot_number, set_name, main_stat):
         # type: (str, str, mpf, mpf, int, int, str, str) -> None
         Item.__init__(self, name, description, gold_cost, gem_cost)
@@ -1512,35 +2276,18 @@ class Rune(Item):
         # type: () -> list
         return self.__sub_stats
 
+    def get_stat_vector(self):
+        # type: () -> list
+        return [float(getattr(self.stat_increase, self.MAIN_STAT_ATTRIBUTES[main_stat])) for main_stat in
+                self.POTENTIAL_MAIN_STATS] + [1.0 if set_name == self.set_name else 0.0 for set_name in
+                                              self.POTENTIAL_SET_NAMES]
+
     def __get_stat_increase(self):
         # type: () -> StatIncrease
-        if self.main_stat == "HP":
-            return StatIncrease(max_hp_up=mpf("10") ** (6 * self.rating))
-        elif self.main_stat == "HP%":
-            return StatIncrease(max_hp_percentage_up=mpf(2 * self.rating))
-        elif self.main_stat == "MP":
-            return StatIncrease(max_magic_points_up=mpf("10") ** (6 * self.rating))
-        elif self.main_stat == "MP%":
-            return StatIncrease(max_magic_points_percentage_up=mpf(2 * self.rating))
-        elif self.main_stat == "ATK":
-            return StatIncrease(attack_up=mpf("10") ** (5 * self.rating))
-        elif self.main_stat == "ATK%":
-            return StatIncrease(attack_percentage_up=mpf(2 * self.rating))
-        elif self.main_stat == "DEF":
-            return StatIncrease(defense_up=mpf("10") ** (5 * self.rating))
-        elif self.main_stat == "DEF%":
-            return StatIncrease(defense_percentage_up=mpf(2 * self.rating))
-        elif self.main_stat == "SPD":
-            return StatIncrease(attack_speed_up=mpf(2 * self.rating))
-        elif self.main_stat == "CR":
-            return StatIncrease(crit_rate_up=mpf(0.01 * self.rating))
-        elif self.main_stat == "CD":
-            return StatIncrease(crit_damage_up=mpf(0.05 * self.rating))
-        elif self.main_stat == "RES":
-            return StatIncrease(resistance_up=mpf(0.01 * self.rating))
-        elif self.main_stat == "ACC":
-            return StatIncrease(accuracy_up=mpf(0.01 * self.rating))
-        return StatIncrease()
+        if self.main_stat not in self.MAIN_STAT_ATTRIBUTES.keys():
+            return StatIncrease()
+        return StatIncrease(**{self.MAIN_STAT_ATTRIBUTES[self.main_stat]:
+                               self.MAIN_STAT_BASE_VALUES[self.main_stat](self.rating)})
 
     def __get_set_effect(self):
         # type: () -> SetEffect
@@ -1590,32 +2337,10 @@ class Rune(Item):
         self.level_up_success_rate *= mpf("0.95")
 
         # Increase main stat attribute
-        if self.main_stat == "HP":
-            self.stat_increase.max_hp_up += mpf("10") ** (6 * self.rating + self.level)
-        elif self.main_stat == "HP%":
-            self.stat_increase.max_hp_percentage_up += self.rating
-        elif self.main_stat == "MP":
-            self.stat_increase.max_magic_points_up += mpf("10") ** (6 * self.rating + self.level)
-        elif self.main_stat == "MP%":
-            self.stat_increase.max_magic_points_percentage_up += self.rating
-        elif self.main_stat == "ATK":
-            self.stat_increase.attack_up += mpf("10") ** (5 * self.rating + 1)
-        elif self.main_stat == "ATK%":
-            self.stat_increase.attack_percentage_up += self.rating
-        elif self.main_stat == "DEF":
-            self.stat_increase.defense_up += mpf("10") ** (5 * self.rating + 1)
-        elif self.main_stat == "DEF%":
-            self.stat_increase.defense_percentage_up += self.rating
-        elif self.main_stat == "SPD":
-            self.stat_increase.attack_speed_up += 2 * self.rating
-        elif self.main_stat == "CR":
-            self.stat_increase.crit_rate_up += 0.01 * self.rating
-        elif self.main_stat == "CD":
-            self.stat_increase.crit_damage_up += 0.05 * self.rating
-        elif self.main_stat == "RES":
-            self.stat_increase.resistance_up += 0.01 * self.rating
-        elif self.main_stat == "ACC":
-            self.stat_increase.accuracy_up += 0.01 * self.rating
+        if self.main_stat in self.MAIN_STAT_ATTRIBUTES.keys():
+            attribute: str = self.MAIN_STAT_ATTRIBUTES[self.main_stat]
+            setattr(self.stat_increase, attribute, getattr(self.stat_increase, attribute) +
+                    self.get_stat_increment(self.main_stat, self.level))
         else:
             print("Cannot increase rune main stat: " + str(self.main_stat) + "\n")
 
@@ -1629,34 +2354,29 @@ class Rune(Item):
         self.increase_substat_attribute(new_sub_stat)
         return True
 
+    def get_stat_increment(self, stat_name, level):
+        # type: (str, int) -> mpf
+        # The increase in the stat 'stat_name' of the rune when levelling it up to level 'level'
+        if stat_name == "HP" or stat_name == "MP":
+            return mpf("10") ** (6 * self.rating + level)
+        elif stat_name == "ATK" or stat_name == "DEF":
+            return mpf("10") ** (5 * self.rating + 1)
+        elif stat_name in ["HP%", "MP%", "ATK%", "DEF%"]:
+            return mpf(self.rating)
+        elif stat_name == "SPD":
+            return mpf(2 * self.rating)
+        elif stat_name == "CD":
+            return mpf(0.05 * self.rating)
+        elif stat_name in ["CR", "RES", "ACC"]:
+            return mpf(0.01 * self.rating)
+        return mpf("0")
+
     def increase_substat_attribute(self, substat_name):
         # type: (str) -> None
-        if substat_name == "HP":
-            self.stat_increase.max_hp_up += mpf("10") ** (6 * self.rating + self.level)
-        elif substat_name == "HP%":
-            self.stat_increase.max_hp_percentage_up += self.rating
-        elif substat_name == "MP":
-            self.stat_increase.max_magic_points_up += mpf("10") ** (6 * self.rating + self.level)
-        elif substat_name == "MP%":
-            self.stat_increase.max_magic_points_percentage_up += self.rating
-        elif substat_name == "ATK":
-            self.stat_increase.attack_up += mpf("10") ** (5 * self.rating + 1)
-        elif substat_name == "ATK%":
-            self.stat_increase.attack_percentage_up += self.rating
-        elif substat_name == "DEF":
-            self.stat_increase.defense_up += mpf("10") ** (5 * self.rating + 1)
-        elif substat_name == "DEF%":
-            self.stat_increase.defense_percentage_up += self.rating
-        elif substat_name == "SPD":
-            self.stat_increase.attack_speed_up += 2 * self.rating
-        elif substat_name == "CR":
-            self.stat_increase.crit_rate_up += 0.01 * self.rating
-        elif substat_name == "CD":
-            self.stat_increase.crit_damage_up += 0.05 * self.rating
-        elif substat_name == "RES":
-            self.stat_increase.resistance_up += 0.01 * self.rating
-        elif substat_name == "ACC":
-            self.stat_increase.accuracy_up += 0.01 * self.rating
+        if substat_name in self.MAIN_STAT_ATTRIBUTES.keys():
+            attribute: str = self.MAIN_STAT_ATTRIBUTES[substat_name]
+            setattr(self.stat_increase, attribute, getattr(self.stat_increase, attribute) +
+                    self.get_stat_increment(substat_name, self.level))
         else:
             print("No such sub-stat: " + str(substat_name) + "\n")
 
@@ -1735,6 +2455,322 @@ class StatIncrease:
         return copy.deepcopy(self)
 
 
+class RuneOptimizer:
+    """
+    This class contains attributes of an optimizer choosing which of a player's runes to place on a legendary creature.
+    """
+
+    OBJECTIVES: list = ["EFFECTIVE HP", "DAMAGE"]
+
+    # Objective -> attributes of the stat increases of runes which can change the value of the objective
+    RELEVANT_STAT_INCREASES: dict = {
+        "EFFECTIVE HP": ["max_hp_up", "max_hp_percentage_up", "defense_up", "defense_percentage_up"],
+        "DAMAGE": ["max_hp_up", "max_hp_percentage_up", "max_magic_points_up", "max_magic_points_percentage_up",
+                   "attack_up", "attack_percentage_up", "defense_up", "defense_percentage_up", "attack_speed_up",
+                   "crit_rate_up", "crit_damage_up"]
+    }
+
+    def __init__(self):
+        # type: () -> None
+        self.loadouts_searched: int = 0  # number of full and partial rune loadouts searched in the last optimisation
+
+    def __str__(self):
+        return '%s(%s)' % (
+            type(self).__name__,
+            ', '.join('%s=%s' % item for item in vars(self).items())
+        )
+
+    @staticmethod
+    def get_effective_hp(legendary_creature):
+        # type: (LegendaryCreature) -> mpf
+        # The HP of the legendary creature scaled by the damage reduction its defense gives against attacks
+        return legendary_creature.max_hp * (1 + legendary_creature.max_hp_percentage_up / 100) * \
+            (mpf("1e8") + 3.5 * legendary_creature.defense) / mpf("1e8")
+
+    @staticmethod
+    def get_damage(legendary_creature, active_skill, target):
+        # type: (LegendaryCreature, ActiveSkill, LegendaryCreature) -> mpf
+        # The damage of 'active_skill' on 'target' before the defense of the target, including critical hits on average
+        crit_chance: mpf = min(max(legendary_creature.crit_rate + legendary_creature.crit_rate_up - target.crit_resist
+                                   - target.crit_resist_up, LegendaryCreature.MIN_CRIT_RATE), mpf("1"))
+        return active_skill.damage_multiplier.calculate_raw_damage_without_enemy_defense_invincibility_shield(
+            legendary_creature, target) * (1 + crit_chance * (legendary_creature.crit_damage +
+                                                              legendary_creature.crit_damage_up - 1))
+
+    def get_objective_value(self, legendary_creature, objective, active_skill=None, target=None):
+        # type: (LegendaryCreature, str, ActiveSkill or None, LegendaryCreature or None) -> mpf
+        if objective == "EFFECTIVE HP":
+            return self.get_effective_hp(legendary_creature)
+        elif objective == "DAMAGE" and active_skill is not None:
+            return self.get_damage(legendary_creature, active_skill,
+                                   legendary_creature if target is None else target)
+        return mpf("0")
+
+    @staticmethod
+    def prune_dominated_runes(runes, attributes):
+        # type: (list, list) -> list
+        """
+        Removing the runes for which another rune of the same set gives at least as much of every attribute in
+        'attributes', as they can be swapped for that rune without making a loadout worse.
+        :return: a list of the remaining runes
+        """
+
+        remaining_runes: list = []  # initial value
+        for rune in sorted(runes, key=lambda curr_rune: [getattr(curr_rune.stat_increase, attribute) for attribute in
+                                                         attributes], reverse=True):
+            if not any(other_rune.set_name == rune.set_name and
+                       all(getattr(other_rune.stat_increase, attribute) >= getattr(rune.stat_increase, attribute)
+                           for attribute in attributes) for other_rune in remaining_runes):
+                remaining_runes.append(rune)
+
+        return remaining_runes
+
+    def search(self, legendary_creature, objective, active_skill, target, min_attack_speed, slots, first_runes):
+        # type: (LegendaryCreature, str, ActiveSkill or None, LegendaryCreature or None, mpf, list, list) -> tuple
+        """
+        Searching the rune loadouts taking one rune from each list of runes in 'slots' and their first rune from
+        'first_runes', by branch and bound. The bound of a partial loadout is the value of the objective with the
+        largest stat increases of the remaining slots and the largest set effect for every set the remaining slots
+        could still complete.
+        :return: a tuple of the best value found (None if no loadout reaches 'min_attack_speed'), the item IDs of the
+        runes in the best loadout and the number of loadouts searched
+        """
+
+        stat_attributes: list = list(vars(StatIncrease()).keys())
+        set_attributes: list = list(vars(SetEffect()).keys())
+        max_remaining_stats: list = [[mpf("0")] * len(stat_attributes) for i in range(len(slots) + 1)]
+        for i in range(len(slots) - 1, -1, -1):
+            max_remaining_stats[i] = [max_remaining_stats[i + 1][j] + max(getattr(rune.stat_increase, attribute) for
+                                                                          rune in slots[i]) for j, attribute in
+                                      enumerate(stat_attributes)]
+
+        max_set_effect: list = [max(getattr(rune.set_effect, attribute) for runes in slots for rune in runes) for
+                                attribute in set_attributes]
+        best_value: mpf or None = None
+        best_item_ids: list = []
+        loadouts_searched: int = 0
+        chosen_runes: list = []
+        set_counts: dict = {}  # set name -> [number of chosen runes of the set, a chosen rune of the set]
+
+        def evaluate(stat_values, set_values):
+            # type: (list, list) -> tuple
+            preview: LegendaryCreature = legendary_creature.preview_stats(
+                StatIncrease(**dict(zip(stat_attributes, stat_values))),
+                SetEffect(**dict(zip(set_attributes, set_values))))
+            return self.get_objective_value(preview, objective, active_skill, target), preview.attack_speed
+
+        def search_slot(index, stat_values):
+            # type: (int, list) -> None
+            nonlocal best_value, best_item_ids, loadouts_searched
+            loadouts_searched += 1
+            complete_sets: int = sum(count // rune.set_size for count, rune in set_counts.values())
+            set_values: list = [sum(count // rune.set_size * getattr(rune.set_effect, attribute) for count, rune in
+                                    set_counts.values()) for attribute in set_attributes]
+            if index == len(slots):
+                value, attack_speed = evaluate(stat_values, set_values)
+                if attack_speed >= min_attack_speed and (best_value is None or value > best_value):
+                    best_value = value
+                    best_item_ids = [rune.item_id for rune in chosen_runes]
+                return
+
+            # Every set completed from here on needs at least one more rune and two runes in total
+            runes_left: int = len(slots) - index
+            extra_sets: int = max(0, min(runes_left, (len(chosen_runes) + runes_left) // 2 - complete_sets))
+            bound, max_attack_speed = evaluate([a + b for a, b in zip(stat_values, max_remaining_stats[index])],
+                                               [a + extra_sets * b for a, b in zip(set_values, max_set_effect)])
+            if max_attack_speed < min_attack_speed or (best_value is not None and bound <= best_value):
+                return
+
+            for rune in first_runes if index == 0 else slots[index]:
+                chosen_runes.append(rune)
+                set_counts[rune.set_name] = [set_counts.get(rune.set_name, [0])[0] + 1, rune]
+                search_slot(index + 1, [value + getattr(rune.stat_increase, attribute) for value, attribute in
+                                        zip(stat_values, stat_attributes)])
+                chosen_runes.pop()
+                set_counts[rune.set_name][0] -= 1
+                if set_counts[rune.set_name][0] == 0:
+                    del set_counts[rune.set_name]
+
+        search_slot(0, [mpf("0")] * len(stat_attributes))
+        return best_value, best_item_ids, loadouts_searched
+
+    def optimize(self, player, legendary_creature, objective, active_skill=None, target=None,
+                 min_attack_speed=mpf("0"), workers=1):
+        # type: (Player, LegendaryCreature, str, ActiveSkill or None, LegendaryCreature or None, mpf, int) -> dict
+        """
+        Finding the runes in the player's item inventory to place on 'legendary_creature' which maximise 'objective'
+        while keeping the attack speed of the legendary creature at least 'min_attack_speed'. Runes placed on other
+        legendary creatures are not used. The search is split across 'workers' worker processes.
+        :return: a dictionary mapping slot numbers to the runes to be placed, empty if there is no such loadout
+        """
+
+        if objective not in self.OBJECTIVES or (objective == "DAMAGE" and active_skill is None):
+            return {}
+
+        target = legendary_creature if target is None else target
+        attributes: list = self.RELEVANT_STAT_INCREASES[objective] + \
+            (["attack_speed_up"] if min_attack_speed > 0 else [])
+        slots: list = []  # initial value
+        for slot_number in range(Rune.MIN_SLOT_NUMBER, Rune.MAX_SLOT_NUMBER + 1):
+            runes: list = self.prune_dominated_runes([rune for rune in player.item_inventory.get_runes(slot_number) if
+                                                      not rune.already_placed or
+                                                      legendary_creature.get_runes().get(slot_number) is rune],
+                                                     attributes)
+            if len(runes) > 0:
+                # Trying the runes which are best on their own first to find good loadouts early
+                slots.append(sorted(runes, key=lambda rune: self.get_objective_value(
+                    legendary_creature.preview_stats(rune.stat_increase, SetEffect()), objective, active_skill,
+                    target), reverse=True))
+
+        if len(slots) == 0:
+            return {}
+
+        # The slot with the most runes is split between the workers
+        slots.sort(key=len, reverse=True)
+        if workers <= 1:
+            results: list = [self.search(legendary_creature, objective, active_skill, target, min_attack_speed, slots,
+                                         slots[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures: list = [executor.submit(self.search, legendary_creature, objective, active_skill, target,
+                                                 min_attack_speed, slots, slots[0][i::workers]) for i in
+                                 range(min(workers, len(slots[0])))]
+                results = [future.result() for future in futures]
+
+        self.loadouts_searched = sum(result[2] for result in results)
+        results = [result for result in results if result[0] is not None]
+        if len(results) == 0:
+            return {}
+
+        best_item_ids: list = max(results, key=lambda result: result[0])[1]
+        return {rune.slot_number: rune for rune in [player.item_inventory.get_item(item_id) for item_id in
+                                                    best_item_ids]}
+
+    def clone(self):
+        # type: () -> RuneOptimizer
+        return copy.deepcopy(self)
+
+
+class RuneUpgradeCalculator:
+    """
+    This class contains attributes of a calculator of the expected costs and outcomes of levelling up runes.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.__sub_stat_distributions: dict = {}  # (main stat, sub-stats, number of level ups) -> distribution
+
+    def __str__(self):
+        return '%s(%s)' % (
+            type(self).__name__,
+            ', '.join('%s=%s' % item for item in vars(self).items())
+        )
+
+    @staticmethod
+    def get_expected_gold_cost(rune, target_level):
+        # type: (Rune, int) -> mpf
+        """
+        Getting the expected gold spent on levelling up 'rune' until it reaches level 'target_level'. The gold cost of
+        each attempt is paid whether it succeeds or not, so each level costs its gold cost divided by its success rate.
+        :return: the expected gold cost
+        """
+
+        expected_gold_cost: mpf = mpf("0")
+        gold_cost: mpf = rune.level_up_gold_cost
+        success_rate: mpf = rune.level_up_success_rate
+        for level in range(rune.level, target_level):
+            if success_rate <= 0:
+                return mpf("inf")
+
+            expected_gold_cost += gold_cost / min(success_rate, mpf("1"))
+            gold_cost *= mpf("10") ** (level + 1 + rune.rating)
+            success_rate *= mpf("0.95")
+
+        return expected_gold_cost
+
+    def get_sub_stat_distribution(self, rune, target_level):
+        # type: (Rune, int) -> dict
+        """
+        Getting the probabilities of the sub-stats 'rune' can have once it reaches level 'target_level', by dynamic
+        programming over the levels and the sub-stats gained so far.
+        :return: a dictionary mapping tuples of sub-stats (in the order of Rune.POTENTIAL_MAIN_STATS) to their
+        probabilities
+        """
+
+        # The order in which the sub-stats were gained does not change later level ups
+        key: tuple = (rune.main_stat, tuple(sorted(rune.get_sub_stats(), key=Rune.POTENTIAL_MAIN_STATS.index)),
+                      max(0, target_level - rune.level))
+        if key not in self.__sub_stat_distributions.keys():
+            roll_probability: mpf = mpf("1") / len(Rune.POTENTIAL_MAIN_STATS)
+            distribution: dict = {key[1]: mpf("1")}
+            for i in range(key[2]):
+                new_distribution: dict = {}
+                for sub_stats, probability in distribution.items():
+                    for new_sub_stat in Rune.POTENTIAL_MAIN_STATS:
+                        new_sub_stats: tuple = tuple(sorted(sub_stats + (new_sub_stat,),
+                                                            key=Rune.POTENTIAL_MAIN_STATS.index)) if \
+                            new_sub_stat not in sub_stats and len(sub_stats) < Rune.MAX_SUB_STATS and \
+                            new_sub_stat != rune.main_stat else sub_stats
+                        new_distribution[new_sub_stats] = new_distribution.get(new_sub_stats, mpf("0")) + \
+                            probability * roll_probability
+
+                distribution = new_distribution
+
+            self.__sub_stat_distributions[key] = distribution
+
+        return self.__sub_stat_distributions[key]
+
+    @staticmethod
+    def get_stat_distributions(rune, target_level):
+        # type: (Rune, int) -> dict
+        """
+        Getting the probabilities of the values of each stat increase of 'rune' once it reaches level 'target_level'.
+        Every level up increases the main stat and one stat chosen uniformly at random from all potential main stats.
+        :return: a dictionary mapping attributes of the stat increase of the rune to dictionaries mapping their final
+        values to their probabilities
+        """
+
+        roll_probability: mpf = mpf("1") / len(Rune.POTENTIAL_MAIN_STATS)
+        stat_distributions: dict = {}
+        for stat_name, attribute in Rune.MAIN_STAT_ATTRIBUTES.items():
+            distribution: dict = {getattr(rune.stat_increase, attribute): mpf("1")}
+            for level in range(rune.level + 1, target_level + 1):
+                increment: mpf = rune.get_stat_increment(stat_name, level)
+                main_stat_increment: mpf = increment if stat_name == rune.main_stat else mpf("0")
+                new_distribution: dict = {}
+                for value, probability in distribution.items():
+                    for rolled_increment, roll_chance in [(increment, roll_probability),
+                                                          (mpf("0"), 1 - roll_probability)]:
+                        new_value: mpf = value + main_stat_increment + rolled_increment
+                        new_distribution[new_value] = new_distribution.get(new_value, mpf("0")) + \
+                            probability * roll_chance
+
+                distribution = new_distribution
+
+            stat_distributions[attribute] = distribution
+
+        return stat_distributions
+
+    def calculate(self, rune, target_level):
+        # type: (Rune, int) -> dict
+        """
+        Calculating the expected gold cost and the outcomes of levelling up 'rune' until it reaches level
+        'target_level'.
+        :return: a dictionary with the expected gold cost, the distribution of the sub-stats and the distributions of
+        the stat increases of the rune
+        """
+
+        return {
+            "EXPECTED GOLD COST": self.get_expected_gold_cost(rune, target_level),
+            "SUB-STATS": self.get_sub_stat_distribution(rune, target_level),
+            "STATS": self.get_stat_distributions(rune, target_level)
+        }
+
+    def clone(self):
+        # type: () -> RuneUpgradeCalculator
+        return copy.deepcopy(self)
+
+
 class AwakenShard(Item):
     """
     This class contains attributes of a shard used to awaken a legendary creature.
@@ -1940,8 +2976,9 @@ class LegendaryCreature:
     def __init__(self, name, element, rating, legendary_creature_type, max_hp, max_magic_points, attack_power,
                  defense, attack_speed, skills, awaken_bonus):
         # type: (str, str, int, str, mpf, mpf, mpf, mpf, mpf, list, AwakenBonus) -> None
+        self.legendary_creature_id: str = str(uuid.uuid1())  # generating random legendary creature ID
         self.name: str = name
-        self.element: str = element if element in self.POTENTIAL_ELEMENTS else self.POTENTIAL_ELEMENTS[0]
+        self.element: Element = Element.get_code(element, Element.FIRE)
         self.legendary_creature_type: str = legendary_creature_type if legendary_creature_type in \
                                                                        self.POTENTIAL_TYPES else self.POTENTIAL_TYPES[0]
         self.rating: int = rating if self.MIN_RATING <= rating <= self.MAX_RATING else self.MIN_RATING
@@ -1950,7 +2987,17 @@ class LegendaryCreature:
         self.exp: mpf = mpf("0")
         self.required_exp: mpf = mpf("1e6")
         self.exp_per_second: mpf = mpf("0")
-        self.curr_hp: mpf = max_hp
+        self.base_max_hp: mpf = max_hp
+        self.base_max_magic_points: mpf = max_magic_points
+        self.base_attack_power: mpf = attack_power
+        self.base_defense: mpf = defense
+        self.base_attack_speed: mpf = attack_speed
+        self.base_crit_rate: mpf = self.MIN_CRIT_RATE
+        self.base_crit_damage: mpf = self.MIN_CRIT_DAMAGE
+        self.base_resistance: mpf = self.MIN_RESISTANCE
+        self.base_accuracy: mpf = self.MIN_ACCURACY
+        self.__battle: Battle or None = None
+        self.__curr_hp: mpf = max_hp
         self.max_hp: mpf = max_hp
         self.curr_magic_points: mpf = max_magic_points
         self.max_magic_points: mpf = max_magic_points
@@ -1971,8 +3018,15 @@ class LegendaryCreature:
         self.__beneficial_effects: list = []
         self.__harmful_effects: list = []
         self.__skills: list = skills
+        self.__passive_skill_effect: PassiveSkillEffect = PassiveSkillEffect()  # sum of the passive skill effects
+        self.update_passive_skill_effect()
         self.awaken_bonus: AwakenBonus = awaken_bonus
         self.__runes: dict = {}  # initial value
+        self.__rune_set_counts: dict = {}  # set name -> number of runes of the set placed
+        self.__active_rune_sets: dict = {}  # set name -> number of complete sets whose set effect is active
+        self.__rune_stat_increase: StatIncrease = StatIncrease()  # total stat increase of the runes placed
+        self.__rune_set_effect: SetEffect = SetEffect()  # total set effect of the complete rune sets
+        self.building_bonuses: BuildingBonuses = BuildingBonuses()  # bonuses from the buildings of the owner's base
         self.max_hp_percentage_up: mpf = self.DEFAULT_MAX_HP_PERCENTAGE_UP
         self.max_magic_points_percentage_up: mpf = self.DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP
         self.attack_power_percentage_up: mpf = self.DEFAULT_ATTACK_POWER_PERCENTAGE_UP
@@ -2009,32 +3063,91 @@ class LegendaryCreature:
         self.placed_in_training_area: bool = False
         self.corresponding_team: Team = Team()
 
-    def __str__(self):
-        return '%s(%s)' % (
-            type(self).__name__,
-            ', '.join('%s=%s' % item for item in vars(self).items())
-        )
+    def __str__(self):
+        # The battle the legendary creature is in is left out, as the battle refers back to the legendary creature
+        return '%s(%s)' % (
+            type(self).__name__,
+            ', '.join('%s=%s' % item for item in vars(self).items() if item[0] != "_LegendaryCreature__battle")
+        )
+
+    def __getstate__(self):
+        # type: () -> dict
+        # The battle the legendary creature is in is not saved with it
+        state: dict = self.__dict__.copy()
+        state["_LegendaryCreature__battle"] = None
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        if "curr_hp" in state.keys():
+            # Older versions of the game kept the HP of legendary creatures in a plain attribute
+            state["_LegendaryCreature__curr_hp"] = state.pop("curr_hp")
+            state["_LegendaryCreature__battle"] = None
+
+        load_saved_codes(self, state, {"element": Element})
+        if "_LegendaryCreature__passive_skill_effect" not in state.keys():
+            self.update_passive_skill_effect()
+
+        if "_LegendaryCreature__rune_stat_increase" not in state.keys():
+            self.__load_saved_runes()
+
+        if "building_bonuses" not in state.keys():
+            self.building_bonuses = BuildingBonuses()
+
+    def __load_saved_runes(self):
+        # type: () -> None
+        """
+        Counting the rune sets of a legendary creature saved by an older version of the game, which did not keep its
+        base stats, and working out its base stats by taking the bonuses of its runes out of its saved stats.
+        :return: None
+        """
+
+        self.__rune_set_counts = {}
+        self.__active_rune_sets = {}
+        for rune in self.__runes.values():
+            self.__rune_set_counts[rune.set_name] = self.__rune_set_counts.get(rune.set_name, 0) + 1
+
+        for rune in self.__runes.values():
+            if self.__rune_set_counts[rune.set_name] >= rune.set_size:
+                self.__active_rune_sets[rune.set_name] = self.__rune_set_counts[rune.set_name] // rune.set_size
+
+            rune.set_effect_is_active = rune.set_name in self.__active_rune_sets.keys()
+
+        stat_increase, set_effect = self.__get_rune_bonuses()
+        self.base_max_hp = (self.max_hp - stat_increase.max_hp_up) / \
+            (1 + (stat_increase.max_hp_percentage_up + set_effect.max_hp_percentage_up) / 100)
+        self.base_max_magic_points = (self.max_magic_points - stat_increase.max_magic_points_up) / \
+            (1 + (stat_increase.max_magic_points_percentage_up + set_effect.max_magic_points_percentage_up) / 100)
+        self.base_attack_power = (self.attack_power - stat_increase.attack_up) / \
+            (1 + (stat_increase.attack_percentage_up + set_effect.attack_percentage_up) / 100)
+        self.base_defense = (self.defense - stat_increase.defense_up) / \
+            (1 + (stat_increase.defense_percentage_up + set_effect.defense_percentage_up) / 100)
+        self.base_attack_speed = (self.attack_speed - stat_increase.attack_speed_up) / \
+            (1 + set_effect.attack_speed_percentage_up / 100)
+        self.base_crit_rate = self.crit_rate - stat_increase.crit_rate_up - set_effect.crit_rate_up
+        self.base_crit_damage = self.crit_damage - stat_increase.crit_damage_up - set_effect.crit_damage_up
+        self.base_resistance = self.resistance - stat_increase.resistance_up - set_effect.resistance_up
+        self.base_accuracy = self.accuracy - stat_increase.accuracy_up - set_effect.accuracy_up
+        self.__rune_stat_increase = stat_increase
+        self.__rune_set_effect = set_effect
+        self.update_stats()
 
     def awaken(self):
         # type: () -> bool
         if not self.has_awakened:
             self.name = "AWAKENED " + str(self.name)
-            self.max_hp *= 1 + self.awaken_bonus.max_hp_percentage_up / 100
-            self.max_magic_points *= 1 + self.awaken_bonus.max_magic_points_percentage_up / 100
-            self.attack_power *= 1 + self.awaken_bonus.attack_power_percentage_up / 100
-            self.defense *= 1 + self.awaken_bonus.defense_percentage_up / 100
-            self.attack_speed += self.awaken_bonus.attack_speed_up
-            self.crit_rate += self.awaken_bonus.crit_rate_up
-            self.crit_damage += self.awaken_bonus.crit_damage_up
-            self.resistance += self.awaken_bonus.resistance_up
-            if self.resistance > self.MAX_RESISTANCE:
-                self.resistance = self.MAX_RESISTANCE
-
-            self.accuracy += self.awaken_bonus.accuracy_up
-            if self.accuracy > self.MAX_ACCURACY:
-                self.accuracy = self.MAX_ACCURACY
-
+            self.base_max_hp *= 1 + self.awaken_bonus.max_hp_percentage_up / 100
+            self.base_max_magic_points *= 1 + self.awaken_bonus.max_magic_points_percentage_up / 100
+            self.base_attack_power *= 1 + self.awaken_bonus.attack_power_percentage_up / 100
+            self.base_defense *= 1 + self.awaken_bonus.defense_percentage_up / 100
+            self.base_attack_speed += self.awaken_bonus.attack_speed_up
+            self.base_crit_rate += self.awaken_bonus.crit_rate_up
+            self.base_crit_damage += self.awaken_bonus.crit_damage_up
+            self.base_resistance += self.awaken_bonus.resistance_up
+            self.base_accuracy += self.awaken_bonus.accuracy_up
             self.__skills.append(self.awaken_bonus.new_skill_gained)
+            self.update_passive_skill_effect()
+            self.update_stats()
             self.restore()
             self.has_awakened = True
             return True
@@ -2048,34 +3161,31 @@ class LegendaryCreature:
             self.max_level = 10 * triangular(self.rating) if self.rating < self.MAX_RATING else float('inf')
             self.exp = mpf("0")
             self.required_exp = mpf("1e6")
-            temp_runes: dict = self.__runes
-            for slot_number in self.__runes.keys():
-                self.remove_rune(slot_number)
-
-            self.attack_power *= triangular(self.level) + 1
-            self.max_hp *= triangular(self.level) + 1
-            self.max_magic_points *= triangular(self.level) + 1
-            self.defense *= triangular(self.level) + 1
-            self.attack_speed += 3
-            for rune in temp_runes.values():
-                self.place_rune(rune)
-
+            self.base_attack_power *= triangular(self.level) + 1
+            self.base_max_hp *= triangular(self.level) + 1
+            self.base_max_magic_points *= triangular(self.level) + 1
+            self.base_defense *= triangular(self.level) + 1
+            self.base_attack_speed += 3
+            self.update_stats()
             self.restore()
             return True
         return False
 
     def restore(self):
         # type: () -> None
+        self.glancing_hit_chance = self.MIN_GLANCING_HIT_CHANCE
+        self.max_hp_percentage_up = self.DEFAULT_MAX_HP_PERCENTAGE_UP + self.building_bonuses.max_hp_percentage_up
+        self.max_magic_points_percentage_up = self.DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP + \
+            self.building_bonuses.max_magic_points_percentage_up
         self.curr_hp = self.max_hp * (1 + self.max_hp_percentage_up / 100)
         self.curr_magic_points = self.max_magic_points * (1 + self.max_magic_points_percentage_up / 100)
-        self.glancing_hit_chance = self.MIN_GLANCING_HIT_CHANCE
-        self.max_hp_percentage_up = self.DEFAULT_MAX_HP_PERCENTAGE_UP
-        self.max_magic_points_percentage_up = self.DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP
-        self.attack_power_percentage_up = self.DEFAULT_ATTACK_POWER_PERCENTAGE_UP
+        self.attack_power_percentage_up = self.DEFAULT_ATTACK_POWER_PERCENTAGE_UP + \
+            self.building_bonuses.attack_power_percentage_up
         self.attack_power_percentage_down = mpf("0")
-        self.attack_speed_percentage_up = self.DEFAULT_ATTACK_SPEED_PERCENTAGE_UP
+        self.attack_speed_percentage_up = self.DEFAULT_ATTACK_SPEED_PERCENTAGE_UP + \
+            self.building_bonuses.attack_speed_percentage_up
         self.attack_speed_percentage_down = mpf("0")
-        self.defense_percentage_up = self.DEFAULT_DEFENSE_PERCENTAGE_UP
+        self.defense_percentage_up = self.DEFAULT_DEFENSE_PERCENTAGE_UP + self.building_bonuses.defense_percentage_up
         self.defense_percentage_down = mpf("0")
         self.crit_rate_up = mpf("0")
         self.crit_damage_up = self.DEFAULT_CRIT_DAMAGE_UP
@@ -2105,18 +3215,16 @@ class LegendaryCreature:
     def use_passive_skills(self):
         # type: () -> bool
         if self.can_use_passive_skills and not self.passive_skills_activated:
-            for skill in self.__skills:
-                if isinstance(skill, PassiveSkill):
-                    self.max_hp_percentage_up += skill.passive_skill_effect.max_hp_percentage_up
-                    self.max_magic_points_percentage_up += skill.passive_skill_effect.max_magic_points_percentage_up
-                    self.attack_power_percentage_up += skill.passive_skill_effect.attack_power_percentage_up
-                    self.defense_percentage_up += skill.passive_skill_effect.defense_percentage_up
-                    self.attack_speed_percentage_up += skill.passive_skill_effect.attack_speed_percentage_up
-                    self.crit_rate_up += skill.passive_skill_effect.crit_rate_up
-                    self.crit_damage_up += skill.passive_skill_effect.crit_damage_up
-                    self.resistance_up += skill.passive_skill_effect.resistance_up
-                    self.accuracy_up += skill.passive_skill_effect.accuracy_up
-                    self.extra_turn_chance_up += skill.passive_skill_effect.extra_turn_chance_up
+            self.max_hp_percentage_up += self.__passive_skill_effect.max_hp_percentage_up
+            self.max_magic_points_percentage_up += self.__passive_skill_effect.max_magic_points_percentage_up
+            self.attack_power_percentage_up += self.__passive_skill_effect.attack_power_percentage_up
+            self.defense_percentage_up += self.__passive_skill_effect.defense_percentage_up
+            self.attack_speed_percentage_up += self.__passive_skill_effect.attack_speed_percentage_up
+            self.crit_rate_up += self.__passive_skill_effect.crit_rate_up
+            self.crit_damage_up += self.__passive_skill_effect.crit_damage_up
+            self.resistance_up += self.__passive_skill_effect.resistance_up
+            self.accuracy_up += self.__passive_skill_effect.accuracy_up
+            self.extra_turn_chance_up += self.__passive_skill_effect.extra_turn_chance_up
 
             self.passive_skills_activated = True
             return True
@@ -2125,41 +3233,58 @@ class LegendaryCreature:
     def deactivate_passive_skills(self):
         # type: () -> bool
         if self.passive_skills_activated:
-            for skill in self.__skills:
-                if isinstance(skill, PassiveSkill):
-                    self.max_hp_percentage_up -= skill.passive_skill_effect.max_hp_percentage_up
-                    self.max_magic_points_percentage_up -= skill.passive_skill_effect.max_magic_points_percentage_up
-                    self.attack_power_percentage_up -= skill.passive_skill_effect.attack_power_percentage_up
-                    self.defense_percentage_up -= skill.passive_skill_effect.defense_percentage_up
-                    self.attack_speed_percentage_up -= skill.passive_skill_effect.attack_speed_percentage_up
-                    self.crit_rate_up -= skill.passive_skill_effect.crit_rate_up
-                    self.crit_damage_up -= skill.passive_skill_effect.crit_damage_up
-                    self.resistance_up -= skill.passive_skill_effect.resistance_up
-                    self.accuracy_up -= skill.passive_skill_effect.accuracy_up
-                    self.extra_turn_chance_up -= skill.passive_skill_effect.extra_turn_chance_up
+            self.max_hp_percentage_up -= self.__passive_skill_effect.max_hp_percentage_up
+            self.max_magic_points_percentage_up -= self.__passive_skill_effect.max_magic_points_percentage_up
+            self.attack_power_percentage_up -= self.__passive_skill_effect.attack_power_percentage_up
+            self.defense_percentage_up -= self.__passive_skill_effect.defense_percentage_up
+            self.attack_speed_percentage_up -= self.__passive_skill_effect.attack_speed_percentage_up
+            self.crit_rate_up -= self.__passive_skill_effect.crit_rate_up
+            self.crit_damage_up -= self.__passive_skill_effect.crit_damage_up
+            self.resistance_up -= self.__passive_skill_effect.resistance_up
+            self.accuracy_up -= self.__passive_skill_effect.accuracy_up
+            self.extra_turn_chance_up -= self.__passive_skill_effect.extra_turn_chance_up
 
             self.passive_skills_activated = False
             return True
         return False
 
+    def get_leader_skill_effect(self):
+        # type: () -> LeaderSkillEffect
+        """
+        Adding up the effects of the leader skills of the legendary creature into one leader skill effect.
+        :return: the leader skill effect given to the team led by the legendary creature
+        """
+
+        leader_skill_effect: LeaderSkillEffect = LeaderSkillEffect()
+        for skill in self.__skills:
+            if isinstance(skill, LeaderSkill):
+                for attribute, value in vars(skill.leader_skill_effect).items():
+                    setattr(leader_skill_effect, attribute, getattr(leader_skill_effect, attribute) + value)
+
+        return leader_skill_effect
+
+    def apply_leader_skill_effect(self, leader_skill_effect, sign=1):
+        # type: (LeaderSkillEffect, int) -> None
+        """
+        Adding the modifiers in 'leader_skill_effect' to the legendary creature ('sign' = 1) or taking them away
+        ('sign' = -1). The current HP and magic points keep the same fraction of their maximum values.
+        :return: None
+        """
+
+        old_hp_multiplier: mpf = 1 + self.max_hp_percentage_up / 100
+        old_magic_points_multiplier: mpf = 1 + self.max_magic_points_percentage_up / 100
+        for attribute, value in vars(leader_skill_effect).items():
+            setattr(self, attribute, getattr(self, attribute) + sign * value)
+
+        self.curr_hp *= (1 + self.max_hp_percentage_up / 100) / old_hp_multiplier
+        self.curr_magic_points *= (1 + self.max_magic_points_percentage_up / 100) / old_magic_points_multiplier
+
     def use_leader_skills(self):
         # type: () -> bool
         if not self.leader_skills_activated:
+            leader_skill_effect: LeaderSkillEffect = self.get_leader_skill_effect()
             for legendary_creature in self.corresponding_team.get_legendary_creatures():
-                for skill in self.__skills:
-                    if isinstance(skill, LeaderSkill):
-                        legendary_creature.max_hp_percentage_up += skill.leader_skill_effect.max_hp_percentage_up
-                        legendary_creature.max_magic_points_percentage_up += \
-                            skill.leader_skill_effect.max_magic_points_percentage_up
-                        legendary_creature.attack_power_percentage_up += \
-                            skill.leader_skill_effect.attack_power_percentage_up
-                        legendary_creature.defense_percentage_up += skill.leader_skill_effect.defense_percentage_up
-                        legendary_creature.attack_speed_percentage_up += \
-                            skill.leader_skill_effect.attack_speed_percentage_up
-                        legendary_creature.crit_rate_up += skill.leader_skill_effect.crit_rate_up
-                        legendary_creature.crit_damage_up += skill.leader_skill_effect.crit_damage_up
-                        legendary_creature.resistance_up += skill.leader_skill_effect.resistance_up
-                        legendary_creature.accuracy_up += skill.leader_skill_effect.accuracy_up
+                legendary_creature.apply_leader_skill_effect(leader_skill_effect)
 
             self.leader_skills_activated = True
             return True
@@ -2168,29 +3293,35 @@ class LegendaryCreature:
     def deactivate_leader_skills(self):
         # type: () -> bool
         if self.leader_skills_activated:
+            leader_skill_effect: LeaderSkillEffect = self.get_leader_skill_effect()
             for legendary_creature in self.corresponding_team.get_legendary_creatures():
-                for skill in self.__skills:
-                    if isinstance(skill, LeaderSkill):
-                        legendary_creature.max_hp_percentage_up -= skill.leader_skill_effect.max_hp_percentage_up
-                        legendary_creature.max_magic_points_percentage_up -= \
-                            skill.leader_skill_effect.max_magic_points_percentage_up
-                        legendary_creature.attack_power_percentage_up -= \
-                            skill.leader_skill_effect.attack_power_percentage_up
-                        legendary_creature.defense_percentage_up -= skill.leader_skill_effect.defense_percentage_up
-                        legendary_creature.attack_speed_percentage_up -= \
-                            skill.leader_skill_effect.attack_speed_percentage_up
-                        legendary_creature.crit_rate_up -= skill.leader_skill_effect.crit_rate_up
-                        legendary_creature.crit_damage_up -= skill.leader_skill_effect.crit_damage_up
-                        legendary_creature.resistance_up -= skill.leader_skill_effect.resistance_up
-                        legendary_creature.accuracy_up -= skill.leader_skill_effect.accuracy_up
+                legendary_creature.apply_leader_skill_effect(leader_skill_effect, -1)
 
             self.leader_skills_activated = False
             return True
         return False
 
+    @property
+    def curr_hp(self):
+        # type: () -> mpf
+        return self.__curr_hp
+
+    @curr_hp.setter
+    def curr_hp(self, curr_hp):
+        # type: (mpf) -> None
+        # The battle the legendary creature is in counts the legendary creatures alive as soon as their HP crosses zero
+        was_alive: bool = self.get_is_alive()
+        self.__curr_hp = curr_hp
+        if self.__battle is not None and self.get_is_alive() != was_alive:
+            self.__battle.update_alive_count(self)
+
+    def set_battle(self, battle):
+        # type: (Battle or None) -> None
+        self.__battle = battle
+
     def get_is_alive(self):
         # type: () -> bool
-        return self.curr_hp > 0
+        return self.__curr_hp > 0
 
     def recover_magic_points(self):
         # type: () -> None
@@ -2331,11 +3462,145 @@ class LegendaryCreature:
     def add_skill(self, skill):
         # type: (Skill) -> None
         self.__skills.append(skill)
+        self.update_passive_skill_effect()
+
+    def get_passive_skill_effect(self):
+        # type: () -> PassiveSkillEffect
+        return self.__passive_skill_effect
+
+    def update_passive_skill_effect(self):
+        # type: () -> None
+        """
+        Adding up the effects of the passive skills of the legendary creature into one passive skill effect. This is
+        to be called whenever the skills of the legendary creature change.
+        :return: None
+        """
+
+        beneficial_effects_to_allies: list = []
+        harmful_effects_to_enemies: list = []
+        passive_skill_effect: PassiveSkillEffect = PassiveSkillEffect(
+            beneficial_effects_to_allies=beneficial_effects_to_allies,
+            harmful_effects_to_enemies=harmful_effects_to_enemies)
+        for skill in self.__skills:
+            if isinstance(skill, PassiveSkill):
+                for attribute, value in vars(skill.passive_skill_effect).items():
+                    if not attribute.startswith("_"):
+                        setattr(passive_skill_effect, attribute, getattr(passive_skill_effect, attribute) + value)
+
+                if isinstance(skill.passive_skill_effect.get_beneficial_effects_to_allies(), list):
+                    beneficial_effects_to_allies.extend(skill.passive_skill_effect.get_beneficial_effects_to_allies())
+
+                if isinstance(skill.passive_skill_effect.get_harmful_effects_to_enemies(), list):
+                    harmful_effects_to_enemies.extend(skill.passive_skill_effect.get_harmful_effects_to_enemies())
+
+        self.__passive_skill_effect = passive_skill_effect
 
     def get_runes(self):
         # type: () -> dict
         return self.__runes
 
+    def get_rune_set_counts(self):
+        # type: () -> dict
+        return self.__rune_set_counts
+
+    def get_active_rune_sets(self):
+        # type: () -> dict
+        return self.__active_rune_sets
+
+    def __mark_rune_set(self, set_name, set_effect_is_active):
+        # type: (str, bool) -> None
+        for rune in self.__runes.values():
+            if rune.set_name == set_name:
+                rune.set_effect_is_active = set_effect_is_active
+
+    def update_rune_bonuses(self):
+        # type: () -> None
+        """
+        Adding up the stat increases of the runes placed and the set effects of the complete rune sets, and then
+        deriving the stats of the legendary creature again.
+        :return: None
+        """
+
+        self.__rune_stat_increase, self.__rune_set_effect = self.__get_rune_bonuses()
+        self.update_stats()
+
+    def __get_rune_bonuses(self):
+        # type: () -> tuple
+        """
+        Adding up the stat increases of the runes placed and the set effects of the complete rune sets in one pass
+        over the runes.
+        :return: a tuple of the total stat increase and the total set effect
+        """
+
+        stat_increase: StatIncrease = StatIncrease()
+        set_effect: SetEffect = SetEffect()
+        set_names_counted: list = []  # initial value
+        for rune in self.__runes.values():
+            for attribute, value in vars(rune.stat_increase).items():
+                setattr(stat_increase, attribute, getattr(stat_increase, attribute) + value)
+
+            if rune.set_name in self.__active_rune_sets.keys() and rune.set_name not in set_names_counted:
+                set_names_counted.append(rune.set_name)
+                for attribute, value in vars(rune.set_effect).items():
+                    setattr(set_effect, attribute, getattr(set_effect, attribute) +
+                            self.__active_rune_sets[rune.set_name] * value)
+
+        return stat_increase, set_effect
+
+    def preview_stats(self, stat_increase, set_effect):
+        # type: (StatIncrease, SetEffect) -> LegendaryCreature
+        """
+        Getting a shallow copy of the legendary creature whose stats are derived from 'stat_increase' and
+        'set_effect' in place of those of its runes. The copy shares its runes and skills with the legendary
+        creature, so it is only to be read.
+        :return: the copy with the derived stats
+        """
+
+        preview: LegendaryCreature = copy.copy(self)
+        preview.__rune_stat_increase = stat_increase
+        preview.__rune_set_effect = set_effect
+        preview.update_stats()
+        preview.restore()
+        return preview
+
+    def update_stats(self):
+        # type: () -> None
+        """
+        Deriving the stats of the legendary creature from its base stats, the stat increases of its runes and the
+        set effects of its complete rune sets. Percentage increases are added up and applied to the base stats.
+        :return: None
+        """
+
+        stat_increase: StatIncrease = self.__rune_stat_increase
+        set_effect: SetEffect = self.__rune_set_effect
+        self.max_hp = self.base_max_hp * (1 + (stat_increase.max_hp_percentage_up +
+                                               set_effect.max_hp_percentage_up) / 100) + stat_increase.max_hp_up
+        self.max_magic_points = self.base_max_magic_points * (1 + (stat_increase.max_magic_points_percentage_up +
+                                                                   set_effect.max_magic_points_percentage_up) / 100) \
+            + stat_increase.max_magic_points_up
+        self.attack_power = self.base_attack_power * (1 + (stat_increase.attack_percentage_up +
+                                                           set_effect.attack_percentage_up) / 100) + \
+            stat_increase.attack_up
+        self.defense = self.base_defense * (1 + (stat_increase.defense_percentage_up +
+                                                 set_effect.defense_percentage_up) / 100) + stat_increase.defense_up
+        self.attack_speed = self.base_attack_speed * (1 + set_effect.attack_speed_percentage_up / 100) + \
+            stat_increase.attack_speed_up
+        self.crit_rate = self.base_crit_rate + stat_increase.crit_rate_up + set_effect.crit_rate_up
+        self.crit_damage = self.base_crit_damage + stat_increase.crit_damage_up + set_effect.crit_damage_up
+        self.resistance = min(self.base_resistance + stat_increase.resistance_up + set_effect.resistance_up,
+                              self.MAX_RESISTANCE)
+        self.accuracy = min(self.base_accuracy + stat_increase.accuracy_up + set_effect.accuracy_up,
+                            self.MAX_ACCURACY)
+        self.extra_turn_chance = min(self.MIN_EXTRA_TURN_CHANCE + set_effect.extra_turn_chance_up,
+                                     self.MAX_EXTRA_TURN_CHANCE)
+        self.counterattack_chance = min(self.MIN_COUNTERATTACK_CHANCE + set_effect.counterattack_chance_up,
+                                        self.MAX_COUNTERATTACK_CHANCE)
+        self.reflected_damage_percentage = self.MIN_REFLECTED_DAMAGE_PERCENTAGE + \
+            set_effect.reflected_damage_percentage_up
+        self.life_drain_percentage = self.MIN_LIFE_DRAIN_PERCENTAGE + set_effect.life_drain_percentage_up
+        self.crit_resist = min(self.MIN_CRIT_RESIST + set_effect.crit_resist_up, self.MAX_CRIT_RESIST)
+        self.stun_rate = set_effect.stun_rate_up
+
     def place_rune(self, rune):
         # type: (Rune) -> bool
         if rune.already_placed:
@@ -2345,98 +3610,59 @@ class LegendaryCreature:
             self.remove_rune(rune.slot_number)
 
         self.__runes[rune.slot_number] = rune
-        self.max_hp *= 1 + (rune.stat_increase.max_hp_percentage_up / 100)
-        self.max_hp += rune.stat_increase.max_hp_up
-        self.max_magic_points *= 1 + (rune.stat_increase.max_magic_points_percentage_up / 100)
-        self.max_magic_points += rune.stat_increase.max_magic_points_up
-        self.attack_power *= 1 + (rune.stat_increase.attack_percentage_up / 100)
-        self.attack_power += rune.stat_increase.attack_up
-        self.defense *= 1 + (rune.stat_increase.defense_percentage_up / 100)
-        self.defense += rune.stat_increase.defense_up
-        self.attack_speed += rune.stat_increase.attack_speed_up
-        self.crit_rate += rune.stat_increase.crit_rate_up
-        self.crit_damage += rune.stat_increase.crit_damage_up
-        self.resistance += rune.stat_increase.resistance_up
-        if self.resistance >= self.MAX_RESISTANCE:
-            self.resistance = self.MAX_RESISTANCE
-
-        self.accuracy += rune.stat_increase.accuracy_up
-        if self.accuracy >= self.MAX_ACCURACY:
-            self.accuracy = self.MAX_ACCURACY
-
-        # Try to activate the set effect of the rune if possible.
-        matching_runes: int = sum(1 for curr_rune in self.__runes.values() if curr_rune.set_name == rune.set_name)
-        if matching_runes >= rune.set_size and not rune.set_effect_is_active:
-            self.max_hp *= 1 + (rune.set_effect.max_hp_percentage_up / 100)
-            self.max_magic_points *= 1 + (rune.set_effect.max_magic_points_percentage_up / 100)
-            self.attack_power *= 1 + (rune.set_effect.attack_percentage_up / 100)
-            self.defense *= 1 + (rune.set_effect.defense_percentage_up / 100)
-            self.attack_speed *= 1 + (rune.set_effect.attack_speed_percentage_up / 100)
-            self.crit_rate += rune.set_effect.crit_rate_up
-            self.crit_damage += rune.set_effect.crit_damage_up
-            self.resistance += rune.set_effect.resistance_up
-            if self.resistance >= self.MAX_RESISTANCE:
-                self.resistance = self.MAX_RESISTANCE
-
-            self.accuracy += rune.set_effect.accuracy_up
-            if self.accuracy >= self.MAX_ACCURACY:
-                self.accuracy = self.MAX_ACCURACY
-
-            self.extra_turn_chance += rune.set_effect.extra_turn_chance_up
-            if self.extra_turn_chance >= self.MAX_EXTRA_TURN_CHANCE:
-                self.extra_turn_chance = self.MAX_EXTRA_TURN_CHANCE
-
-            self.counterattack_chance += rune.set_effect.counterattack_chance_up
-            if self.counterattack_chance >= self.MAX_COUNTERATTACK_CHANCE:
-                self.counterattack_chance = self.MAX_COUNTERATTACK_CHANCE
-
-            self.reflected_damage_percentage += rune.set_effect.reflected_damage_percentage_up
-            self.life_drain_percentage += rune.set_effect.life_drain_percentage_up
-            self.crit_resist += rune.set_effect.crit_resist_up
-            if self.crit_resist >= self.MAX_CRIT_RESIST:
-                self.crit_resist = self.MAX_CRIT_RESIST
-
-            self.stun_rate += rune.set_effect.stun_rate_up
-            rune.set_effect_is_active = True
-            count: int = 0
-            while count < rune.set_size:
-                for other_rune in self.__runes.values():
-                    if other_rune.set_name == rune.set_name:
-                        other_rune.set_effect_is_active = True
-                        count += 1
 
+        # Counting the rune towards its set and activating the set effect once more if the rune completes a set
+        self.__rune_set_counts[rune.set_name] = self.__rune_set_counts.get(rune.set_name, 0) + 1
+        if self.__rune_set_counts[rune.set_name] % rune.set_size == 0:
+            self.__active_rune_sets[rune.set_name] = self.__rune_set_counts[rune.set_name] // rune.set_size
+            if self.__active_rune_sets[rune.set_name] == 1:
+                self.__mark_rune_set(rune.set_name, True)
+
+        rune.set_effect_is_active = rune.set_name in self.__active_rune_sets.keys()
+        self.update_rune_bonuses()
         self.restore()
         rune.already_placed = True
         return True
 
     def level_up(self):
         # type: () -> None
-        while self.exp >= self.required_exp and self.level < self.max_level:
-            self.level += 1
-            self.required_exp *= mpf("10") ** self.level
-            temp_runes: dict = self.__runes
-            for slot_number in self.__runes.keys():
-                self.remove_rune(slot_number)
-
-            self.attack_power *= triangular(self.level)
-            self.max_hp *= triangular(self.level)
-            self.max_magic_points *= triangular(self.level)
-            self.defense *= triangular(self.level)
-            self.attack_speed += 2
-            for rune in temp_runes.values():
-                self.place_rune(rune)
+        self.level_up_by(level_ups_for_exp(self.level, self.exp, self.required_exp, self.max_level))
 
-            self.restore()
+    def level_up_by(self, levels):
+        # type: (int) -> int
+        """
+        Increasing the level of the legendary creature by 'levels' levels (up to its maximum level) in one step.
+        The stats gained are the same as those gained from levelling up one level at a time.
+        :return: the number of levels gained
+        """
+
+        levels_gained: int = levels if self.max_level == float('inf') else \
+            max(0, min(levels, self.max_level - self.level))
+        if levels_gained <= 0:
+            return 0
+
+        stat_multiplier: mpf = triangular_product(self.level + 1, levels_gained)
+        self.required_exp *= mpf("10") ** level_up_exp_exponent(self.level, levels_gained)
+        self.level += levels_gained
+        self.base_attack_power *= stat_multiplier
+        self.base_max_hp *= stat_multiplier
+        self.base_max_magic_points *= stat_multiplier
+        self.base_defense *= stat_multiplier
+        self.base_attack_speed += 2 * levels_gained
+        self.update_stats()
+        self.restore()
+        return levels_gained
 
     def level_up_rune(self, slot_number):
         # type: (int) -> bool
         if slot_number not in self.__runes.keys():
             return False
 
-        current_rune: Rune = self.__runes[slot_number]
-        self.remove_rune(slot_number)
-        success: bool = current_rune.level_up()
-        self.place_rune(current_rune)
+        success: bool = self.__runes[slot_number].level_up()
+        if success:
+            self.update_rune_bonuses()
+            self.restore()
+
         return success
 
     def remove_rune(self, slot_number):
@@ -2444,86 +3670,28 @@ class LegendaryCreature:
         if slot_number in self.__runes.keys():
             # Remove the rune at slot number 'slot_number'
             current_rune: Rune = self.__runes[slot_number]
-            self.max_hp -= current_rune.stat_increase.max_hp_up
-            self.max_hp /= 1 + (current_rune.stat_increase.max_hp_percentage_up / 100)
-            self.max_magic_points -= current_rune.stat_increase.max_magic_points_up
-            self.max_magic_points /= 1 + (current_rune.stat_increase.max_magic_points_percentage_up / 100)
-            self.attack_power -= current_rune.stat_increase.attack_up
-            self.attack_power /= 1 + (current_rune.stat_increase.attack_percentage_up / 100)
-            self.defense -= current_rune.stat_increase.defense_up
-            self.defense /= 1 + (current_rune.stat_increase.defense_percentage_up / 100)
-            self.attack_speed -= current_rune.stat_increase.attack_speed_up
-            self.crit_rate -= current_rune.stat_increase.crit_rate_up
-            if self.crit_rate <= self.MIN_CRIT_RATE:
-                self.crit_rate = self.MIN_CRIT_RATE
-
-            self.crit_damage -= current_rune.stat_increase.crit_damage_up
-            if self.crit_damage <= self.MIN_CRIT_DAMAGE:
-                self.crit_damage = self.MIN_CRIT_DAMAGE
-
-            self.resistance -= current_rune.stat_increase.resistance_up
-            if self.resistance <= self.MIN_RESISTANCE:
-                self.resistance = self.MIN_RESISTANCE
-
-            self.accuracy -= current_rune.stat_increase.accuracy_up
-            if self.accuracy <= self.MIN_ACCURACY:
-                self.accuracy = self.MIN_ACCURACY
-
-            # Try to deactivate the set effect of the rune if possible.
-            matching_runes: int = sum(1 for rune in self.__runes.values() if rune.set_name == current_rune.set_name)
-            if matching_runes >= current_rune.set_size and current_rune.set_effect_is_active:
-                self.max_hp /= 1 + (current_rune.stat_increase.max_hp_percentage_up / 100)
-                self.max_magic_points /= 1 + (current_rune.set_effect.max_magic_points_percentage_up / 100)
-                self.attack_power /= 1 + (current_rune.set_effect.attack_percentage_up / 100)
-                self.defense /= 1 + (current_rune.set_effect.defense_percentage_up / 100)
-                self.attack_speed /= 1 + (current_rune.set_effect.attack_speed_percentage_up / 100)
-                self.crit_rate -= current_rune.set_effect.crit_rate_up
-                if self.crit_rate <= self.MIN_CRIT_RATE:
-                    self.crit_rate = self.MIN_CRIT_RATE
-
-                self.crit_damage -= current_rune.set_effect.crit_damage_up
-                if self.crit_damage <= self.MIN_CRIT_DAMAGE:
-                    self.crit_damage = self.MIN_CRIT_DAMAGE
-
-                self.resistance -= current_rune.set_effect.resistance_up
-                if self.resistance <= self.MIN_RESISTANCE:
-                    self.resistance = self.MIN_RESISTANCE
-
-                self.accuracy -= current_rune.set_effect.accuracy_up
-                if self.accuracy <= self.MIN_ACCURACY:
-                    self.accuracy = self.MIN_ACCURACY
-
-                self.extra_turn_chance -= current_rune.set_effect.extra_turn_chance_up
-                if self.extra_turn_chance <= self.MIN_EXTRA_TURN_CHANCE:
-                    self.extra_turn_chance = self.MIN_EXTRA_TURN_CHANCE
-
-                self.counterattack_chance -= current_rune.set_effect.counterattack_chance_up
-                if self.counterattack_chance <= self.MIN_COUNTERATTACK_CHANCE:
-                    self.counterattack_chance = self.MIN_COUNTERATTACK_CHANCE
-
-                self.reflected_damage_percentage -= current_rune.set_effect.reflected_damage_percentage_up
-                self.life_drain_percentage -= current_rune.set_effect.life_drain_percentage_up
-                self.crit_resist -= current_rune.set_effect.crit_resist_up
-                if self.crit_resist <= self.MIN_CRIT_RESIST:
-                    self.crit_resist = self.MIN_CRIT_RESIST
-
-                self.stun_rate -= current_rune.set_effect.stun_rate_up
-                current_rune.set_effect_is_active = False
-                count: int = 0
-                while count < current_rune.set_size:
-                    for other_rune in self.__runes.values():
-                        if other_rune.set_name == current_rune.set_name:
-                            other_rune.set_effect_is_active = False
-                            count += 1
 
-            self.restore()
+            # Deactivating one copy of the set effect if the rune belongs to a complete set and then uncounting it
+            if self.__rune_set_counts[current_rune.set_name] % current_rune.set_size == 0:
+                self.__active_rune_sets[current_rune.set_name] -= 1
+                if self.__active_rune_sets[current_rune.set_name] == 0:
+                    del self.__active_rune_sets[current_rune.set_name]
+                    self.__mark_rune_set(current_rune.set_name, False)
+
+            self.__rune_set_counts[current_rune.set_name] -= 1
+            if self.__rune_set_counts[current_rune.set_name] == 0:
+                del self.__rune_set_counts[current_rune.set_name]
+
+            current_rune.set_effect_is_active = False
             self.__runes.pop(current_rune.slot_number)
+            self.update_rune_bonuses()
+            self.restore()
             current_rune.already_placed = False
             return True
         return False
 
     def have_turn(self, other, active_skill, action_name):
-        # type: (LegendaryCreature, ActiveSkill or None, str) -> bool
+        # type: (LegendaryCreature, ActiveSkill or None, ActionName or str) -> bool
         if self.can_use_passive_skills and not self.passive_skills_activated:
             self.use_passive_skills()
 
@@ -2538,11 +3706,12 @@ class LegendaryCreature:
                 self.remove_harmful_effect(harmful_effect)
 
         if self.can_move:
-            if action_name == "NORMAL ATTACK":
+            action_code: ActionName or None = ActionName.get_code(action_name)
+            if action_code == ActionName.NORMAL_ATTACK:
                 self.normal_attack(other)
-            elif action_name == "NORMAL HEAL":
+            elif action_code == ActionName.NORMAL_HEAL:
                 self.normal_heal(other)
-            elif action_name == "USE SKILL" and isinstance(active_skill, ActiveSkill):
+            elif action_code == ActionName.USE_SKILL and isinstance(active_skill, ActiveSkill):
                 self.use_skill(other, active_skill)
             else:
                 pass
@@ -2556,7 +3725,7 @@ class LegendaryCreature:
             first_attacking_active_skill: ActiveSkill or None = None  # initial value
             for skill in self.get_skills():
                 if isinstance(skill, ActiveSkill):
-                    if skill.active_skill_type == "ATTACK":
+                    if skill.active_skill_type == ActiveSkillType.ATTACK:
                         first_attacking_active_skill = skill
 
             if first_attacking_active_skill is None:
@@ -2573,12 +3742,12 @@ class LegendaryCreature:
 
     def normal_attack(self, other):
         # type: (LegendaryCreature) -> None
-        action: Action = Action("NORMAL ATTACK")
+        action: Action = Action(ActionName.NORMAL_ATTACK)
         action.execute(self, other)
 
     def normal_heal(self, other):
         # type: (LegendaryCreature) -> None
-        action: Action = Action("NORMAL HEAL")
+        action: Action = Action(ActionName.NORMAL_HEAL)
         action.execute(self, other)
 
     def use_skill(self, other, active_skill):
@@ -2589,14 +3758,17 @@ class LegendaryCreature:
         if self.curr_magic_points < active_skill.magic_points_cost:
             return False
 
-        action: Action = Action("USE SKILL")
+        action: Action = Action(ActionName.USE_SKILL)
         action.execute(self, other, active_skill)
         self.curr_magic_points -= active_skill.magic_points_cost
         return True
 
     def clone(self):
         # type: () -> LegendaryCreature
-        return copy.deepcopy(self)
+        # The copy is a different legendary creature, so it gets its own legendary creature ID
+        new_legendary_creature: LegendaryCreature = copy.deepcopy(self)
+        new_legendary_creature.legendary_creature_id = str(uuid.uuid1())
+        return new_legendary_creature
 
 
 class FusionLegendaryCreature(LegendaryCreature):
@@ -2663,27 +3835,22 @@ class ActiveSkill(Skill):
                  does_ignore_invincibility):
         # type: (str, str, str, bool, mpf, int, DamageMultiplier, list, list, mpf, mpf, mpf, bool, bool, bool) -> None
         Skill.__init__(self, name, description, magic_points_cost)
-        self.active_skill_type: str = active_skill_type if active_skill_type in self.POSSIBLE_ACTIVE_SKILL_TYPES \
-            else self.POSSIBLE_ACTIVE_SKILL_TYPES[0]
+        self.active_skill_type: ActiveSkillType = ActiveSkillType.get_code(active_skill_type, ActiveSkillType.ATTACK)
         self.is_aoe: bool = is_aoe
         self.cooltime: int = max_cooltime
         self.max_cooltime: int = max_cooltime
-        self.damage_multiplier: DamageMultiplier = damage_multiplier if self.active_skill_type == "ATTACK" else \
-            DamageMultiplier()
-        self.__beneficial_effects_to_allies: list = beneficial_effects_to_allies if self.active_skill_type == \
-                                                                                    "ATTACK" or \
-                                                                                    self.active_skill_type == \
-                                                                                    "ALLIES EFFECT" else []
-        self.__harmful_effects_to_enemies: list = harmful_effects_to_enemies if self.active_skill_type == "ATTACK" or \
-                                                                                self.active_skill_type == \
-                                                                                "ENEMIES EFFECT" else []
+        self.damage_multiplier: DamageMultiplier = damage_multiplier if self.active_skill_type == \
+            ActiveSkillType.ATTACK else DamageMultiplier()
+        self.__beneficial_effects_to_allies: list = beneficial_effects_to_allies if self.active_skill_type in \
+            [ActiveSkillType.ATTACK, ActiveSkillType.ALLIES_EFFECT] else []
+        self.__harmful_effects_to_enemies: list = harmful_effects_to_enemies if self.active_skill_type in \
+            [ActiveSkillType.ATTACK, ActiveSkillType.ENEMIES_EFFECT] else []
         self.allies_attack_gauge_up: mpf = allies_attack_gauge_up if self.active_skill_type == \
-                                                                     "ALLIES EFFECT" else mpf("0")
-        self.enemies_attack_gauge_down: mpf = enemies_attack_gauge_down if self.active_skill_type == "ATTACK" or \
-                                                                           self.active_skill_type == "ENEMIES EFFECT" \
+            ActiveSkillType.ALLIES_EFFECT else mpf("0")
+        self.enemies_attack_gauge_down: mpf = enemies_attack_gauge_down if self.active_skill_type in \
+            [ActiveSkillType.ATTACK, ActiveSkillType.ENEMIES_EFFECT] else mpf("0")
+        self.heal_amount_to_allies: mpf = heal_amount_to_allies if self.active_skill_type == ActiveSkillType.HEAL \
             else mpf("0")
-        self.heal_amount_to_allies: mpf = heal_amount_to_allies if self.active_skill_type == \
-                                                                   "HEAL" else mpf("0")
         self.does_ignore_enemies_defense: bool = does_ignore_enemies_defense
         self.does_ignore_shield: bool = does_ignore_shield
         self.does_ignore_invincibility: bool = does_ignore_invincibility
@@ -2694,6 +3861,10 @@ class ActiveSkill(Skill):
             ', '.join('%s=%s' % item for item in vars(self).items())
         )
 
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        load_saved_codes(self, state, {"active_skill_type": ActiveSkillType})
+
     def get_beneficial_effects_to_allies(self):
         # type: () -> list
         return self.__beneficial_effects_to_allies
@@ -2946,22 +4117,22 @@ class BeneficialEffect:
 
     def __init__(self, name, number_of_turns):
         # type: (str, int) -> None
-        self.name: str = name if name in self.POSSIBLE_NAMES else self.POSSIBLE_NAMES[0]
+        self.name: BeneficialEffectName = BeneficialEffectName.get_code(name, BeneficialEffectName.INCREASE_ATK)
         self.number_of_turns: int = number_of_turns
-        self.attack_power_percentage_up: mpf = mpf("50") if self.name == "INCREASE_ATK" else mpf("0")
-        self.attack_speed_percentage_up: mpf = mpf("33") if self.name == "INCREASE_SPD" else mpf("0")
-        self.defense_percentage_up: mpf = mpf("50") if self.name == "INCREASE_DEF" else mpf("0")
-        self.crit_rate_up: mpf = mpf("0.3") if self.name == "INCREASE_CRIT_RATE" else mpf("0")
-        self.prevents_damage: bool = self.name == "INVINCIBILITY"
-        self.blocks_debuffs: bool = self.name == "IMMUNITY"
-        self.prevents_death: bool = self.name == "ENDURE"
-        self.heal_percentage_per_turn: mpf = mpf("15") if self.name == "HEAL_OVER_TIME" else mpf("0")
-        self.counterattack_chance_up: mpf = mpf("1") if self.name == "COUNTER" else mpf("0")
-        self.reflected_damage_percentage_up: mpf = mpf("33") if self.name == "REFLECT" else mpf("0")
-        self.life_drain_percentage_up: mpf = mpf("33") if self.name == "VAMPIRE" else mpf("0")
-        self.crit_resist_up: mpf = mpf("0.5") if self.name == "INCREASE_CRIT_RESIST" else mpf("0")
-        self.shield_percentage_up: mpf = mpf("15") if self.name == "SHIELD" else mpf("0")
-        self.can_be_stacked: bool = self.name == "HEAL_OVER_TIME"
+        self.attack_power_percentage_up: mpf = mpf("50") if self.name == BeneficialEffectName.INCREASE_ATK else mpf("0")
+        self.attack_speed_percentage_up: mpf = mpf("33") if self.name == BeneficialEffectName.INCREASE_SPD else mpf("0")
+        self.defense_percentage_up: mpf = mpf("50") if self.name == BeneficialEffectName.INCREASE_DEF else mpf("0")
+        self.crit_rate_up: mpf = mpf("0.3") if self.name == BeneficialEffectName.INCREASE_CRIT_RATE else mpf("0")
+        self.prevents_damage: bool = self.name == BeneficialEffectName.INVINCIBILITY
+        self.blocks_debuffs: bool = self.name == BeneficialEffectName.IMMUNITY
+        self.prevents_death: bool = self.name == BeneficialEffectName.ENDURE
+        self.heal_percentage_per_turn: mpf = mpf("15") if self.name == BeneficialEffectName.HEAL_OVER_TIME else mpf("0")
+        self.counterattack_chance_up: mpf = mpf("1") if self.name == BeneficialEffectName.COUNTER else mpf("0")
+        self.reflected_damage_percentage_up: mpf = mpf("33") if self.name == BeneficialEffectName.REFLECT else mpf("0")
+        self.life_drain_percentage_up: mpf = mpf("33") if self.name == BeneficialEffectName.VAMPIRE else mpf("0")
+        self.crit_resist_up: mpf = mpf("0.5") if self.name == BeneficialEffectName.INCREASE_CRIT_RESIST else mpf("0")
+        self.shield_percentage_up: mpf = mpf("15") if self.name == BeneficialEffectName.SHIELD else mpf("0")
+        self.can_be_stacked: bool = self.name == BeneficialEffectName.HEAL_OVER_TIME
 
     def __str__(self):
         return '%s(%s)' % (
@@ -2969,6 +4140,10 @@ class BeneficialEffect:
             ', '.join('%s=%s' % item for item in vars(self).items())
         )
 
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        load_saved_codes(self, state, {"name": BeneficialEffectName})
+
     def clone(self):
         # type: () -> BeneficialEffect
         return copy.deepcopy(self)
@@ -2984,20 +4159,20 @@ class HarmfulEffect:
 
     def __init__(self, name, number_of_turns):
         # type: (str, int) -> None
-        self.name: str = name if name in self.POSSIBLE_NAMES else self.POSSIBLE_NAMES[0]
+        self.name: HarmfulEffectName = HarmfulEffectName.get_code(name, HarmfulEffectName.DECREASE_ATK)
         self.number_of_turns: int = number_of_turns
-        self.attack_power_percentage_down: mpf = mpf("50") if self.name == "DECREASE_ATK" else mpf("0")
-        self.attack_speed_percentage_down: mpf = mpf("33") if self.name == "DECREASE_SPD" else mpf("0")
-        self.defense_percentage_down: mpf = mpf("50") if self.name == "DECREASE_DEF" else mpf("0")
-        self.glancing_hit_chance_up: mpf = mpf("0.5") if self.name == "GLANCING" else mpf("0")
-        self.blocks_beneficial_effects: bool = self.name == "BLOCK_BENEFICIAL_EFFECTS"
-        self.damage_received_percentage_up: mpf = mpf("25") if self.name == "BRAND" else mpf("0")
-        self.blocks_heal: bool = self.name == "UNRECOVERABLE"
-        self.blocks_passive_skills: bool = self.name == "OBLIVION"
-        self.blocks_skills_with_cooltime: bool = self.name == "SILENCE"
-        self.damage_percentage_per_turn: mpf = mpf("5") if self.name == "DAMAGE_OVER_TIME" else mpf("0")
-        self.prevents_moves: bool = self.name == "STUN"
-        self.can_be_stacked: bool = self.name == "DAMAGE_OVER_TIME"
+        self.attack_power_percentage_down: mpf = mpf("50") if self.name == HarmfulEffectName.DECREASE_ATK else mpf("0")
+        self.attack_speed_percentage_down: mpf = mpf("33") if self.name == HarmfulEffectName.DECREASE_SPD else mpf("0")
+        self.defense_percentage_down: mpf = mpf("50") if self.name == HarmfulEffectName.DECREASE_DEF else mpf("0")
+        self.glancing_hit_chance_up: mpf = mpf("0.5") if self.name == HarmfulEffectName.GLANCING else mpf("0")
+        self.blocks_beneficial_effects: bool = self.name == HarmfulEffectName.BLOCK_BENEFICIAL_EFFECTS
+        self.damage_received_percentage_up: mpf = mpf("25") if self.name == HarmfulEffectName.BRAND else mpf("0")
+        self.blocks_heal: bool = self.name == HarmfulEffectName.UNRECOVERABLE
+        self.blocks_passive_skills: bool = self.name == HarmfulEffectName.OBLIVION
+        self.blocks_skills_with_cooltime: bool = self.name == HarmfulEffectName.SILENCE
+        self.damage_percentage_per_turn: mpf = mpf("5") if self.name == HarmfulEffectName.DAMAGE_OVER_TIME else mpf("0")
+        self.prevents_moves: bool = self.name == HarmfulEffectName.STUN
+        self.can_be_stacked: bool = self.name == HarmfulEffectName.DAMAGE_OVER_TIME
 
     def __str__(self):
         return '%s(%s)' % (
@@ -3005,11 +4180,43 @@ class HarmfulEffect:
             ', '.join('%s=%s' % item for item in vars(self).items())
         )
 
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        load_saved_codes(self, state, {"name": HarmfulEffectName})
+
     def clone(self):
         # type: () -> HarmfulEffect
         return copy.deepcopy(self)
 
 
+class BaseOperation:
+    """
+    This class contains attributes of an operation (building, levelling up or removing a building) on a tile of the
+    player's base.
+    """
+
+    POTENTIAL_ACTIONS: list = ["BUILD", "LEVEL UP", "REMOVE"]
+
+    def __init__(self, action, island_index, tile_x, tile_y, building=None):
+        # type: (str, int, int, int, Building or None) -> None
+        self.action: str = action if action in self.POTENTIAL_ACTIONS else self.POTENTIAL_ACTIONS[0]
+        self.island_index: int = island_index
+        self.tile_x: int = tile_x
+        self.tile_y: int = tile_y
+        self.building: Building or None = building  # the building to be built
+        self.succeeded: bool = False
+
+    def __str__(self):
+        return '%s(%s)' % (
+            type(self).__name__,
+            ', '.join('%s=%s' % item for item in vars(self).items())
+        )
+
+    def clone(self):
+        # type: () -> BaseOperation
+        return copy.deepcopy(self)
+
+
 class PlayerBase:
     """
     This class contains attributes of the player's base.
@@ -3017,8 +4224,11 @@ class PlayerBase:
 
     def __init__(self):
         # type: () -> None
-        self.__islands: list = [Island()]  # initial value
+        self.__islands: list = []  # initial value
+        # building type -> {building -> (island index, x, y)}, obstacles are kept by the islands themselves
+        self.__building_locations: dict = {}
         self.island_build_gold_cost: mpf = mpf("1e8")
+        self.__add_new_island()
 
     def __str__(self):
         return '%s(%s)' % (
@@ -3026,15 +4236,59 @@ class PlayerBase:
             ', '.join('%s=%s' % item for item in vars(self).items())
         )
 
-    def add_island(self):
-        # type: () -> None
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        if "_PlayerBase__building_locations" not in state.keys():
+            # Player bases saved by older versions of the game do not index their buildings
+            self.__building_locations = {}
+            for island_index in range(len(self.__islands)):
+                island: Island = self.__islands[island_index]
+                for tile_y in range(island.height):
+                    for tile_x in range(island.width):
+                        building: Building or None = island.get_tile_at(tile_x, tile_y).building
+                        if isinstance(building, Building) and not isinstance(building, Obstacle):
+                            self.add_building_location(building, island_index, tile_x, tile_y)
+
+    def add_island(self, width=None, height=None):
+        # type: (int or None, int or None) -> None
         self.island_build_gold_cost *= mpf("10") ** (triangular(len(self.__islands)))
-        self.__islands.append(Island())
+        self.__add_new_island(width, height)
+
+    def __add_new_island(self, width=None, height=None):
+        # type: (int or None, int or None) -> None
+        self.__islands.append(Island(width=width, height=height))
 
     def get_islands(self):
         # type: () -> list
         return self.__islands
 
+    def add_building_location(self, building, island_index, tile_x, tile_y):
+        # type: (Building, int, int, int) -> None
+        if type(building) not in self.__building_locations.keys():
+            self.__building_locations[type(building)] = {}
+
+        self.__building_locations[type(building)][building] = (island_index, tile_x, tile_y)
+
+    def remove_building_location(self, building):
+        # type: (Building) -> bool
+        if self.has_building(building):
+            del self.__building_locations[type(building)][building]
+            return True
+        return False
+
+    def get_building_location(self, building):
+        # type: (Building) -> tuple or None
+        return self.__building_locations.get(type(building), {}).get(building)
+
+    def has_building(self, building):
+        # type: (Building) -> bool
+        return building in self.__building_locations.get(type(building), {}).keys()
+
+    def get_buildings(self, building_type):
+        # type: (type) -> list
+        return list(self.__building_locations.get(building_type, {}).keys())
+
     def clone(self):
         # type: () -> PlayerBase
         return copy.deepcopy(self)
@@ -3045,42 +4299,219 @@ class Island:
     This class contains attributes of an island in a player's base.
     """
 
-    ISLAND_WIDTH: int = 10
-    ISLAND_HEIGHT: int = 10
-
-    def __init__(self):
-        # type: () -> None
-        self.__tiles: list = []  # initial value
-        for i in range(self.ISLAND_WIDTH):
-            new = []  # initial value
-            for k in range(self.ISLAND_HEIGHT):
-                # Ensuring that obstacles are not placed at the edges of the island
-                place_obstacle: bool = random.random() <= 0.3
-                if place_obstacle and not self.is_edge(i, k):
-                    new.append(IslandTile(Obstacle()))
-                else:
-                    new.append(IslandTile())
+    ISLAND_WIDTH: int = 10  # default width of an island
+    ISLAND_HEIGHT: int = 10  # default height of an island
+
+    # Codes of the tiles in the island. An obstacle's code also holds the powers of 10 of the gold and gems gained
+    # from removing it.
+    GRASS_CODE: int = 0
+    BUILDING_CODE: int = 1
+    OBSTACLE_CODE: int = 2
+    OBSTACLE_GOLD_GAIN_POWERS: range = range(5, 11)
+    OBSTACLE_GEM_GAIN_POWERS: range = range(2, 7)
+    OBSTACLE_CHANCE: mpf = mpf("0.3")
+
+    def __init__(self, seed=None, width=None, height=None):
+        # type: (int or None, int or None, int or None) -> None
+        self.seed: int = random.getrandbits(32) if seed is None else seed
+        self.width: int = width if width is not None and width > 0 else self.ISLAND_WIDTH
+        self.height: int = height if height is not None and height > 0 else self.ISLAND_HEIGHT
+        self.__tile_codes: array = array('B', [self.GRASS_CODE] * (self.width * self.height))
+        self.__buildings: dict = {}  # tile index -> building built on the tile
+        self.__rendered_tiles: str or None = None  # cached result of str(self)
+
+        # Indexes of the tiles: the free tiles and the tiles of each type of building (including obstacles)
+        self.__free_tiles: set = set(range(len(self.__tile_codes)))
+        self.__tiles_by_building_type: dict = {}  # building type -> set of tile indices
+
+        # Drawing 32 random bits for every tile at once: the lower 16 bits decide whether an obstacle is placed and
+        # the upper 16 bits decide the gold and gems gained from removing it
+        random_bits: int = random.Random(self.seed).getrandbits(32 * len(self.__tile_codes))
+        obstacle_threshold: int = int(self.OBSTACLE_CHANCE * 2 ** 16)
+        obstacle_types: int = len(self.OBSTACLE_GOLD_GAIN_POWERS) * len(self.OBSTACLE_GEM_GAIN_POWERS)
+        for tile_index in range(len(self.__tile_codes)):
+            random_value: int = (random_bits >> (32 * tile_index)) & 0xFFFFFFFF
+
+            # Ensuring that obstacles are not placed at the edges of the island
+            if random_value & 0xFFFF <= obstacle_threshold and not \
+                    self.is_edge(tile_index % self.width, tile_index // self.width):
+                self.__tile_codes[tile_index] = self.OBSTACLE_CODE + (random_value >> 16) % obstacle_types
+                self.__add_to_indexes(tile_index, Obstacle)
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        if "_Island__tiles" in state.keys():
+            self.__load_saved_tiles(self.__dict__.pop("_Island__tiles"))
+
+    def __load_saved_tiles(self, tiles):
+        # type: (list) -> None
+        """
+        Converting the grid of island tiles saved by older versions of the game into tile codes and building the
+        indexes of the tiles again. The obstacles of older islands were not drawn from a seed.
+        :return: None
+        """
 
-            self.__tiles.append(new)
+        self.seed = None
+        self.height = len(tiles)
+        self.width = len(tiles[0]) if self.height > 0 else 0
+        self.__tile_codes = array('B', [self.GRASS_CODE] * (self.width * self.height))
+        self.__buildings = {}
+        self.__rendered_tiles = None
+        self.__free_tiles = set(range(len(self.__tile_codes)))
+        self.__tiles_by_building_type = {}
+        for tile_index in range(len(self.__tile_codes)):
+            building: Building or None = tiles[tile_index // self.width][tile_index % self.width].building
+            if isinstance(building, Obstacle):
+                self.__tile_codes[tile_index] = self.get_obstacle_code(building)
+                self.__add_to_indexes(tile_index, Obstacle)
+            elif isinstance(building, Building):
+                self.__tile_codes[tile_index] = self.BUILDING_CODE
+                self.__buildings[tile_index] = building
+                self.__add_to_indexes(tile_index, type(building))
+
+    @staticmethod
+    def get_obstacle_code(obstacle):
+        # type: (Obstacle) -> int
+        # Rounding the gold and gems gained from removing the obstacle to the nearest powers of 10 which can be coded
+        gold_gain_power: int = min(max(int(mp.nint(mp.log10(obstacle.remove_gold_gain))),
+                                       Island.OBSTACLE_GOLD_GAIN_POWERS[0]), Island.OBSTACLE_GOLD_GAIN_POWERS[-1])
+        gem_gain_power: int = min(max(int(mp.nint(mp.log10(obstacle.remove_gem_gain))),
+                                      Island.OBSTACLE_GEM_GAIN_POWERS[0]), Island.OBSTACLE_GEM_GAIN_POWERS[-1])
+        return Island.OBSTACLE_CODE + Island.OBSTACLE_GOLD_GAIN_POWERS.index(gold_gain_power) * \
+            len(Island.OBSTACLE_GEM_GAIN_POWERS) + Island.OBSTACLE_GEM_GAIN_POWERS.index(gem_gain_power)
 
     def is_edge(self, x, y):
         # type: (int, int) -> bool
-        return (x == 0 and y == 0) or (x == 0 and y == self.ISLAND_HEIGHT - 1) or \
-               (x == self.ISLAND_WIDTH - 1 and y == 0) or (x == self.ISLAND_WIDTH - 1 and y == self.ISLAND_HEIGHT - 1)
+        return (x == 0 and y == 0) or (x == 0 and y == self.height - 1) or \
+               (x == self.width - 1 and y == 0) or (x == self.width - 1 and y == self.height - 1)
+
+    def is_inside(self, x, y):
+        # type: (int, int) -> bool
+        return 0 <= x < self.width and 0 <= y < self.height
 
     def get_tiles(self):
         # type: () -> list
-        return self.__tiles
+        return [[self.get_tile_at(x, y) for x in range(self.width)] for y in range(self.height)]
 
     def get_tile_at(self, x, y):
         # type: (int, int) -> IslandTile or None
-        if x < 0 or x >= self.ISLAND_WIDTH or y < 0 or y >= self.ISLAND_HEIGHT:
+        if not self.is_inside(x, y):
+            return None
+
+        tile_index: int = y * self.width + x
+        tile_code: int = self.__tile_codes[tile_index]
+        if tile_code == self.GRASS_CODE:
+            return IslandTile()
+        elif tile_code == self.BUILDING_CODE:
+            return IslandTile(self.__buildings[tile_index])
+
+        gold_gain_power: int = self.OBSTACLE_GOLD_GAIN_POWERS[(tile_code - self.OBSTACLE_CODE) //
+                                                              len(self.OBSTACLE_GEM_GAIN_POWERS)]
+        gem_gain_power: int = self.OBSTACLE_GEM_GAIN_POWERS[(tile_code - self.OBSTACLE_CODE) %
+                                                            len(self.OBSTACLE_GEM_GAIN_POWERS)]
+        return IslandTile(Obstacle(mpf("10") ** gold_gain_power, mpf("10") ** gem_gain_power))
+
+    def __get_building_type_at(self, tile_index):
+        # type: (int) -> type or None
+        if self.__tile_codes[tile_index] == self.GRASS_CODE:
+            return None
+        elif self.__tile_codes[tile_index] == self.BUILDING_CODE:
+            return type(self.__buildings[tile_index])
+        return Obstacle
+
+    def __add_to_indexes(self, tile_index, building_type):
+        # type: (int, type) -> None
+        self.__free_tiles.discard(tile_index)
+        if building_type not in self.__tiles_by_building_type.keys():
+            self.__tiles_by_building_type[building_type] = set()
+
+        self.__tiles_by_building_type[building_type].add(tile_index)
+
+    def __remove_from_indexes(self, tile_index):
+        # type: (int) -> None
+        building_type: type or None = self.__get_building_type_at(tile_index)
+        if building_type is not None:
+            self.__tiles_by_building_type[building_type].discard(tile_index)
+
+        self.__free_tiles.add(tile_index)
+
+    def set_building_at(self, x, y, building):
+        # type: (int, int, Building) -> None
+        self.__remove_from_indexes(y * self.width + x)
+        self.__tile_codes[y * self.width + x] = self.BUILDING_CODE
+        self.__buildings[y * self.width + x] = building
+        self.__add_to_indexes(y * self.width + x, type(building))
+        self.clear_rendered_tiles()
+
+    def remove_building_at(self, x, y):
+        # type: (int, int) -> None
+        self.__remove_from_indexes(y * self.width + x)
+        self.__tile_codes[y * self.width + x] = self.GRASS_CODE
+        if y * self.width + x in self.__buildings.keys():
+            del self.__buildings[y * self.width + x]
+
+        self.clear_rendered_tiles()
+
+    def get_free_tiles(self):
+        # type: () -> list
+        return [(tile_index % self.width, tile_index // self.width) for tile_index in sorted(self.__free_tiles)]
+
+    def get_building_tiles(self, building_type):
+        # type: (type) -> list
+        return [(tile_index % self.width, tile_index // self.width) for tile_index in
+                sorted(self.__tiles_by_building_type.get(building_type, set()))]
+
+    def get_tiles_in_rectangle(self, x1, y1, x2, y2, building_type=None):
+        # type: (int, int, int, int, type or None) -> list
+        """
+        Getting the coordinates of the tiles in the rectangle with corners (x1, y1) and (x2, y2), inclusive. If
+        'building_type' is given, only the tiles with a building of that type are looked at.
+        :return: a list of (x, y) tuples
+        """
+
+        min_x, max_x = max(0, min(x1, x2)), min(self.width - 1, max(x1, x2))
+        min_y, max_y = max(0, min(y1, y2)), min(self.height - 1, max(y1, y2))
+        if building_type is not None:
+            return [(x, y) for x, y in self.get_building_tiles(building_type) if min_x <= x <= max_x and
+                    min_y <= y <= max_y]
+
+        return [(x, y) for y in range(min_y, max_y + 1) for x in range(min_x, max_x + 1)]
+
+    def get_nearest_building(self, x, y, building_type):
+        # type: (int, int, type) -> tuple or None
+        """
+        Getting the coordinates of the building of type 'building_type' nearest to the tile (x, y), measured in
+        steps between adjacent tiles.
+        :return: an (x, y) tuple, or None if there is no such building on the island
+        """
+
+        building_tiles: list = self.get_building_tiles(building_type)
+        if len(building_tiles) == 0:
             return None
-        return self.__tiles[y][x]
+        return min(building_tiles, key=lambda tile: abs(tile[0] - x) + abs(tile[1] - y))
+
+    def get_adjacent_tiles(self, x, y):
+        # type: (int, int) -> set
+        return {(x + dx, y + dy) for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)] if self.is_inside(x + dx, y + dy)}
+
+    def clear_rendered_tiles(self):
+        # type: () -> None
+        # Called whenever a building on the island changes or levels up, so that the island is rendered again
+        self.__rendered_tiles = None
+
+    def __getstate__(self):
+        # type: () -> dict
+        # The rendered tiles are not saved with the island
+        state: dict = self.__dict__.copy()
+        state["_Island__rendered_tiles"] = None
+        return state
 
     def __str__(self):
         # type: () -> str
-        return str(tabulate(self.__tiles, headers='firstrow', tablefmt='fancy_grid'))
+        if self.__rendered_tiles is None:
+            self.__rendered_tiles = str(tabulate(self.get_tiles(), headers='firstrow', tablefmt='fancy_grid'))
+        return self.__rendered_tiles
 
     def clone(self):
         # type: () -> Island
@@ -3145,6 +4576,27 @@ class Building:
         # type: () -> None
         pass
 
+    def can_level_up(self):
+        # type: () -> bool
+        # Buildings which do not override level_up() stay the same when levelled up
+        return type(self).level_up is not Building.level_up
+
+    def get_upgrade_costs_after(self, level_ups):
+        # type: (int) -> tuple
+        """
+        Getting the gold and gem costs of levelling up the building once it has been levelled up a number of times,
+        without levelling it up. Each level up multiplies the upgrade costs by 10 to the power of the new level.
+        :return: a tuple of the gold cost and the gem cost
+        """
+
+        upgrade_gold_cost: mpf = self.upgrade_gold_cost
+        upgrade_gem_cost: mpf = self.upgrade_gem_cost
+        for level in range(self.level + 1, self.level + level_ups + 1):
+            upgrade_gold_cost *= mpf("10") ** level
+            upgrade_gem_cost *= mpf("10") ** level
+
+        return upgrade_gold_cost, upgrade_gem_cost
+
     def clone(self):
         # type: () -> Building
         return copy.deepcopy(self)
@@ -3338,6 +4790,59 @@ class BoosterTower(Building):
         self.upgrade_gem_cost *= mpf("10") ** self.level
 
 
+class BuildingBonuses:
+    """
+    This class contains attributes of the bonuses given to all legendary creatures of a player by the buildings in
+    the player's base.
+    """
+
+    BUILDING_TYPES: tuple = (Guardstone, LegendaryCreatureSanctuary, SurvivalAltar, MagicAltar, BoosterTower)
+
+    def __init__(self):
+        # type: () -> None
+        self.max_hp_percentage_up: mpf = mpf("0")
+        self.max_magic_points_percentage_up: mpf = mpf("0")
+        self.attack_power_percentage_up: mpf = mpf("0")
+        self.attack_speed_percentage_up: mpf = mpf("0")
+        self.defense_percentage_up: mpf = mpf("0")
+
+    def __str__(self):
+        return '%s(%s)' % (
+            type(self).__name__,
+            ', '.join('%s=%s' % item for item in vars(self).items())
+        )
+
+    def add_building(self, building):
+        # type: (Building) -> None
+        if isinstance(building, Guardstone):
+            self.defense_percentage_up += building.legendary_creature_defense_percentage_up
+        elif isinstance(building, LegendaryCreatureSanctuary):
+            self.attack_power_percentage_up += building.legendary_creature_attack_power_percentage_up
+        elif isinstance(building, SurvivalAltar):
+            self.max_hp_percentage_up += building.legendary_creature_max_hp_percentage_up
+        elif isinstance(building, MagicAltar):
+            self.max_magic_points_percentage_up += building.legendary_creature_max_magic_points_percentage_up
+        elif isinstance(building, BoosterTower):
+            self.attack_speed_percentage_up += building.legendary_creature_attack_speed_percentage_up
+
+    def remove_building(self, building):
+        # type: (Building) -> None
+        if isinstance(building, Guardstone):
+            self.defense_percentage_up -= building.legendary_creature_defense_percentage_up
+        elif isinstance(building, LegendaryCreatureSanctuary):
+            self.attack_power_percentage_up -= building.legendary_creature_attack_power_percentage_up
+        elif isinstance(building, SurvivalAltar):
+            self.max_hp_percentage_up -= building.legendary_creature_max_hp_percentage_up
+        elif isinstance(building, MagicAltar):
+            self.max_magic_points_percentage_up -= building.legendary_creature_max_magic_points_percentage_up
+        elif isinstance(building, BoosterTower):
+            self.attack_speed_percentage_up -= building.legendary_creature_attack_speed_percentage_up
+
+    def clone(self):
+        # type: () -> BuildingBonuses
+        return copy.deepcopy(self)
+
+
 class PlayerEXPTower(Building):
     """
     This class contains attributes of a tower producing EXP for the player.
@@ -3410,6 +4915,135 @@ class GemMine(Building):
         self.upgrade_gem_cost *= mpf("10") ** self.level
 
 
+class UpgradePlanner:
+    """
+    This class contains attributes of a planner choosing which buildings in a player's base to level up within the
+    player's gold and gems.
+    """
+
+    # Objective -> (type of buildings improving it, attribute of the buildings to be maximised)
+    OBJECTIVES: dict = {
+        "GOLD": (GoldMine, "gold_per_second"),
+        "GEMS": (GemMine, "gem_per_second"),
+        "PLAYER EXP": (PlayerEXPTower, "exp_per_second"),
+        "LEGENDARY CREATURE EXP": (TrainingArea, "legendary_creature_exp_per_second"),
+        "DEFENSE": (Guardstone, "legendary_creature_defense_percentage_up"),
+        "ATTACK POWER": (LegendaryCreatureSanctuary, "legendary_creature_attack_power_percentage_up"),
+        "MAX HP": (SurvivalAltar, "legendary_creature_max_hp_percentage_up"),
+        "MAX MAGIC POINTS": (MagicAltar, "legendary_creature_max_magic_points_percentage_up"),
+        "ATTACK SPEED": (BoosterTower, "legendary_creature_attack_speed_percentage_up")
+    }
+    MAX_LEVEL_UPS_PER_BUILDING: int = 100
+
+    def __init__(self):
+        # type: () -> None
+        self.__cost_curves: dict = {}  # building state -> cost curve
+
+    def __str__(self):
+        return '%s(%s)' % (
+            type(self).__name__,
+            ', '.join('%s=%s' % item for item in vars(self).items())
+        )
+
+    def get_cost_curve(self, building, attribute, gold_budget, gem_budget):
+        # type: (Building, str, mpf, mpf) -> list
+        """
+        Getting the total gold cost, total gem cost and total increase in 'attribute' of levelling up 'building' once,
+        twice and so on until the budget is exceeded. Buildings in the same state share the same cost curve.
+        :return: a list of (gold cost, gem cost, gain) tuples, starting with (0, 0, 0) for no level ups
+        """
+
+        key: tuple = (type(building), attribute, building.level, building.upgrade_gold_cost,
+                      building.upgrade_gem_cost, getattr(building, attribute))
+        if key not in self.__cost_curves.keys():
+            self.__cost_curves[key] = [(mpf("0"), mpf("0"), mpf("0"))]
+
+        cost_curve: list = self.__cost_curves[key]
+        if len(cost_curve) - 1 < self.MAX_LEVEL_UPS_PER_BUILDING and cost_curve[-1][0] <= gold_budget and \
+                cost_curve[-1][1] <= gem_budget:
+            # Extending the cost curve by levelling up a copy of the building
+            copied_building: Building = building.clone()
+            for i in range(len(cost_curve) - 1):
+                copied_building.level_up()
+
+            while len(cost_curve) - 1 < self.MAX_LEVEL_UPS_PER_BUILDING and cost_curve[-1][0] <= gold_budget and \
+                    cost_curve[-1][1] <= gem_budget:
+                gold_cost: mpf = cost_curve[-1][0] + copied_building.upgrade_gold_cost
+                gem_cost: mpf = cost_curve[-1][1] + copied_building.upgrade_gem_cost
+                copied_building.level_up()
+                cost_curve.append((gold_cost, gem_cost, getattr(copied_building, attribute) -
+                                   getattr(building, attribute)))
+
+        return [point for point in cost_curve if point[0] <= gold_budget and point[1] <= gem_budget]
+
+    def plan(self, player, objective, seconds=mpf("0")):
+        # type: (Player, str, mpf) -> list
+        """
+        Finding the level ups of the buildings in the player's base which maximise 'objective' using the gold and
+        gems the player has plus those the player will produce in 'seconds' seconds, by branch and bound over the
+        number of times each building is levelled up.
+        :return: a list of BaseOperation objects to level up buildings, cheapest first
+        """
+
+        if objective not in self.OBJECTIVES.keys():
+            return []
+
+        building_type, attribute = self.OBJECTIVES[objective]
+        gold_budget: mpf = player.gold + player.gold_per_second * seconds
+        gem_budget: mpf = player.gems + player.gems_per_second * seconds
+        buildings: list = player.player_base.get_buildings(building_type)
+        cost_curves: list = [self.get_cost_curve(building, attribute, gold_budget, gem_budget)
+                             for building in buildings]
+
+        # The gain of the remaining buildings can be at most the sum of the gains each would give on its own
+        max_remaining_gains: list = [mpf("0")] * (len(buildings) + 1)
+        for i in range(len(buildings) - 1, -1, -1):
+            max_remaining_gains[i] = max_remaining_gains[i + 1] + max(point[2] for point in cost_curves[i])
+
+        best_gain: mpf = mpf("0")
+        best_level_ups: list = [0] * len(buildings)
+        level_ups: list = [0] * len(buildings)
+
+        def search(index, gold_left, gems_left, gain):
+            # type: (int, mpf, mpf, mpf) -> None
+            nonlocal best_gain, best_level_ups
+            if gain + max_remaining_gains[index] <= best_gain:
+                return
+
+            if index == len(buildings):
+                best_gain = gain
+                best_level_ups = list(level_ups)
+                return
+
+            for times in range(len(cost_curves[index]) - 1, -1, -1):
+                gold_cost, gem_cost, building_gain = cost_curves[index][times]
+                if gold_cost <= gold_left and gem_cost <= gems_left:
+                    level_ups[index] = times
+                    search(index + 1, gold_left - gold_cost, gems_left - gem_cost, gain + building_gain)
+
+            level_ups[index] = 0
+
+        search(0, gold_budget, gem_budget, mpf("0"))
+
+        # Ordering the chosen level ups from the cheapest to the most expensive
+        chosen_level_ups: list = []  # initial value
+        for i in range(len(buildings)):
+            for times in range(1, best_level_ups[i] + 1):
+                chosen_level_ups.append((cost_curves[i][times][0] - cost_curves[i][times - 1][0], i))
+
+        chosen_level_ups.sort(key=lambda level_up: level_up[0])
+        operations: list = []  # initial value
+        for gold_cost, i in chosen_level_ups:
+            island_index, tile_x, tile_y = player.player_base.get_building_location(buildings[i])
+            operations.append(BaseOperation("LEVEL UP", island_index, tile_x, tile_y))
+
+        return operations
+
+    def clone(self):
+        # type: () -> UpgradePlanner
+        return copy.deepcopy(self)
+
+
 class PowerUpCircle(Building):
     """
     This class contains attributes of a power-up circle used to power up and evolve legendary creatures.
@@ -3541,11 +5175,12 @@ class Obstacle(Building):
     This class contains attributes of an obstacle which the player can remove from the island.
     """
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, remove_gold_gain=None, remove_gem_gain=None):
+        # type: (mpf or None, mpf or None) -> None
         Building.__init__(self, "OBSTACLE", "A removable obstacle.", mpf("0"), mpf("0"))
-        self.remove_gold_gain: mpf = mpf("10") ** random.randint(5, 10)
-        self.remove_gem_gain: mpf = mpf("10") ** random.randint(2, 6)
+        self.remove_gold_gain: mpf = mpf("10") ** random.randint(5, 10) if remove_gold_gain is None else \
+            remove_gold_gain
+        self.remove_gem_gain: mpf = mpf("10") ** random.randint(2, 6) if remove_gem_gain is None else remove_gem_gain
 
     def __str__(self):
         return '%s(%s)' % (
@@ -3573,9 +5208,11 @@ class TempleOfWishes(Building):
             ', '.join('%s=%s' % item for item in vars(self).items())
         )
 
-    def reset_wishes_left(self):
-        # type: () -> bool
-        time_now: datetime = datetime.now()
+    def reset_wishes_left(self, time_now=None):
+        # type: (datetime) -> bool
+        if time_now is None:
+            time_now = datetime.now()
+
         if not self.already_reset and time_now.hour > 0:
             self.already_reset = True
             self.wishes_left = 3
@@ -3586,6 +5223,17 @@ class TempleOfWishes(Building):
         # type: () -> None
         self.already_reset = False
 
+    def get_next_reset_time(self, time_now):
+        # type: (datetime) -> datetime
+        # Wishes left can only be reset after the first hour of a day has passed
+        reset_time: datetime = datetime(time_now.year, time_now.month, time_now.day, 1)
+        return reset_time if reset_time > time_now else reset_time + timedelta(days=1)
+
+    def reset_daily(self, time_now):
+        # type: (datetime) -> None
+        self.restore()
+        self.reset_wishes_left(time_now)
+
     def get_obtainable_objects(self):
         # type: () -> list
         return self.__obtainable_objects
@@ -4131,8 +5779,6 @@ def main():
         new_game = Game(player_data, potential_legendary_creatures, fusion_legendary_creatures, item_shop,
                         building_shop, battle_arena, battle_areas)
 
-    # Getting the current date and time
-    old_now: datetime = datetime.now()
     print("Enter 'Y' for yes.")
     print("Enter anything else for no.")
     continue_playing: str = input("Do you want to continue playing 'Ancient Invasion'? ")
@@ -4140,33 +5786,9 @@ def main():
         # Clearing up the command line window
         clear()
 
-        # Updating the old time
-        new_now: datetime = datetime.now()
-        time_difference = new_now - old_now
-        seconds: int = time_difference.seconds
-        old_now = new_now
-
-        # Resetting all temple of wishes if possible
-        if new_now.day != old_now.day:
-            for island in new_game.player_data.player_base.get_islands():
-                for x in range(island.ISLAND_WIDTH):
-                    for y in range(island.ISLAND_WIDTH):
-                        curr_tile: IslandTile = island.get_tile_at(x, y)
-                        if isinstance(curr_tile.building, TempleOfWishes):
-                            temple_of_wishes: TempleOfWishes = curr_tile.building
-                            temple_of_wishes.restore()
-                            temple_of_wishes.reset_wishes_left()
-
-        # Increase player's EXP, gold, and gems
-        new_game.player_data.exp += new_game.player_data.exp_per_second * seconds
-        new_game.player_data.level_up()
-        new_game.player_data.gold += new_game.player_data.gold_per_second * seconds
-        new_game.player_data.gems += new_game.player_data.gems_per_second * seconds
-
-        # Increase the exp of all legendary creatures owned by the player
-        for legendary_creature in new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-            legendary_creature.exp += legendary_creature.exp_per_second * seconds
-            legendary_creature.level_up()
+        # Increase player's EXP, gold, and gems, and the EXP of all legendary creatures owned by the player, for
+        # the time passed since the player was last active (also across saved game sessions)
+        new_game.player_data.catch_up(datetime.now())
 
         # Asking the player what he/she wants to do in the game.
         allowed: list = ["PLAY ADVENTURE MODE", "MANAGE PLAYER BASE", "MANAGE BATTLE TEAM",
@@ -4231,29 +5853,10 @@ def main():
 
                 # Allow the player to remove a rune if there are legendary creatures in the legendary creature
                 # inventory.
-                if len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) > 0:
+                if new_game.player_data.legendary_creature_inventory.get_number_of_legendary_creatures() > 0:
                     print("Below is a list of legendary creatures you have.\n")
-                    curr_legendary_creature_index: int = 1  # initial value
-                    for legendary_creature in new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-                        print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                        print(str(legendary_creature) + "\n")
-                        curr_legendary_creature_index += 1
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature "
-                                                              "you want to remove a rune from (1 - " +
-                                                              str(len(new_game.player_data.legendary_creature_inventory.
-                                                                      get_legendary_creatures())) + "): "))
-                    while legendary_creature_index < 1 or legendary_creature_index > \
-                            len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()):
-                        legendary_creature_index = int(input("Sorry, invalid input! Please enter the index of the "
-                                                             "legendary creature you want to remove a rune from "
-                                                             "(1 - " +
-                                                             str(len(new_game.player_data.legendary_creature_inventory.
-                                                                     get_legendary_creatures())) + "): "))
-
                     chosen_legendary_creature: LegendaryCreature = \
-                        new_game.player_data.legendary_creature_inventory.get_legendary_creatures() \
-                            [legendary_creature_index - 1]
+                        choose_legendary_creature(new_game.player_data.legendary_creature_inventory, "remove a rune from")
                     print(str(chosen_legendary_creature.name) + " has runes placed in slots as below.")
                     for i in chosen_legendary_creature.get_runes().keys():
                         print("SLOT NUMBER #" + str(i))
@@ -4273,36 +5876,14 @@ def main():
 
                 # Allow the player to place a rune if there are legendary creatures in the legendary creature
                 # inventory.
-                if len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) > 0:
+                if new_game.player_data.legendary_creature_inventory.get_number_of_legendary_creatures() > 0:
                     print("Below is a list of legendary creatures you have.\n")
-                    curr_legendary_creature_index: int = 1  # initial value
-                    for legendary_creature in new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-                        print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                        print(str(legendary_creature) + "\n")
-                        curr_legendary_creature_index += 1
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature "
-                                                              "you want to place a rune on (1 - " +
-                                                              str(len(new_game.player_data.legendary_creature_inventory.
-                                                                      get_legendary_creatures())) + "): "))
-                    while legendary_creature_index < 1 or legendary_creature_index > \
-                            len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()):
-                        legendary_creature_index = int(input("Sorry, invalid input! Please enter the index of the "
-                                                             "legendary creature you want to place a rune on "
-                                                             "(1 - " +
-                                                             str(len(new_game.player_data.legendary_creature_inventory.
-                                                                     get_legendary_creatures())) + "): "))
-
                     chosen_legendary_creature: LegendaryCreature = \
-                        new_game.player_data.legendary_creature_inventory.get_legendary_creatures() \
-                            [legendary_creature_index - 1]
+                        choose_legendary_creature(new_game.player_data.legendary_creature_inventory, "place a rune on")
 
                     # Getting a list of runes which can be placed to the legendary creature
-                    runes: list = []  # initial value
-                    for item in new_game.player_data.item_inventory.get_items():
-                        if isinstance(item, Rune):
-                            if not item.already_placed:
-                                runes.append(item)
+                    runes: list = [rune for rune in new_game.player_data.item_inventory.get_items_of_type(Rune) if
+                                   not rune.already_placed]
 
                     print("Enter 'Y' for yes.")
                     print("Enter anything else for no.")
@@ -4332,13 +5913,7 @@ def main():
                 clear()
 
                 # Getting a list of training areas in the player's base
-                training_areas: list = []  # initial value
-                for island in new_game.player_data.player_base.get_islands():
-                    for x in range(island.ISLAND_WIDTH):
-                        for y in range(island.ISLAND_WIDTH):
-                            curr_tile: IslandTile = island.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, TrainingArea):
-                                training_areas.append(curr_tile.building)
+                training_areas: list = new_game.player_data.player_base.get_buildings(TrainingArea)
 
                 # If there are training areas, ask the player which training area he/she wants to manage.
                 if len(training_areas) > 0:
@@ -4362,12 +5937,8 @@ def main():
                     if len(chosen_training_area.get_legendary_creatures_placed()) < \
                             chosen_training_area.MAX_LEGENDARY_CREATURES:
                         # Printing a list of legendary creatures the player can add to the training area
-                        available_legendary_creatures: list = []  # initial value
-                        for legendary_creature in new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-                            if legendary_creature not in new_game.player_data.battle_team.get_legendary_creatures() and \
-                                    not legendary_creature.placed_in_training_area:
-                                available_legendary_creatures.append(legendary_creature)
-
+                        available_legendary_creatures: list = new_game.player_data.legendary_creature_inventory. \
+                            find_legendary_creatures(placement="NONE")
                         if len(available_legendary_creatures) > 0:
                             print("Enter 'Y' for yes.")
                             print("Enter anything else for no.")
@@ -4375,23 +5946,9 @@ def main():
                                                                 "training area? ")
                             if add_legendary_creature == "Y":
                                 print("Below is a list of legendary creatures which you can add to the training area.")
-                                for legendary_creature in available_legendary_creatures:
-                                    print(str(legendary_creature) + "\n")
-
-                                legendary_creature_index: int = int(
-                                    input("Please enter the index of the legendary creature "
-                                          "you want to add to the training area (1 - " +
-                                          str(len(available_legendary_creatures)) + "): "))
-                                while legendary_creature_index < 1 or legendary_creature_index > \
-                                        len(available_legendary_creatures):
-                                    legendary_creature_index = int(
-                                        input("Sorry, invalid input! Please enter the index of the "
-                                              "legendary creature you want to add to the training "
-                                              "area (1 - " +
-                                              str(len(available_legendary_creatures)) + "): "))
-
                                 legendary_creature_to_add: LegendaryCreature = \
-                                    available_legendary_creatures[legendary_creature_index - 1]
+                                    choose_legendary_creature(new_game.player_data.legendary_creature_inventory,
+                                                              "add to the training area", "NONE")
                                 new_game.player_data.add_legendary_creature_to_training_area(legendary_creature_to_add,
                                                                                              chosen_training_area)
 
@@ -4433,13 +5990,7 @@ def main():
                 clear()
 
                 # Getting a list of power-up circles in the player's base
-                power_up_circles: list = []  # initial value
-                for island in new_game.player_data.player_base.get_islands():
-                    for x in range(island.ISLAND_WIDTH):
-                        for y in range(island.ISLAND_WIDTH):
-                            curr_tile: IslandTile = island.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, PowerUpCircle):
-                                power_up_circles.append(curr_tile.building)
+                power_up_circles: list = new_game.player_data.player_base.get_buildings(PowerUpCircle)
 
                 # If there are power up circles, ask the player which power-up circle he/she wants to use
                 if len(power_up_circles) > 0:
@@ -4461,77 +6012,36 @@ def main():
 
                     # Ask the player to choose the legendary creature to be evolved and the materials used if
                     # possible
-                    if len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) > 0:
-                        # Printing all the legendary creatures the player has.
-                        for legendary_creature in \
-                                new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-                            print(str(legendary_creature) + "\n")
-
+                    if new_game.player_data.legendary_creature_inventory.get_number_of_legendary_creatures() > 0:
                         # Ask the player to choose the legendary creature to be evolved
-                        to_be_evolved_index: int = int(input("Please enter the index of the legendary creature "
-                                                             "you want to evolve (1 - " +
-                                                             str(len(new_game.
-                                                                     player_data.legendary_creature_inventory.get_legendary_creatures())) +
-                                                             "): "))
-                        while to_be_evolved_index < 1 or to_be_evolved_index > \
-                                len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()):
-                            to_be_evolved_index = int(
-                                input("Sorry, invalid input! Please enter the index of the legendary creature "
-                                      "you want to evolve (1 - " +
-                                      str(len(new_game.
-                                              player_data.legendary_creature_inventory.get_legendary_creatures())) +
-                                      "): "))
-
-                        to_be_evolved: LegendaryCreature = new_game.player_data.legendary_creature_inventory. \
-                            get_legendary_creatures()[to_be_evolved_index - 1]
+                        to_be_evolved: LegendaryCreature = \
+                            choose_legendary_creature(new_game.player_data.legendary_creature_inventory, "evolve")
 
                         materials_to_use: list = []
                         num_materials: int = int(input("How many material legendary creatures do you want to place "
                                                        "(0-" +
                                                        str(min(5,
-                                                               len(new_game.player_data.legendary_creature_inventory.
-                                                                   get_legendary_creatures()))) +
+                                                               new_game.player_data.legendary_creature_inventory.
+                                                               get_number_of_legendary_creatures())) +
                                                        "_: "))
 
                         while num_materials < 0 or num_materials > 5 or num_materials > \
-                                len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) - 1:
+                                new_game.player_data.legendary_creature_inventory.get_number_of_legendary_creatures() - 1:
                             num_materials = int(input("Sorry, invalid input! How many material legendary creatures do "
                                                       "you want to place "
                                                       "(0-" +
                                                       str(min(5,
-                                                              len(new_game.player_data.legendary_creature_inventory.
-                                                                  get_legendary_creatures()))) +
+                                                              new_game.player_data.legendary_creature_inventory.
+                                                              get_number_of_legendary_creatures())) +
                                                       "_: "))
 
-                        legendary_creature_options: list = new_game.player_data.legendary_creature_inventory. \
-                            get_legendary_creatures()
-                        legendary_creature_options.remove(to_be_evolved)
                         for i in range(num_materials):
                             print("Below is a list of legendary creatures you can choose as a material.\n")
-                            curr_legendary_creature_index: int = 1  # initial value
-                            for legendary_creature in legendary_creature_options:
-                                print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                                print(str(legendary_creature) + "\n")
-                                curr_legendary_creature_index += 1
-
-                            chosen_legendary_creature_index: int = int(input("Please enter the index of the legendary "
-                                                                             "creature you want to use as a material "
-                                                                             "(1 - " +
-                                                                             str(len(legendary_creature_options)) +
-                                                                             ": "))
-                            while chosen_legendary_creature_index < 1 or chosen_legendary_creature_index > \
-                                    len(legendary_creature_options):
-                                chosen_legendary_creature_index = int(
-                                    input("Sorry, invalid input! Please enter the index of the legendary "
-                                          "creature you want to use as a material "
-                                          "(1 - " +
-                                          str(len(legendary_creature_options)) +
-                                          ": "))
-
-                            chosen_material: LegendaryCreature = legendary_creature_options \
-                                [chosen_legendary_creature_index - 1]
+                            chosen_material: LegendaryCreature = \
+                                choose_legendary_creature(new_game.player_data.legendary_creature_inventory,
+                                                          "use as a material",
+                                                          excluded_legendary_creatures=[to_be_evolved] + materials_to_use)
                             materials_to_use.append(chosen_material)
-                            legendary_creature_options.remove(chosen_material)
 
                         new_game.player_data.evolve_legendary_creature(to_be_evolved, materials_to_use,
                                                                        chosen_power_up_circle)
@@ -4541,13 +6051,7 @@ def main():
                 clear()
 
                 # Getting a list of power-up circles in the player's base
-                power_up_circles: list = []  # initial value
-                for island in new_game.player_data.player_base.get_islands():
-                    for x in range(island.ISLAND_WIDTH):
-                        for y in range(island.ISLAND_WIDTH):
-                            curr_tile: IslandTile = island.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, PowerUpCircle):
-                                power_up_circles.append(curr_tile.building)
+                power_up_circles: list = new_game.player_data.player_base.get_buildings(PowerUpCircle)
 
                 # If there are power up circles, ask the player which power-up circle he/she wants to use
                 if len(power_up_circles) > 0:
@@ -4569,80 +6073,36 @@ def main():
 
                     # Ask the player to choose the legendary creature to be powered up and the materials used if
                     # possible
-                    if len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) > 0:
-                        # Printing all the legendary creatures the player has.
-                        curr_legendary_creature_index: int = 1  # initial value
-                        for legendary_creature in \
-                                new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-                            print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                            print(str(legendary_creature) + "\n")
-                            curr_legendary_creature_index += 1
-
+                    if new_game.player_data.legendary_creature_inventory.get_number_of_legendary_creatures() > 0:
                         # Ask the player to choose the legendary creature to be powered up
-                        to_be_powered_up_index: int = int(input("Please enter the index of the legendary creature "
-                                                                "you want to power-up (1 - " +
-                                                                str(len(new_game.
-                                                                        player_data.legendary_creature_inventory.get_legendary_creatures())) +
-                                                                "): "))
-                        while to_be_powered_up_index < 1 or to_be_powered_up_index > \
-                                len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()):
-                            to_be_powered_up_index = int(
-                                input("Sorry, invalid input! Please enter the index of the legendary creature "
-                                      "you want to power-up (1 - " +
-                                      str(len(new_game.
-                                              player_data.legendary_creature_inventory.get_legendary_creatures())) +
-                                      "): "))
-
-                        to_be_powered_up: LegendaryCreature = new_game.player_data.legendary_creature_inventory. \
-                            get_legendary_creatures()[to_be_powered_up_index - 1]
+                        to_be_powered_up: LegendaryCreature = \
+                            choose_legendary_creature(new_game.player_data.legendary_creature_inventory, "power-up")
 
                         materials_to_use: list = []
                         num_materials: int = int(input("How many material legendary creatures do you want to place "
                                                        "(0-" +
                                                        str(min(5,
-                                                               len(new_game.player_data.legendary_creature_inventory.
-                                                                   get_legendary_creatures()))) +
+                                                               new_game.player_data.legendary_creature_inventory.
+                                                               get_number_of_legendary_creatures())) +
                                                        "_: "))
 
                         while num_materials < 0 or num_materials > 5 or num_materials > \
-                                len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) - 1:
+                                new_game.player_data.legendary_creature_inventory.get_number_of_legendary_creatures() - 1:
                             num_materials = int(input("Sorry, invalid input! How many material legendary creatures do "
                                                       "you want to place "
                                                       "(0-" +
                                                       str(min(5,
-                                                              len(new_game.player_data.legendary_creature_inventory.
-                                                                  get_legendary_creatures()))) +
+                                                              new_game.player_data.legendary_creature_inventory.
+                                                              get_number_of_legendary_creatures())) +
                                                       "_: "))
 
-                        legendary_creature_options: list = new_game.player_data.legendary_creature_inventory. \
-                            get_legendary_creatures()
-                        legendary_creature_options.remove(to_be_powered_up)
                         for i in range(num_materials):
                             print("Below is a list of legendary creatures you can choose as a material.\n")
-                            curr_legendary_creature_index: int = 1  # initial value
-                            for legendary_creature in legendary_creature_options:
-                                print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                                print(str(legendary_creature) + "\n")
-                                curr_legendary_creature_index += 1
-
-                            chosen_legendary_creature_index: int = int(input("Please enter the index of the legendary "
-                                                                             "creature you want to use as a material "
-                                                                             "(1 - " +
-                                                                             str(len(legendary_creature_options)) +
-                                                                             ": "))
-                            while chosen_legendary_creature_index < 1 or chosen_legendary_creature_index > \
-                                    len(legendary_creature_options):
-                                chosen_legendary_creature_index = int(
-                                    input("Sorry, invalid input! Please enter the index of the legendary "
-                                          "creature you want to use as a material "
-                                          "(1 - " +
-                                          str(len(legendary_creature_options)) +
-                                          ": "))
-
-                            chosen_material: LegendaryCreature = legendary_creature_options \
-                                [chosen_legendary_creature_index - 1]
+                            chosen_material: LegendaryCreature = \
+                                choose_legendary_creature(new_game.player_data.legendary_creature_inventory,
+                                                          "use as a material",
+                                                          excluded_legendary_creatures=[to_be_powered_up] + materials_to_use)
                             materials_to_use.append(chosen_material)
-                            legendary_creature_options.remove(chosen_material)
 
                         new_game.player_data.power_up_legendary_creature(to_be_powered_up, materials_to_use,
                                                                          chosen_power_up_circle)
@@ -4652,13 +6112,12 @@ def main():
                 clear()
 
                 # Getting a list of items which are not runes in the player's item inventory
-                non_rune_items: list = [item for item in new_game.player_data.item_inventory.get_items() if not
-                isinstance(item, Rune)]
+                non_rune_items: list = new_game.player_data.item_inventory.get_items_not_of_type(Rune)
 
                 # If non-rune items exist and there are legendary creatures in the legendary creature inventory, ask
                 # the player to choose which item is to be given to a legendary creature.
                 if len(non_rune_items) > 0 and \
-                        len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) > 0:
+                        new_game.player_data.legendary_creature_inventory.get_number_of_legendary_creatures() > 0:
                     print("Below is a list of non-rune items that you have.\n")
                     curr_item_index: int = 1  # initial value
                     for item in non_rune_items:
@@ -4675,28 +6134,9 @@ def main():
 
                     item_to_give: Item = non_rune_items[item_index - 1]
                     print("Below is a list of legendary creatures you have.\n")
-                    curr_legendary_creature_index: int = 1  # initial value
-                    for legendary_creature in new_game.player_data.legendary_creature_inventory. \
-                            get_legendary_creatures():
-                        print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                        print(str(legendary_creature) + "\n")
-                        curr_legendary_creature_index += 1
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature you "
-                                                              "want to give the item to (1 - " +
-                                                              str(len(new_game.player_data.legendary_creature_inventory.
-                                                                      get_legendary_creatures())) + "): "))
-                    while legendary_creature_index < 1 or legendary_creature_index > len(
-                            new_game.player_data.legendary_creature_inventory.
-                                    get_legendary_creatures()):
-                        legendary_creature_index = int(
-                            input("Sorry, invalid input! Please enter the index of the legendary creature you "
-                                  "want to give the item to (1 - " +
-                                  str(len(new_game.player_data.legendary_creature_inventory.
-                                          get_legendary_creatures())) + "): "))
-
-                    chosen_legendary_creature: LegendaryCreature = new_game.player_data.legendary_creature_inventory. \
-                        get_legendary_creatures()[legendary_creature_index - 1]
+                    chosen_legendary_creature: LegendaryCreature = \
+                        choose_legendary_creature(new_game.player_data.legendary_creature_inventory,
+                                                  "give the item to")
 
                     # Give the item to the chosen legendary creature
                     if new_game.player_data.give_item_to_legendary_creature(item_to_give, chosen_legendary_creature):
@@ -4711,19 +6151,10 @@ def main():
                 clear()
 
                 # Getting a list of summonhenges in the player's base
-                summonhenges: list = []  # initial value
-                for island in new_game.player_data.player_base.get_islands():
-                    for x in range(island.ISLAND_WIDTH):
-                        for y in range(island.ISLAND_WIDTH):
-                            curr_tile: IslandTile = island.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, Summonhenge):
-                                summonhenges.append(curr_tile.building)
+                summonhenges: list = new_game.player_data.player_base.get_buildings(Summonhenge)
 
                 # Getting a list of scrolls in the player's item inventory
-                scrolls: list = []  # initial value
-                for item in new_game.player_data.item_inventory.get_items():
-                    if isinstance(item, Scroll):
-                        scrolls.append(item)
+                scrolls: list = new_game.player_data.item_inventory.get_items_of_type(Scroll)
 
                 # If there are summonhenges and scrolls, ask the player which summonhenge and scroll he/she wants to use
                 if len(summonhenges) > 0 and len(scrolls) > 0:
@@ -4764,20 +6195,10 @@ def main():
                 clear()
 
                 # Getting a list of fusion centers in the player's base
-                fusion_centers: list = []  # initial value
-                for island in new_game.player_data.player_base.get_islands():
-                    for x in range(island.ISLAND_WIDTH):
-                        for y in range(island.ISLAND_WIDTH):
-                            curr_tile: IslandTile = island.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, FusionCenter):
-                                fusion_centers.append(curr_tile.building)
-
-                potential_material_legendary_creatures: list = [legendary_creature for legendary_creature in
-                                                                new_game.player_data.legendary_creature_inventory.
-                                                                    get_legendary_creatures() if legendary_creature not
-                                                                in new_game.player_data.battle_team.
-                                                                    get_legendary_creatures() and
-                                                                not legendary_creature.placed_in_training_area]
+                fusion_centers: list = new_game.player_data.player_base.get_buildings(FusionCenter)
+
+                potential_material_legendary_creatures: list = new_game.player_data.legendary_creature_inventory. \
+                    find_legendary_creatures(placement="NONE")
                 # If there are fusion centers and legendary creatures to choose from, ask the user to choose which
                 # fusion center to use.
                 if len(fusion_centers) > 0 and len(potential_material_legendary_creatures) > 0:
@@ -4866,13 +6287,7 @@ def main():
                 clear()
 
                 # Getting a list of temples of wishes in the player's base
-                temples_of_wishes: list = []  # initial value
-                for island in new_game.player_data.player_base.get_islands():
-                    for x in range(island.ISLAND_WIDTH):
-                        for y in range(island.ISLAND_WIDTH):
-                            curr_tile: IslandTile = island.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, TempleOfWishes):
-                                temples_of_wishes.append(curr_tile.building)
+                temples_of_wishes: list = new_game.player_data.player_base.get_buildings(TempleOfWishes)
 
                 # If there are temples of wishes, ask the player to choose which temple of wishes he/she wants to use
                 if len(temples_of_wishes) > 0:
@@ -4898,10 +6313,11 @@ def main():
             elif action == "MANAGE ITEM INVENTORY":
                 # Clearing up the command line window
                 clear()
-                if len(new_game.player_data.item_inventory.get_items()) > 0:
+                items: list = new_game.player_data.item_inventory.get_items()
+                if len(items) > 0:
                     print("Below is a list of items in your item inventory.\n")
                     curr_item_index: int = 1
-                    for item in new_game.player_data.item_inventory.get_items():
+                    for item in items:
                         print("ITEM #" + str(curr_item_index))
                         print(str(item) + "\n")
                         curr_item_index += 1
@@ -4911,23 +6327,19 @@ def main():
                     sell_item: str = input("Do you want to sell an item? ")
                     if sell_item == "Y":
                         item_index: int = int(input("Please enter the index of the item you want to sell (1 - " +
-                                                    str(len(new_game.player_data.item_inventory.get_items())) + "): "))
-                        while item_index < 1 or item_index > len(new_game.player_data.item_inventory.get_items()):
+                                                    str(len(items)) + "): "))
+                        while item_index < 1 or item_index > len(items):
                             item_index = int(input("Sorry, invalid input! Please enter the index of the item you "
-                                                   "want to sell (1 - " +
-                                                   str(len(new_game.player_data.item_inventory.get_items())) + "): "))
+                                                   "want to sell (1 - " + str(len(items)) + "): "))
 
-                        to_be_sold: Item = new_game.player_data.item_inventory.get_items()[item_index - 1]
+                        to_be_sold: Item = items[item_index - 1]
                         if new_game.player_data.sell_item(to_be_sold):
                             print("Congratulations! You have earned " + str(to_be_sold.sell_gold_gain) + " gold and " +
                                   str(to_be_sold.sell_gem_gain) + " gems for selling " + str(to_be_sold.name) + "!")
                         else:
                             print("Sorry! " + str(to_be_sold.name) + " cannot be sold!")
 
-                    runes: list = []  # initial value
-                    for item in new_game.player_data.item_inventory.get_items():
-                        if isinstance(item, Rune):
-                            runes.append(item)
+                    runes: list = new_game.player_data.item_inventory.get_items_of_type(Rune)
 
                     # Ask the player which rune to level up if there are runes in the item inventory
                     if len(runes) > 0:
@@ -4955,32 +6367,10 @@ def main():
             elif action == "MANAGE LEGENDARY CREATURE INVENTORY":
                 # Clearing up the command line window
                 clear()
-                if len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) > 0:
+                if new_game.player_data.legendary_creature_inventory.get_number_of_legendary_creatures() > 0:
                     print("Below is a list of legendary creatures in your legendary creature inventory.\n")
-                    curr_legendary_creature_index: int = 1  # initial value
-                    for legendary_creature in new_game.player_data.legendary_creature_inventory. \
-                            get_legendary_creatures():
-                        print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                        print(str(legendary_creature) + "\n")
-                        curr_legendary_creature_index += 1
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature "
-                                                              "you want to remove (1 - " +
-                                                              str(len(new_game.player_data.
-                                                                      legendary_creature_inventory.
-                                                                      get_legendary_creatures())) + "): "))
-                    while legendary_creature_index < 1 or legendary_creature_index > \
-                            len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()):
-                        legendary_creature_index = int(input("Sorry, invalid input! Please enter the "
-                                                             "index of the legendary creature "
-                                                             "you want to remove (1 - " +
-                                                             str(len(new_game.player_data.
-                                                                     legendary_creature_inventory.
-                                                                     get_legendary_creatures())) + "): "))
-
                     to_be_removed: LegendaryCreature = \
-                        new_game.player_data.legendary_creature_inventory.get_legendary_creatures() \
-                            [legendary_creature_index - 1]
+                        choose_legendary_creature(new_game.player_data.legendary_creature_inventory, "remove")
                     new_game.player_data.remove_legendary_creature(to_be_removed)
 
             elif action == "MANAGE BATTLE TEAM":
@@ -5020,36 +6410,14 @@ def main():
                         new_game.player_data.remove_legendary_creature_from_team(to_be_removed)
 
                 if len(new_game.player_data.battle_team.get_legendary_creatures()) < Team.MAX_LEGENDARY_CREATURES:
-                    print("Below is a list of legendary creatures you have.\n")
-                    current_legendary_creature_index: int = 1  # initial value
-                    for legendary_creature in new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-                        print("LEGENDARY CREATURE #" + str(current_legendary_creature_index))
-                        print(str(legendary_creature) + "\n")
-                        current_legendary_creature_index += 1
-
                     print("Enter 'Y' for yes.")
                     print("Enter anything else for no.")
                     add_legendary_creature: str = input("Do you want to add a legendary creature to your team? ")
                     if add_legendary_creature == "Y":
-                        legendary_creature_index: int = int(input("Please enter the index of the legendary "
-                                                                  "creature you want to add to your "
-                                                                  "battle team (1 - " +
-                                                                  str(len(new_game.player_data.
-                                                                          legendary_creature_inventory.
-                                                                          get_legendary_creatures())) + "): "))
-                        while legendary_creature_index < 1 or legendary_creature_index > \
-                                len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()):
-                            legendary_creature_index = int(input("Sorry, invalid input! Please enter the index "
-                                                                 "of the legendary "
-                                                                 "creature you want to add to your "
-                                                                 "battle team (1 - " +
-                                                                 str(len(new_game.player_data.
-                                                                         legendary_creature_inventory.
-                                                                         get_legendary_creatures())) + "): "))
-
+                        print("Below is a list of legendary creatures you have.\n")
                         to_be_added: LegendaryCreature = \
-                            new_game.player_data.legendary_creature_inventory.get_legendary_creatures() \
-                                [legendary_creature_index - 1]
+                            choose_legendary_creature(new_game.player_data.legendary_creature_inventory,
+                                                      "add to your battle team")
                         new_game.player_data.add_legendary_creature_to_team(to_be_added)
 
             elif action == "MANAGE PLAYER BASE":
@@ -5125,7 +6493,7 @@ def main():
 
                                 to_build: Building = building_shop.get_buildings_sold()[building_index - 1]
                                 if new_game.player_data.build_at_island_tile(chosen_island_index - 1, tile_x, tile_y,
-                                                                             to_build):
+                                                                             to_build.clone()):
                                     print("You have successfully built " + str(to_build.name) + "!")
                                 else:
                                     print("Sorry, you cannot build " + str(to_build.name) + "!")
@@ -5209,6 +6577,7 @@ def main():
                         print("--------------------STAGE #" + str(curr_stage_number + 1) + "--------------------")
                         curr_battle: Battle = Battle(new_game.player_data.battle_team,
                                                      Team(current_stage.get_enemies_list()))
+                        curr_battle.start()
                         while curr_battle.winner is None:
                             # Printing out the stats of legendary creatures in both teams
                             print("Below are the stats of all legendary creatures in player's team.\n")
@@ -5221,6 +6590,9 @@ def main():
 
                             # Make a legendary creature move
                             curr_battle.get_someone_to_move()
+                            if curr_battle.winner is not None:
+                                break
+
                             assert isinstance(curr_battle.whose_turn, LegendaryCreature), "Cannot proceed with battle!"
 
                             if not curr_battle.whose_turn.can_move:
@@ -5229,6 +6601,9 @@ def main():
 
                                 # Make another legendary creature move
                                 curr_battle.get_someone_to_move()
+                                if curr_battle.winner is not None:
+                                    break
+
                                 assert isinstance(curr_battle.whose_turn, LegendaryCreature), \
                                     "Cannot proceed with battle!"
 
@@ -5271,7 +6646,7 @@ def main():
                                                                 str(len(usable_skills)) + "): "))
 
                                     skill_to_use: ActiveSkill = usable_skills[skill_index - 1]
-                                    if skill_to_use.active_skill_type == "ATTACK":
+                                    if skill_to_use.active_skill_type == ActiveSkillType.ATTACK:
                                         # Asking the user to select a target
                                         print("Below is a list of enemies you can attack.")
                                         enemy_index: int = 1  # initial value
@@ -5302,7 +6677,7 @@ def main():
                                                 chosen_enemy_target.counterattack_chance_up:
                                             chosen_enemy_target.counterattack(curr_battle.whose_turn)
 
-                                    elif skill_to_use.active_skill_type == "HEAL":
+                                    elif skill_to_use.active_skill_type == ActiveSkillType.HEAL:
                                         # Asking the user to select who to heal
                                         print("Below is a list of allies you can heal.")
                                         ally_index: int = 1  # initial value
@@ -5329,7 +6704,7 @@ def main():
                                             get_legendary_creatures()[chosen_ally_index - 1]
                                         curr_battle.whose_turn.have_turn(chosen_ally_target, skill_to_use,
                                                                          trainer_battle_action)
-                                    elif skill_to_use.active_skill_type == "ALLIES EFFECT":
+                                    elif skill_to_use.active_skill_type == ActiveSkillType.ALLIES_EFFECT:
                                         # Asking the user to select who to apply ally effect on
                                         print("Below is a list of allies you can apply ally effect on.")
                                         ally_index: int = 1  # initial value
@@ -5356,7 +6731,7 @@ def main():
                                             get_legendary_creatures()[chosen_ally_index - 1]
                                         curr_battle.whose_turn.have_turn(chosen_ally_target, skill_to_use,
                                                                          trainer_battle_action)
-                                    elif skill_to_use.active_skill_type == "ENEMIES EFFECT":
+                                    elif skill_to_use.active_skill_type == ActiveSkillType.ENEMIES_EFFECT:
                                         # Asking the user to select who to apply enemy effect on
                                         print("Below is a list of enemies you can apply enemy effect on.")
                                         enemy_index: int = 1  # initial value
@@ -5490,12 +6865,12 @@ def main():
                                     # A skill is used
                                     moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
                                     skill_to_use: ActiveSkill = usable_skills[random.randint(0, len(usable_skills) - 1)]
-                                    if skill_to_use.active_skill_type == "ATTACK" or \
-                                            skill_to_use.active_skill_type == "ENEMIES EFFECT":
+                                    if skill_to_use.active_skill_type == ActiveSkillType.ATTACK or \
+                                            skill_to_use.active_skill_type == ActiveSkillType.ENEMIES_EFFECT:
                                         target: LegendaryCreature = curr_battle.team1.get_legendary_creatures() \
                                             [random.randint(0, len(curr_battle.team1.get_legendary_creatures()) - 1)]
                                         moving_legendary_creature.have_turn(target, skill_to_use, trainer_battle_action)
-                                        if skill_to_use.active_skill_type == "ATTACK":
+                                        if skill_to_use.active_skill_type == ActiveSkillType.ATTACK:
                                             if random.random() < target.counterattack_chance + \
                                                     target.counterattack_chance_up:
                                                 target.counterattack(moving_legendary_creature)
@@ -5517,6 +6892,10 @@ def main():
                                 else:
                                     curr_battle.get_someone_to_move()
 
+                            # Checking whether either team has no legendary creatures alive left
+                            if curr_battle.winner is not None:
+                                break
+
                             # Recovering magic points
                             curr_battle.whose_turn.recover_magic_points()
 
@@ -5596,6 +6975,7 @@ def main():
                         print("--------------------STAGE #" + str(curr_stage_number + 1) + "--------------------")
                         curr_battle: Battle = Battle(new_game.player_data.battle_team,
                                                      Team(current_stage.get_enemies_list()))
+                        curr_battle.start()
                         while curr_battle.winner is None:
                             # Printing out the stats of legendary creatures in both teams
                             print("Below are the stats of all legendary creatures in player's team.\n")
@@ -5608,6 +6988,9 @@ def main():
 
                             # Make a legendary creature move
                             curr_battle.get_someone_to_move()
+                            if curr_battle.winner is not None:
+                                break
+
                             assert isinstance(curr_battle.whose_turn, LegendaryCreature), "Cannot proceed with battle!"
 
                             if not curr_battle.whose_turn.can_move:
@@ -5616,6 +6999,9 @@ def main():
 
                                 # Make another legendary creature move
                                 curr_battle.get_someone_to_move()
+                                if curr_battle.winner is not None:
+                                    break
+
                                 assert isinstance(curr_battle.whose_turn, LegendaryCreature), \
                                     "Cannot proceed with battle!"
 
@@ -5658,7 +7044,7 @@ def main():
                                                                 str(len(usable_skills)) + "): "))
 
                                     skill_to_use: ActiveSkill = usable_skills[skill_index - 1]
-                                    if skill_to_use.active_skill_type == "ATTACK":
+                                    if skill_to_use.active_skill_type == ActiveSkillType.ATTACK:
                                         # Asking the user to select a target
                                         print("Below is a list of enemies you can attack.")
                                         enemy_index: int = 1  # initial value
@@ -5689,7 +7075,7 @@ def main():
                                                 chosen_enemy_target.counterattack_chance_up:
                                             chosen_enemy_target.counterattack(curr_battle.whose_turn)
 
-                                    elif skill_to_use.active_skill_type == "HEAL":
+                                    elif skill_to_use.active_skill_type == ActiveSkillType.HEAL:
                                         # Asking the user to select who to heal
                                         print("Below is a list of allies you can heal.")
                                         ally_index: int = 1  # initial value
@@ -5716,7 +7102,7 @@ def main():
                                             get_legendary_creatures()[chosen_ally_index - 1]
                                         curr_battle.whose_turn.have_turn(chosen_ally_target, skill_to_use,
                                                                          trainer_battle_action)
-                                    elif skill_to_use.active_skill_type == "ALLIES EFFECT":
+                                    elif skill_to_use.active_skill_type == ActiveSkillType.ALLIES_EFFECT:
                                         # Asking the user to select who to apply ally effect on
                                         print("Below is a list of allies you can apply ally effect on.")
                                         ally_index: int = 1  # initial value
@@ -5743,7 +7129,7 @@ def main():
                                             get_legendary_creatures()[chosen_ally_index - 1]
                                         curr_battle.whose_turn.have_turn(chosen_ally_target, skill_to_use,
                                                                          trainer_battle_action)
-                                    elif skill_to_use.active_skill_type == "ENEMIES EFFECT":
+                                    elif skill_to_use.active_skill_type == ActiveSkillType.ENEMIES_EFFECT:
                                         # Asking the user to select who to apply enemy effect on
                                         print("Below is a list of enemies you can apply enemy effect on.")
                                         enemy_index: int = 1  # initial value
@@ -5877,12 +7263,12 @@ def main():
                                     # A skill is used
                                     moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
                                     skill_to_use: ActiveSkill = usable_skills[random.randint(0, len(usable_skills) - 1)]
-                                    if skill_to_use.active_skill_type == "ATTACK" or \
-                                            skill_to_use.active_skill_type == "ENEMIES EFFECT":
+                                    if skill_to_use.active_skill_type == ActiveSkillType.ATTACK or \
+                                            skill_to_use.active_skill_type == ActiveSkillType.ENEMIES_EFFECT:
                                         target: LegendaryCreature = curr_battle.team1.get_legendary_creatures() \
                                             [random.randint(0, len(curr_battle.team1.get_legendary_creatures()) - 1)]
                                         moving_legendary_creature.have_turn(target, skill_to_use, trainer_battle_action)
-                                        if skill_to_use.active_skill_type == "ATTACK":
+                                        if skill_to_use.active_skill_type == ActiveSkillType.ATTACK:
                                             if random.random() < target.counterattack_chance + \
                                                     target.counterattack_chance_up:
                                                 target.counterattack(moving_legendary_creature)
@@ -5904,6 +7290,10 @@ def main():
                                 else:
                                     curr_battle.get_someone_to_move()
 
+                            # Checking whether either team has no legendary creatures alive left
+                            if curr_battle.winner is not None:
+                                break
+
                             # Recovering magic points
                             curr_battle.whose_turn.recover_magic_points()
 
@@ -5960,6 +7350,7 @@ def main():
                     print("--------------------" + str(new_game.player_data.name) + " VS. " + str(chosen_cpu.name) +
                           "--------------------")
                     curr_battle: Battle = Battle(new_game.player_data.battle_team, chosen_cpu.battle_team)
+                    curr_battle.start()
                     while curr_battle.winner is None:
                         # Printing out the stats of legendary creatures in both teams
                         print("Below are the stats of all legendary creatures in player's team.\n")
@@ -5972,6 +7363,9 @@ def main():
 
                         # Make a legendary creature move
                         curr_battle.get_someone_to_move()
+                        if curr_battle.winner is not None:
+                            break
+
                         assert isinstance(curr_battle.whose_turn, LegendaryCreature), "Cannot proceed with battle!"
 
                         if not curr_battle.whose_turn.can_move:
@@ -5980,6 +7374,9 @@ def main():
 
                             # Make another legendary creature move
                             curr_battle.get_someone_to_move()
+                            if curr_battle.winner is not None:
+                                break
+
                             assert isinstance(curr_battle.whose_turn, LegendaryCreature), \
                                 "Cannot proceed with battle!"
 
@@ -6022,7 +7419,7 @@ def main():
                                                             str(len(usable_skills)) + "): "))
 
                                 skill_to_use: ActiveSkill = usable_skills[skill_index - 1]
-                                if skill_to_use.active_skill_type == "ATTACK":
+                                if skill_to_use.active_skill_type == ActiveSkillType.ATTACK:
                                     # Asking the user to select a target
                                     print("Below is a list of enemies you can attack.")
                                     enemy_index: int = 1  # initial value
@@ -6053,7 +7450,7 @@ def main():
                                             chosen_enemy_target.counterattack_chance_up:
                                         chosen_enemy_target.counterattack(curr_battle.whose_turn)
 
-                                elif skill_to_use.active_skill_type == "HEAL":
+                                elif skill_to_use.active_skill_type == ActiveSkillType.HEAL:
                                     # Asking the user to select who to heal
                                     print("Below is a list of allies you can heal.")
                                     ally_index: int = 1  # initial value
@@ -6080,7 +7477,7 @@ def main():
                                         get_legendary_creatures()[chosen_ally_index - 1]
                                     curr_battle.whose_turn.have_turn(chosen_ally_target, skill_to_use,
                                                                      trainer_battle_action)
-                                elif skill_to_use.active_skill_type == "ALLIES EFFECT":
+                                elif skill_to_use.active_skill_type == ActiveSkillType.ALLIES_EFFECT:
                                     # Asking the user to select who to apply ally effect on
                                     print("Below is a list of allies you can apply ally effect on.")
                                     ally_index: int = 1  # initial value
@@ -6107,7 +7504,7 @@ def main():
                                         get_legendary_creatures()[chosen_ally_index - 1]
                                     curr_battle.whose_turn.have_turn(chosen_ally_target, skill_to_use,
                                                                      trainer_battle_action)
-                                elif skill_to_use.active_skill_type == "ENEMIES EFFECT":
+                                elif skill_to_use.active_skill_type == ActiveSkillType.ENEMIES_EFFECT:
                                     # Asking the user to select who to apply enemy effect on
                                     print("Below is a list of enemies you can apply enemy effect on.")
                                     enemy_index: int = 1  # initial value
@@ -6241,12 +7638,12 @@ def main():
                                 # A skill is used
                                 moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
                                 skill_to_use: ActiveSkill = usable_skills[random.randint(0, len(usable_skills) - 1)]
-                                if skill_to_use.active_skill_type == "ATTACK" or \
-                                        skill_to_use.active_skill_type == "ENEMIES EFFECT":
+                                if skill_to_use.active_skill_type == ActiveSkillType.ATTACK or \
+                                        skill_to_use.active_skill_type == ActiveSkillType.ENEMIES_EFFECT:
                                     target: LegendaryCreature = curr_battle.team1.get_legendary_creatures() \
                                         [random.randint(0, len(curr_battle.team1.get_legendary_creatures()) - 1)]
                                     moving_legendary_creature.have_turn(target, skill_to_use, trainer_battle_action)
-                                    if skill_to_use.active_skill_type == "ATTACK":
+                                    if skill_to_use.active_skill_type == ActiveSkillType.ATTACK:
                                         if random.random() < target.counterattack_chance + \
                                                 target.counterattack_chance_up:
                                             target.counterattack(moving_legendary_creature)
@@ -6268,6 +7665,10 @@ def main():
                             else:
                                 curr_battle.get_someone_to_move()
 
+                        # Checking whether either team has no legendary creatures alive left
+                        if curr_battle.winner is not None:
+                            break
+
                         # Recovering magic points
                         curr_battle.whose_turn.recover_magic_points()
 
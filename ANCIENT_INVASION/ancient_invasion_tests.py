@@ -1,9 +1,18 @@
 import glob
+import itertools
 import unittest
 from unittest.mock import patch
 from ancient_invasion import *
 
 
+def new_test_legendary_creature(rating):
+    # type: (int) -> LegendaryCreature
+    return LegendaryCreature("Test Creature", "FIRE", rating, "NORMAL", mpf("4.95e4"), mpf("4.78e4"), mpf("9.33e3"),
+                             mpf("8.74e3"), mpf("109"), [], AwakenBonus(mpf("125"), mpf("125"), mpf("125"),
+                                                                         mpf("125"), mpf("0"), mpf("0.15"), mpf("0"),
+                                                                         mpf("0"), mpf("0"), None))
+
+
 class MyTestCase(unittest.TestCase):
     ################################################################################################################
     # Tests for user input to ensure that the game does not crash when the user input sequences as in the tests
@@ -243,6 +252,1013 @@ class MyTestCase(unittest.TestCase):
     def test_number_of_files(self):
         self.assertEquals(len([filename for filename in os.listdir(".") if filename[0:5] == "SAVED"]), 14)
 
+    ################################################################################################################
+    # Tests for strengthening enemies after a level is beaten
+    def test_strengthen_enemies_same_stats_as_repeated_level_ups(self):
+        for rating in [1, 3, 6]:
+            for times_beaten in range(4):
+                enemy: LegendaryCreature = new_test_legendary_creature(rating)
+                expected: LegendaryCreature = enemy.clone()
+                level: Level = Level("TEST LEVEL", [Stage([enemy])], Reward())
+                level.times_beaten = times_beaten
+                level.strengthen_enemies()
+                for i in range(2 ** times_beaten):
+                    expected.exp = expected.required_exp
+                    expected.level_up()
+
+                self.assertEqual(enemy.level, expected.level)
+                self.assertEqual(enemy.attack_speed, expected.attack_speed)
+                self.assertTrue(mp.almosteq(enemy.exp, expected.exp))
+                self.assertTrue(mp.almosteq(enemy.required_exp, expected.required_exp))
+                self.assertTrue(mp.almosteq(enemy.max_hp, expected.max_hp))
+                self.assertTrue(mp.almosteq(enemy.max_magic_points, expected.max_magic_points))
+                self.assertTrue(mp.almosteq(enemy.attack_power, expected.attack_power))
+                self.assertTrue(mp.almosteq(enemy.defense, expected.defense))
+
+    def test_strengthen_enemies_in_one_step(self):
+        # The work done to strengthen enemies must not grow with the number of times the level has been beaten
+        for times_beaten in [1, 10, 100, 1000]:
+            level: Level = Level("TEST LEVEL", [Stage([new_test_legendary_creature(6),
+                                                       new_test_legendary_creature(1)])], Reward())
+            level.times_beaten = times_beaten
+            with patch.object(LegendaryCreature, "level_up") as mocked_level_up, \
+                    patch.object(LegendaryCreature, "level_up_by", autospec=True,
+                                 side_effect=LegendaryCreature.level_up_by) as mocked_level_up_by:
+                level.strengthen_enemies()
+
+            mocked_level_up.assert_not_called()
+            self.assertEqual(mocked_level_up_by.call_count, 2)
+            self.assertEqual(level.get_stages()[0].get_enemies_list()[0].level, 1 + 2 ** times_beaten)
+
+    ################################################################################################################
+    # Tests for catching up on the progress made while the player was away
+    def test_level_ups_for_exp_same_as_repeated_level_ups(self):
+        for exp in [mpf("0"), mpf("99"), mpf("100"), mpf("1e3"), mpf("1e5"), mpf("1e50"), mpf("1e1000")]:
+            for max_level in [3, float('inf')]:
+                level: int = 1
+                required_exp: mpf = mpf("100")
+                while exp >= required_exp and level < max_level:
+                    level += 1
+                    required_exp *= mpf("10") ** level
+
+                self.assertEqual(level_ups_for_exp(1, exp, mpf("100"), max_level), level - 1)
+
+    def test_level_ups_for_exp_same_as_level_up(self):
+        legendary_creatures: list = [new_test_legendary_creature(rating) for rating in [1, 3, 6] for i in range(10)]
+        for i in range(len(legendary_creatures)):
+            legendary_creatures[i].exp = mpf("10") ** (i % 10)
+
+        for legendary_creature in legendary_creatures:
+            levels: int = level_ups_for_exp(legendary_creature.level, legendary_creature.exp,
+                                            legendary_creature.required_exp, legendary_creature.max_level)
+            old_level: int = legendary_creature.level
+            legendary_creature.level_up()
+            self.assertEqual(legendary_creature.level - old_level, levels)
+
+    def test_catch_up_after_a_week(self):
+        player: Player = Player("Test Player")
+        player.gold_per_second = mpf("2")
+        player.exp_per_second = mpf("1e3")
+        player.last_active_time = datetime(2021, 1, 1, 12)
+        temple_of_wishes: TempleOfWishes = TempleOfWishes(mpf("0"), mpf("0"), [])
+        player.build_at_island_tile(0, 0, 0, temple_of_wishes)
+        temple_of_wishes.already_reset = True
+        temple_of_wishes.wishes_left = 0
+        training_area: TrainingArea = TrainingArea(mpf("1e15"), mpf("0"))
+        player.gold = mpf("1e15")
+        player.build_at_island_tile(0, 9, 9, training_area)
+        legendary_creature: LegendaryCreature = new_test_legendary_creature(6)
+        player.add_legendary_creature(legendary_creature)
+        player.add_legendary_creature_to_training_area(legendary_creature, training_area)
+        old_gold: mpf = player.gold
+        with patch.object(LegendaryCreature, "level_up") as mocked_level_up, \
+                patch.object(LegendaryCreature, "level_up_by", autospec=True,
+                             side_effect=LegendaryCreature.level_up_by) as mocked_level_up_by:
+            player.catch_up(datetime(2021, 1, 8, 12))
+
+        # The legendary creature in the training area is levelled up once for the whole week
+        mocked_level_up.assert_not_called()
+        self.assertEqual(mocked_level_up_by.call_count, 1)
+        seconds: mpf = mpf(7 * 24 * 60 * 60)
+        self.assertEqual(player.gold, old_gold + 2 * seconds)
+        self.assertEqual(player.level, 1 + level_ups_for_exp(1, player.exp, mpf("1e6")))
+        self.assertEqual(legendary_creature.level, 1 + level_ups_for_exp(1, legendary_creature.exp, mpf("1e6")))
+        self.assertEqual(temple_of_wishes.wishes_left, 3)
+
+    def test_idle_legendary_creatures(self):
+        player: Player = Player("Test Player")
+        training_area: TrainingArea = TrainingArea(mpf("1e6"), mpf("0"))
+        player.build_at_island_tile(0, 0, 0, training_area)
+        legendary_creatures: list = [new_test_legendary_creature(3) for i in range(100)]
+        for legendary_creature in legendary_creatures:
+            player.add_legendary_creature(legendary_creature)
+
+        self.assertEqual(player.get_idle_legendary_creatures(), [])
+        player.add_legendary_creature_to_training_area(legendary_creatures[0], training_area)
+        player.add_legendary_creature_to_training_area(legendary_creatures[1], training_area)
+        self.assertEqual(player.get_idle_legendary_creatures(), legendary_creatures[0:2])
+        player.level_up_building_at_island_tile(0, 0, 0)
+        self.assertEqual(legendary_creatures[0].exp_per_second, training_area.legendary_creature_exp_per_second)
+        player.remove_legendary_creature_from_training_area(legendary_creatures[0], training_area)
+        self.assertEqual(legendary_creatures[0].exp_per_second, 0)
+        self.assertEqual(player.get_idle_legendary_creatures(), [legendary_creatures[1]])
+        player.gain_idle_progress(mpf("10"))
+        self.assertEqual(legendary_creatures[0].exp, 0)
+        self.assertEqual(legendary_creatures[1].exp, training_area.legendary_creature_exp_per_second * 10)
+        player.remove_building_from_island_tile(0, 0, 0)
+        self.assertEqual(legendary_creatures[1].exp_per_second, 0)
+        self.assertEqual(player.get_idle_legendary_creatures(), [])
+
+    def test_load_old_player(self):
+        player: Player = Player("Test Player")
+        player.gold = mpf("1e15")
+        temple_of_wishes: TempleOfWishes = TempleOfWishes(mpf("0"), mpf("0"), [])
+        player.build_at_island_tile(0, 0, 0, temple_of_wishes)
+        guardstone: Guardstone = Guardstone(mpf("0"), mpf("0"))
+        player.build_at_island_tile(0, 9, 0, guardstone)
+        training_area: TrainingArea = TrainingArea(mpf("1e6"), mpf("0"))
+        player.build_at_island_tile(0, 9, 9, training_area)
+        legendary_creature: LegendaryCreature = new_test_legendary_creature(6)
+        player.add_legendary_creature(legendary_creature)
+        player.add_legendary_creature_to_training_area(legendary_creature, training_area)
+
+        # Players saved by older versions of the game had none of the attributes below, and the bonuses from the
+        # buildings were added to the default values of their legendary creatures
+        state: dict = player.__dict__.copy()
+        for attribute in ["last_active_time", "scheduler", "building_bonuses", "_Player__idle_legendary_creatures"]:
+            del state[attribute]
+
+        legendary_creature.DEFAULT_DEFENSE_PERCENTAGE_UP = guardstone.legendary_creature_defense_percentage_up
+        old_player: Player = Player.__new__(Player)
+        old_player.__setstate__(state)
+        self.assertEqual(old_player.get_idle_legendary_creatures(), [legendary_creature])
+        self.assertEqual(old_player.building_bonuses.defense_percentage_up,
+                         guardstone.legendary_creature_defense_percentage_up)
+        self.assertIs(legendary_creature.building_bonuses, old_player.building_bonuses)
+        self.assertEqual(legendary_creature.DEFAULT_DEFENSE_PERCENTAGE_UP,
+                         LegendaryCreature.DEFAULT_DEFENSE_PERCENTAGE_UP)
+        self.assertEqual(old_player.scheduler.get_events()[0].owner, temple_of_wishes)
+
+        temple_of_wishes.already_reset = True
+        temple_of_wishes.wishes_left = 0
+        old_player.catch_up(old_player.last_active_time + timedelta(days=2))
+        self.assertEqual(temple_of_wishes.wishes_left, 3)
+
+    ################################################################################################################
+    # Tests for the item inventory
+    def test_item_inventory(self):
+        item_inventory: ItemInventory = ItemInventory()
+        runes: list = [Rune("RUNE", "A rune.", mpf("0"), mpf("0"), 1, slot_number, set_name, main_stat) for
+                       slot_number in range(1, 7) for set_name in ["ENERGY", "FATAL"] for main_stat in ["HP", "ATK"]]
+        scroll: Scroll = Scroll("UNKNOWN", "A scroll.", mpf("0"), mpf("0"), [])
+        shard: EXPShard = EXPShard(mpf("0"), mpf("0"), mpf("1e5"))
+        for item in runes + [scroll, shard]:
+            item_inventory.add_item(item)
+
+        item_inventory.add_item(scroll)
+        self.assertEqual(len(item_inventory.get_items()), len(runes) + 2)
+        self.assertEqual(item_inventory.get_items_of_type(Scroll), [scroll])
+        self.assertEqual(item_inventory.get_items_not_of_type(Rune), [scroll, shard])
+        self.assertEqual(item_inventory.get_items_of_type(Item), runes + [scroll, shard])
+        self.assertEqual(item_inventory.get_item(shard.item_id), shard)
+        self.assertEqual(item_inventory.get_runes(slot_number=2), [rune for rune in runes if rune.slot_number == 2])
+        self.assertEqual(item_inventory.get_runes(3, "FATAL", "ATK"), [rune for rune in runes if rune.slot_number == 3
+                                                                       and rune.set_name == "FATAL" and
+                                                                       rune.main_stat == "ATK"])
+        self.assertTrue(item_inventory.remove_item(runes[0]))
+        self.assertFalse(item_inventory.remove_item(runes[0]))
+        self.assertFalse(item_inventory.has_item(runes[0]))
+        self.assertNotIn(runes[0], item_inventory.get_runes(runes[0].slot_number, runes[0].set_name))
+
+        # Copies of an item are different items
+        copied_scroll: Scroll = scroll.clone()
+        self.assertNotEqual(copied_scroll.item_id, scroll.item_id)
+        self.assertFalse(item_inventory.has_item(copied_scroll))
+        item_inventory.add_item(copied_scroll)
+        self.assertEqual(item_inventory.get_items_of_type(Scroll), [scroll, copied_scroll])
+
+    def test_rune_scoring(self):
+        player: Player = Player("Test Player")
+        player.gold = mpf("1e100")
+        runes: list = [Rune("RUNE", "A rune.", mpf("1"), mpf("0"), 1, slot_number, set_name, main_stat) for
+                       slot_number in range(1, 4) for set_name in ["ENERGY", "BLADE"] for main_stat in
+                       ["HP%", "ATK%", "CR"]]
+        for rune in runes:
+            player.add_item_to_inventory(rune)
+
+        # Levelled up and sold runes change the stat vectors in the inventory
+        player.level_up_rune(runes[0])
+        player.level_up_rune(runes[4])
+        self.assertTrue(player.sell_item(runes[1]))
+        weights: dict = {"HP%": 1, "ATK%": 2, "CR": 100, "BLADE": 3}
+        expected_scores: dict = {rune: rune.stat_increase.max_hp_percentage_up +
+                                 2 * rune.stat_increase.attack_percentage_up + 100 * rune.stat_increase.crit_rate_up
+                                 + (3 if rune.set_name == "BLADE" else 0) for rune in runes if rune is not runes[1]}
+        rune_scores: list = player.item_inventory.score_runes(weights)
+        self.assertEqual(len(rune_scores), len(expected_scores))
+        for rune, score in rune_scores:
+            self.assertAlmostEqual(score, float(expected_scores[rune]))
+
+        self.assertEqual([score for rune, score in rune_scores], sorted([score for rune, score in rune_scores],
+                                                                        reverse=True))
+        self.assertEqual(sorted(player.item_inventory.filter_runes({"ATK%": 2, "BLADE": 1}), key=runes.index),
+                         [rune for rune in runes[2:] if rune.stat_increase.attack_percentage_up >= 2 and
+                          rune.set_name == "BLADE"])
+
+    def test_load_old_item_inventory(self):
+        # Inventories saved by older versions of the game keep a list of items without item IDs
+        items: list = [Rune("RUNE", "A rune.", mpf("1"), mpf("0"), 1, 2, "BLADE", "CR"),
+                       EXPShard(mpf("0"), mpf("0"), mpf("1e5"))]
+        for item in items:
+            del item.item_id
+
+        item_inventory: ItemInventory = ItemInventory.__new__(ItemInventory)
+        item_inventory.__setstate__({"_ItemInventory__items": items})
+        self.assertEqual(item_inventory.get_items(), items)
+        self.assertNotEqual(items[0].item_id, items[1].item_id)
+        self.assertIs(item_inventory.get_item(items[1].item_id), items[1])
+        self.assertEqual(item_inventory.get_items_of_type(Rune), [items[0]])
+        self.assertEqual(item_inventory.get_runes(slot_number=2, set_name="BLADE"), [items[0]])
+        self.assertEqual(item_inventory.filter_runes({"BLADE": 1}), [items[0]])
+        loaded_item_inventory: ItemInventory = pickle.loads(pickle.dumps(item_inventory))
+        self.assertEqual([item.item_id for item in loaded_item_inventory.get_items()],
+                         [item.item_id for item in items])
+
+        # An item bought more than once was saved as the same item several times, and each purchase is kept
+        shard: EXPShard = EXPShard(mpf("0"), mpf("0"), mpf("1e5"))
+        del shard.item_id
+        item_inventory = ItemInventory.__new__(ItemInventory)
+        item_inventory.__setstate__({"_ItemInventory__items": [shard, items[0], shard, shard]})
+        self.assertEqual(len(item_inventory.get_items()), 4)
+        self.assertEqual(len({item.item_id for item in item_inventory.get_items()}), 4)
+        self.assertIs(item_inventory.get_items()[0], shard)
+        self.assertEqual([item.exp_granted for item in item_inventory.get_items_of_type(EXPShard)], [mpf("1e5")] * 3)
+
+    ################################################################################################################
+    # Tests for the legendary creature inventory
+    def test_legendary_creature_inventory(self):
+        player: Player = Player("TEST")
+        legendary_creatures: list = [new_test_legendary_creature(rating) for rating in [1, 2, 3] for i in range(5)]
+        for legendary_creature in legendary_creatures:
+            player.add_legendary_creature(legendary_creature)
+
+        legendary_creature_inventory: LegendaryCreatureInventory = player.legendary_creature_inventory
+        legendary_creature_inventory.add_legendary_creature(legendary_creatures[0])
+        self.assertEqual(legendary_creature_inventory.get_legendary_creatures(), legendary_creatures)
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(rating=2), legendary_creatures[5:10])
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(name="Test Creature", element="WATER"),
+                         [])
+
+        # The indexes follow level ups and changes in placement made through the player
+        exp_shard: EXPShard = EXPShard(mpf("0"), mpf("0"), mpf("1e7"))
+        player.add_item_to_inventory(exp_shard)
+        self.assertTrue(player.give_item_to_legendary_creature(exp_shard, legendary_creatures[6]))
+        self.assertTrue(player.add_legendary_creature_to_team(legendary_creatures[7]))
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(level=legendary_creatures[6].level),
+                         [legendary_creatures[6]])
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(placement="TEAM"),
+                         [legendary_creatures[7]])
+        self.assertTrue(player.remove_legendary_creature_from_team(legendary_creatures[7]))
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(placement="TEAM"), [])
+
+        # Pages are numbered from 1 and sorted as requested
+        self.assertEqual(legendary_creature_inventory.get_number_of_pages(4), 4)
+        self.assertEqual(legendary_creature_inventory.get_page(2, 4), legendary_creatures[4:8])
+        self.assertEqual(legendary_creature_inventory.get_page(4, 4), legendary_creatures[12:])
+        self.assertEqual(legendary_creature_inventory.get_page(1, 3, "LEVEL", True)[0], legendary_creatures[6])
+        self.assertEqual(legendary_creature_inventory.get_page(2, 5, "RATING", True), legendary_creatures[5:10])
+        self.assertEqual(legendary_creature_inventory.get_page(5, 4), [])
+
+        # Copies of a legendary creature are different legendary creatures
+        self.assertTrue(player.remove_legendary_creature(legendary_creatures[0]))
+        self.assertFalse(legendary_creature_inventory.has_legendary_creature(legendary_creatures[0]))
+        self.assertNotEqual(legendary_creatures[0].clone().legendary_creature_id,
+                            legendary_creatures[0].legendary_creature_id)
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(rating=1), legendary_creatures[1:5])
+
+    def test_load_old_legendary_creature_inventory(self):
+        # Inventories saved by older versions of the game keep a list of legendary creatures without IDs
+        legendary_creatures: list = [new_test_legendary_creature(rating) for rating in [1, 2, 2]]
+        team: Team = Team([legendary_creatures[1]])
+        legendary_creatures[1].corresponding_team = team
+        legendary_creatures[2].placed_in_training_area = True
+        for legendary_creature in legendary_creatures:
+            del legendary_creature.legendary_creature_id
+
+        legendary_creature_inventory: LegendaryCreatureInventory = \
+            LegendaryCreatureInventory.__new__(LegendaryCreatureInventory)
+        legendary_creature_inventory.__setstate__(
+            {"_LegendaryCreatureInventory__legendary_creatures": legendary_creatures})
+        self.assertEqual(legendary_creature_inventory.get_legendary_creatures(), legendary_creatures)
+        self.assertEqual(len({legendary_creature.legendary_creature_id for legendary_creature in
+                              legendary_creatures}), 3)
+        self.assertTrue(legendary_creature_inventory.has_legendary_creature(legendary_creatures[0]))
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(rating=2), legendary_creatures[1:])
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(name="Test Creature", element="FIRE",
+                                                                               level=1), legendary_creatures)
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(placement="TEAM"),
+                         [legendary_creatures[1]])
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(placement="TRAINING AREA"),
+                         [legendary_creatures[2]])
+        self.assertEqual(legendary_creature_inventory.get_page(1, 2, "RATING", True), legendary_creatures[1:])
+
+        # A legendary creature summoned more than once was saved as the same legendary creature several times, and
+        # each copy is kept outside the team and the training area
+        legendary_creature_inventory = LegendaryCreatureInventory.__new__(LegendaryCreatureInventory)
+        legendary_creature_inventory.__setstate__(
+            {"_LegendaryCreatureInventory__legendary_creatures": [legendary_creatures[1], legendary_creatures[2],
+                                                                  legendary_creatures[1], legendary_creatures[2]]})
+        loaded_legendary_creatures: list = legendary_creature_inventory.get_legendary_creatures()
+        self.assertEqual(len(loaded_legendary_creatures), 4)
+        self.assertEqual(len({legendary_creature.legendary_creature_id for legendary_creature in
+                              loaded_legendary_creatures}), 4)
+        self.assertEqual(loaded_legendary_creatures[:2], legendary_creatures[1:])
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(placement="TEAM"),
+                         [legendary_creatures[1]])
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(placement="TRAINING AREA"),
+                         [legendary_creatures[2]])
+        self.assertEqual(legendary_creature_inventory.find_legendary_creatures(placement="NONE"),
+                         loaded_legendary_creatures[2:])
+        self.assertEqual(team.get_legendary_creatures(), [legendary_creatures[1]])
+
+    ################################################################################################################
+    # Tests for the rune sets of legendary creatures
+    def test_rune_sets(self):
+        legendary_creature: LegendaryCreature = new_test_legendary_creature(3)
+        original_max_hp: mpf = legendary_creature.max_hp
+        original_crit_rate: mpf = legendary_creature.crit_rate
+        runes: list = [Rune("RUNE", "A rune.", mpf("0"), mpf("0"), 1, slot_number, "ENERGY", "HP%") for slot_number in
+                       range(1, 6)] + [Rune("RUNE", "A rune.", mpf("0"), mpf("0"), 1, 6, "FATAL", "CR")]
+        for rune in runes:
+            self.assertTrue(legendary_creature.place_rune(rune))
+
+        # Each complete set activates its set effect once
+        self.assertEqual(legendary_creature.get_rune_set_counts(), {"ENERGY": 5, "FATAL": 1})
+        self.assertEqual(legendary_creature.get_active_rune_sets(), {"ENERGY": 2})
+        self.assertTrue(all(rune.set_effect_is_active for rune in runes[:5]))
+        self.assertFalse(runes[5].set_effect_is_active)
+        self.assertTrue(legendary_creature.remove_rune(1))
+        self.assertTrue(legendary_creature.remove_rune(2))
+        self.assertEqual(legendary_creature.get_active_rune_sets(), {"ENERGY": 1})
+        self.assertTrue(legendary_creature.remove_rune(3))
+        self.assertEqual(legendary_creature.get_active_rune_sets(), {"ENERGY": 1})
+        self.assertTrue(legendary_creature.remove_rune(4))
+        self.assertEqual(legendary_creature.get_active_rune_sets(), {})
+        self.assertFalse(any(rune.set_effect_is_active for rune in runes))
+
+        for slot_number in [5, 6]:
+            self.assertTrue(legendary_creature.remove_rune(slot_number))
+
+        self.assertEqual(legendary_creature.get_rune_set_counts(), {})
+        self.assertAlmostEqual(float(legendary_creature.max_hp), float(original_max_hp))
+        self.assertAlmostEqual(float(legendary_creature.crit_rate), float(original_crit_rate))
+
+    def test_stats_derived_from_runes(self):
+        legendary_creature: LegendaryCreature = new_test_legendary_creature(2)
+        runes: list = [Rune("RUNE", "A rune.", mpf("0"), mpf("0"), 1, 1, "ENERGY", "HP"),
+                       Rune("RUNE", "A rune.", mpf("0"), mpf("0"), 1, 2, "ENERGY", "HP%")]
+        for rune in runes:
+            legendary_creature.place_rune(rune)
+
+        # The runes stay placed while levelling up and the stats are derived from the base stats again
+        legendary_creature.exp = mpf("1e9")
+        legendary_creature.level_up()
+        self.assertGreater(legendary_creature.level, 1)
+        self.assertEqual(list(legendary_creature.get_runes().values()), runes)
+        hp_percentage_up: mpf = runes[1].stat_increase.max_hp_percentage_up + runes[0].set_effect.max_hp_percentage_up
+        self.assertEqual(legendary_creature.max_hp, legendary_creature.base_max_hp * (1 + hp_percentage_up / 100) +
+                         runes[0].stat_increase.max_hp_up)
+
+        # Removing the runes gives back the base stats exactly
+        legendary_creature.remove_rune(1)
+        legendary_creature.remove_rune(2)
+        self.assertEqual(legendary_creature.max_hp, legendary_creature.base_max_hp)
+        self.assertEqual(legendary_creature.get_active_rune_sets(), {})
+
+        # Evolving keeps the runes placed
+        legendary_creature.place_rune(runes[0])
+        legendary_creature.level_up_by(legendary_creature.max_level)
+        legendary_creature.exp = legendary_creature.required_exp
+        self.assertTrue(legendary_creature.evolve())
+        self.assertEqual(list(legendary_creature.get_runes().values()), [runes[0]])
+        self.assertEqual(legendary_creature.max_hp, legendary_creature.base_max_hp + runes[0].stat_increase.max_hp_up)
+
+    def test_load_old_legendary_creature(self):
+        # Legendary creatures saved by older versions of the game keep neither base stats nor rune totals
+        legendary_creature: LegendaryCreature = new_test_legendary_creature(3)
+        runes: list = [Rune("RUNE", "A rune.", mpf("0"), mpf("0"), 1, slot_number, "ENERGY", "HP%") for slot_number in
+                       range(1, 4)] + [Rune("RUNE", "A rune.", mpf("0"), mpf("0"), 1, 4, "FATAL", "CR")]
+        for rune in runes:
+            self.assertTrue(legendary_creature.place_rune(rune))
+
+        base_stats: dict = {attribute: value for attribute, value in vars(legendary_creature).items() if
+                            attribute.startswith("base_")}
+        state: dict = {attribute: value for attribute, value in vars(legendary_creature).items() if
+                       attribute not in base_stats.keys() and attribute not in
+                       ["_LegendaryCreature__rune_set_counts", "_LegendaryCreature__active_rune_sets",
+                        "_LegendaryCreature__rune_stat_increase", "_LegendaryCreature__rune_set_effect",
+                        "building_bonuses"]}
+        for rune in runes:
+            rune.set_effect_is_active = False
+
+        old_legendary_creature: LegendaryCreature = LegendaryCreature.__new__(LegendaryCreature)
+        old_legendary_creature.__setstate__(state)
+        self.assertEqual(old_legendary_creature.get_rune_set_counts(), {"ENERGY": 3, "FATAL": 1})
+        self.assertEqual(old_legendary_creature.get_active_rune_sets(), {"ENERGY": 1})
+        self.assertTrue(all(rune.set_effect_is_active for rune in runes[:3]))
+        self.assertFalse(runes[3].set_effect_is_active)
+        for attribute, value in base_stats.items():
+            self.assertAlmostEqual(float(getattr(old_legendary_creature, attribute)), float(value))
+
+        self.assertAlmostEqual(float(old_legendary_creature.max_hp), float(legendary_creature.max_hp))
+        self.assertAlmostEqual(float(old_legendary_creature.crit_rate), float(legendary_creature.crit_rate))
+        old_legendary_creature.restore()
+        self.assertEqual(old_legendary_creature.curr_hp, old_legendary_creature.max_hp)
+
+        # Removing the runes gives back the base stats
+        for slot_number in range(1, 5):
+            self.assertTrue(old_legendary_creature.remove_rune(slot_number))
+
+        self.assertEqual(old_legendary_creature.get_active_rune_sets(), {})
+        self.assertAlmostEqual(float(old_legendary_creature.max_hp), float(base_stats["base_max_hp"]))
+        self.assertAlmostEqual(float(old_legendary_creature.crit_rate), float(base_stats["base_crit_rate"]))
+
+    ################################################################################################################
+    # Tests for the rune optimizer and the rune upgrade calculator
+    def test_rune_optimizer(self):
+        player: Player = Player("Test Player")
+        legendary_creature: LegendaryCreature = new_test_legendary_creature(2)
+        main_stats: list = ["HP", "HP%", "ATK", "ATK%", "DEF", "DEF%", "SPD", "CR", "CD"]
+        set_names: list = ["ENERGY", "BLADE", "FATAL", "GUARD", "SWIFT", "RAGE"]
+        runes_by_slot: list = []
+        for slot_number in range(1, 7):
+            runes: list = [Rune("RUNE", "A rune.", mpf("0"), mpf("0"), 1, slot_number, set_names[(slot_number + i) % 6],
+                                main_stats[(slot_number * 2 + i) % 9]) for i in range(3)]
+            for rune in runes:
+                player.item_inventory.add_item(rune)
+
+            runes_by_slot.append(runes)
+
+        # A rune placed on another legendary creature is not used
+        other_rune: Rune = Rune("RUNE", "A rune.", mpf("0"), mpf("0"), 6, 1, "ENERGY", "HP")
+        player.item_inventory.add_item(other_rune)
+        new_test_legendary_creature(2).place_rune(other_rune)
+
+        skill: ActiveSkill = ActiveSkill("SKILL", "A skill.", "ATTACK", False, mpf("0"), 0,
+                                         DamageMultiplier(multiplier_to_self_attack_power=mpf("3.5"),
+                                                          multiplier_to_self_attack_speed=mpf("2")),
+                                         [], [], mpf("0"), mpf("0"), mpf("0"), False, False, False)
+        optimizer: RuneOptimizer = RuneOptimizer()
+        for objective, min_attack_speed in [("EFFECTIVE HP", mpf("0")), ("DAMAGE", mpf("0")),
+                                            ("DAMAGE", mpf("112"))]:
+            # Comparing with trying every loadout on the legendary creature itself
+            best_value: mpf or None = None
+            for runes in itertools.product(*runes_by_slot):
+                for rune in runes:
+                    legendary_creature.place_rune(rune)
+
+                value: mpf = optimizer.get_objective_value(legendary_creature, objective, skill)
+                if legendary_creature.attack_speed >= min_attack_speed and (best_value is None or value > best_value):
+                    best_value = value
+
+                for slot_number in range(1, 7):
+                    legendary_creature.remove_rune(slot_number)
+
+            loadout: dict = optimizer.optimize(player, legendary_creature, objective, skill,
+                                               min_attack_speed=min_attack_speed)
+            self.assertLess(optimizer.loadouts_searched, 1 + 3 + 9 + 27 + 81 + 243 + 729)
+
+            # The search split across worker processes finds a loadout as good
+            parallel_loadout: dict = optimizer.optimize(player, legendary_creature, objective, skill, workers=2,
+                                                        min_attack_speed=min_attack_speed)
+            for curr_loadout in [loadout, parallel_loadout]:
+                self.assertEqual(sorted(curr_loadout.keys()), [1, 2, 3, 4, 5, 6])
+                self.assertNotIn(other_rune, curr_loadout.values())
+                for rune in curr_loadout.values():
+                    legendary_creature.place_rune(rune)
+
+                self.assertAlmostEqual(float(optimizer.get_objective_value(legendary_creature, objective, skill)),
+                                       float(best_value))
+                self.assertGreaterEqual(legendary_creature.attack_speed, min_attack_speed)
+                for slot_number in range(1, 7):
+                    legendary_creature.remove_rune(slot_number)
+
+        self.assertEqual(optimizer.optimize(player, legendary_creature, "DAMAGE", skill,
+                                            min_attack_speed=mpf("1e6")), {})
+        self.assertEqual(optimizer.optimize(player, legendary_creature, "DAMAGE"), {})
+
+    def test_rune_upgrade_calculator(self):
+        calculator: RuneUpgradeCalculator = RuneUpgradeCalculator()
+        rune: Rune = Rune("RUNE", "A rune.", mpf("100"), mpf("0"), 2, 1, "ENERGY", "HP%")
+        self.assertEqual(calculator.calculate(rune, 1), {"EXPECTED GOLD COST": mpf("0"), "SUB-STATS": {(): mpf("1")},
+                                                         "STATS": {attribute: {getattr(rune.stat_increase,
+                                                                                       attribute): mpf("1")}
+                                                                   for attribute in
+                                                                   Rune.MAIN_STAT_ATTRIBUTES.values()}})
+
+        # Levelling up once always succeeds and rolls one of the potential main stats
+        outcome: dict = calculator.calculate(rune, 2)
+        self.assertEqual(outcome["EXPECTED GOLD COST"], mpf("100"))
+        self.assertEqual(len(outcome["SUB-STATS"]), len(Rune.POTENTIAL_MAIN_STATS))
+        self.assertAlmostEqual(float(outcome["SUB-STATS"][()]), 1 / 13)
+        self.assertAlmostEqual(float(outcome["SUB-STATS"][("ATK",)]), 1 / 13)
+        self.assertEqual(sorted(outcome["STATS"]["max_hp_percentage_up"].keys()), [mpf("6"), mpf("8")])
+        self.assertAlmostEqual(float(outcome["STATS"]["max_hp_percentage_up"][mpf("8")]), 1 / 13)
+        self.assertEqual(sorted(outcome["STATS"]["max_hp_up"].keys()), [mpf("0"), mpf("1e14")])
+
+        # Every attempt costs gold whether it succeeds or not
+        outcome = calculator.calculate(rune, 5)
+        self.assertAlmostEqual(float(outcome["EXPECTED GOLD COST"]),
+                               100 + 100 * 10 ** 4 / 0.95 + 100 * 10 ** 9 / 0.95 ** 2 + 100 * 10 ** 15 / 0.95 ** 3)
+        self.assertAlmostEqual(float(sum(outcome["SUB-STATS"].values())), 1)
+        self.assertTrue(all(len(sub_stats) <= 4 and "HP%" not in sub_stats for sub_stats in
+                            outcome["SUB-STATS"].keys()))
+        for attribute, distribution in outcome["STATS"].items():
+            self.assertAlmostEqual(float(sum(distribution.values())), 1)
+
+        # The expected stats are those of levelling up the rune many times
+        random.seed(0)
+        total_attack_percentage_up: mpf = mpf("0")
+        for i in range(2000):
+            copied_rune: Rune = rune.clone()
+            while copied_rune.level < 5:
+                copied_rune.level_up()
+
+            total_attack_percentage_up += copied_rune.stat_increase.attack_percentage_up
+
+        self.assertAlmostEqual(float(total_attack_percentage_up / 2000),
+                               float(sum(value * probability for value, probability in
+                                         outcome["STATS"]["attack_percentage_up"].items())), delta=0.15)
+
+    def test_level_up_runes(self):
+        player: Player = Player("Test Player")
+        player.gold = mpf("1e15")
+        legendary_creature: LegendaryCreature = new_test_legendary_creature(2)
+        player.add_legendary_creature(legendary_creature)
+        runes: list = [Rune("RUNE", "A rune.", mpf("1e3"), mpf("0"), 1, slot_number, "ENERGY", "HP") for
+                       slot_number in range(1, 4)]
+        for rune in runes:
+            player.add_item_to_inventory(rune)
+
+        self.assertTrue(player.place_rune_on_legendary_creature(legendary_creature, runes[0]))
+        self.assertEqual(player.get_legendary_creatures_with_runes(runes), {runes[0].item_id: legendary_creature})
+        random.seed(0)
+        summary: dict = player.level_up_runes(runes[:2], 4)
+        self.assertEqual(summary["RUNES AT TARGET LEVEL"], runes[:2])
+        self.assertEqual(summary["LEVEL UPS"], 6)
+        self.assertGreaterEqual(summary["ATTEMPTS"], 6)
+        self.assertEqual(summary["GOLD SPENT"], mpf("1e15") - player.gold)
+        self.assertEqual(summary["LEGENDARY CREATURES UPDATED"], [legendary_creature])
+        self.assertEqual(runes[2].level, 1)
+
+        # The stats of the legendary creature are derived from the levelled up rune
+        self.assertEqual(legendary_creature.max_hp, legendary_creature.base_max_hp *
+                         (1 + (runes[0].stat_increase.max_hp_percentage_up +
+                               legendary_creature.get_rune_set_counts()["ENERGY"] // 2 * mpf("15")) / 100) +
+                         runes[0].stat_increase.max_hp_up)
+        self.assertEqual(player.item_inventory.filter_runes({"HP": float(runes[1].stat_increase.max_hp_up)}),
+                         [rune for rune in runes if rune.stat_increase.max_hp_up >= runes[1].stat_increase.max_hp_up])
+
+        # No attempts are made which would leave less gold than required
+        player.gold = mpf("1e15")
+        summary = player.level_up_runes([runes[2]], 10, mpf("1e15") - mpf("1e3"))
+        self.assertEqual(summary["ATTEMPTS"], 1)
+        self.assertEqual(summary["RUNES AT TARGET LEVEL"], [])
+        self.assertEqual(player.gold, mpf("1e15") - mpf("1e3"))
+
+    ################################################################################################################
+    # Tests for the codes of the vocabularies of the game and the element matchups
+    def test_game_codes(self):
+        self.assertEqual(Element.get_code("WATER"), Element.WATER)
+        self.assertEqual(ActiveSkillType.get_code("ALLIES EFFECT"), ActiveSkillType.ALLIES_EFFECT)
+        self.assertIsNone(ActionName.get_code("JUMP"))
+        self.assertEqual(str(ActiveSkillType.ENEMIES_EFFECT), "ENEMIES EFFECT")
+        self.assertEqual(str(BeneficialEffectName.HEAL_OVER_TIME), "HEAL_OVER_TIME")
+        self.assertEqual("%s" % Element.DARK, "DARK")
+        legendary_creature: LegendaryCreature = new_test_legendary_creature(1)
+        self.assertEqual(legendary_creature.element, Element.FIRE)
+        self.assertEqual(HarmfulEffect("STUN", 1).name, HarmfulEffectName.STUN)
+        self.assertTrue(HarmfulEffect("STUN", 1).prevents_moves)
+
+        # Saved games from before the codes store the old string values
+        legendary_creature.element = "WIND"
+        effect: BeneficialEffect = BeneficialEffect("INCREASE_DEF", 2)
+        effect.name = "INCREASE_DEF"
+        skill: ActiveSkill = ActiveSkill("SKILL", "A skill.", "HEAL", True, mpf("0"), 0, DamageMultiplier(), [], [],
+                                         mpf("0"), mpf("0"), mpf("1e3"), False, False, False)
+        skill.active_skill_type = "HEAL"
+        action: Action = Action("USE SKILL")
+        action.name = "USE SKILL"
+        loaded_legendary_creature, loaded_effect, loaded_skill, loaded_action = \
+            pickle.loads(pickle.dumps([legendary_creature, effect, skill, action]))
+        self.assertIs(loaded_legendary_creature.element, Element.WIND)
+        self.assertIs(loaded_effect.name, BeneficialEffectName.INCREASE_DEF)
+        self.assertIs(loaded_skill.active_skill_type, ActiveSkillType.HEAL)
+        self.assertIs(loaded_action.name, ActionName.USE_SKILL)
+        self.assertEqual(loaded_skill.heal_amount_to_allies, mpf("1e3"))
+
+    def test_element_matchups(self):
+        advantages: list = [(Element.WATER, Element.FIRE), (Element.WIND, Element.WATER), (Element.FIRE, Element.WIND)]
+        for attacking_element in Element:
+            for defending_element in Element:
+                matchup: ElementMatchup = ELEMENT_MATCHUPS[attacking_element][defending_element]
+                self.assertEqual(matchup.has_advantage, (attacking_element, defending_element) in advantages)
+                self.assertEqual(matchup.has_disadvantage, (defending_element, attacking_element) in advantages)
+                self.assertEqual(glancing_hit_chance_by_elements(attacking_element, defending_element),
+                                 mpf("0.3") if matchup.has_disadvantage else mpf("0"))
+
+        water_creature: LegendaryCreature = new_test_legendary_creature(1)
+        water_creature.element = Element.WATER
+        fire_creature: LegendaryCreature = new_test_legendary_creature(1)
+        self.assertEqual(crushing_hit_chance_by_elements(water_creature, fire_creature),
+                         1 - (water_creature.crit_rate - fire_creature.crit_resist))
+        self.assertEqual(crushing_hit_chance_by_elements(fire_creature, water_creature), mpf("0"))
+        self.assertEqual(crushing_hit_chance_by_elements(fire_creature, fire_creature), mpf("0"))
+
+    ################################################################################################################
+    # Tests for skills and battles
+    def test_passive_skill_effect(self):
+        user: LegendaryCreature = new_test_legendary_creature(1)
+        user.add_skill(PassiveSkill("PASSIVE SKILL #1", "A passive skill.",
+                                    PassiveSkillEffect(crit_rate_up=mpf("0.1"), allies_attack_gauge_up=mpf("10"),
+                                                       heal_amount_to_allies=mpf("100"),
+                                                       beneficial_effects_to_allies=[BeneficialEffect("SHIELD", 2)],
+                                                       harmful_effects_to_enemies=[])))
+        user.add_skill(PassiveSkill("PASSIVE SKILL #2", "A passive skill.",
+                                    PassiveSkillEffect(crit_rate_up=mpf("0.05"), allies_attack_gauge_up=mpf("5"),
+                                                       beneficial_effects_to_allies=[],
+                                                       harmful_effects_to_enemies=[HarmfulEffect("BRAND", 2)])))
+        passive_skill_effect: PassiveSkillEffect = user.get_passive_skill_effect()
+        self.assertAlmostEqual(float(passive_skill_effect.crit_rate_up), 0.15)
+        self.assertEqual(passive_skill_effect.allies_attack_gauge_up, mpf("15"))
+        self.assertEqual([effect.name for effect in passive_skill_effect.get_beneficial_effects_to_allies()],
+                         [BeneficialEffectName.SHIELD])
+        self.assertEqual([effect.name for effect in passive_skill_effect.get_harmful_effects_to_enemies()],
+                         [HarmfulEffectName.BRAND])
+
+        # The passive skills of the user affect its allies once per AoE skill used, whatever the number of enemies
+        ally: LegendaryCreature = new_test_legendary_creature(1)
+        allies: Team = Team([user, ally])
+        enemies: Team = Team([new_test_legendary_creature(1), new_test_legendary_creature(1)])
+        for team in [allies, enemies]:
+            for legendary_creature in team.get_legendary_creatures():
+                legendary_creature.corresponding_team = team
+
+        ally.curr_hp -= mpf("1000")
+        skill: ActiveSkill = ActiveSkill("SKILL", "A skill.", "ATTACK", True, mpf("0"), 0, DamageMultiplier(), [], [],
+                                         mpf("0"), mpf("0"), mpf("0"), False, False, False)
+        self.assertTrue(Action("USE SKILL").execute(user, enemies.get_legendary_creatures()[0], skill))
+        self.assertEqual(ally.attack_gauge, ally.MIN_ATTACK_GAUGE + mpf("15"))
+        self.assertEqual(ally.curr_hp, ally.max_hp - mpf("900"))
+        self.assertEqual(user.attack_gauge, user.MIN_ATTACK_GAUGE + mpf("15"))
+
+    def test_battle_start(self):
+        leader: LegendaryCreature = new_test_legendary_creature(1)
+        leader.add_skill(LeaderSkill("LEADER SKILL #1", "A leader skill.", mpf("0"),
+                                     LeaderSkillEffect(max_hp_percentage_up=mpf("20"), crit_rate_up=mpf("0.1"))))
+        leader.add_skill(LeaderSkill("LEADER SKILL #2", "A leader skill.", mpf("0"),
+                                     LeaderSkillEffect(max_hp_percentage_up=mpf("10"))))
+        leader_skill_effect: LeaderSkillEffect = leader.get_leader_skill_effect()
+        self.assertEqual(leader_skill_effect.max_hp_percentage_up, mpf("30"))
+        self.assertEqual(leader_skill_effect.crit_rate_up, mpf("0.1"))
+
+        ally: LegendaryCreature = new_test_legendary_creature(1)
+        enemy: LegendaryCreature = new_test_legendary_creature(1)
+        battle: Battle = Battle(Team([leader, ally]), Team([enemy]))
+        max_hp_percentage_up: mpf = ally.max_hp_percentage_up
+        self.assertTrue(battle.start())
+        self.assertFalse(battle.start())
+        for legendary_creature in [leader, ally]:
+            self.assertEqual(legendary_creature.max_hp_percentage_up, max_hp_percentage_up + mpf("30"))
+            self.assertEqual(legendary_creature.curr_hp,
+                             legendary_creature.max_hp * (1 + legendary_creature.max_hp_percentage_up / 100))
+
+        self.assertEqual(enemy.max_hp_percentage_up, max_hp_percentage_up)
+        ally.restore()
+        self.assertEqual(ally.max_hp_percentage_up, max_hp_percentage_up)
+        self.assertEqual(ally.curr_hp, ally.max_hp * (1 + max_hp_percentage_up / 100))
+
+    def test_battle_alive_counts(self):
+        team1: Team = Team([new_test_legendary_creature(1), new_test_legendary_creature(1)])
+        team2: Team = Team([new_test_legendary_creature(1)])
+        battle: Battle = Battle(team1, team2)
+        self.assertEqual(battle.get_alive_count(team1), 2)
+        self.assertEqual(battle.get_alive_count(team2), 1)
+        self.assertIsNone(battle.winner)
+
+        # Dead legendary creatures are not scheduled to move
+        dead_legendary_creature: LegendaryCreature = team1.get_legendary_creatures()[0]
+        dead_legendary_creature.curr_hp = mpf("0")
+        battle.get_someone_to_move()
+        self.assertEqual(battle.get_alive_count(team1), 1)
+        self.assertIsNone(battle.winner)
+        self.assertIsNot(battle.whose_turn, dead_legendary_creature)
+        self.assertEqual(dead_legendary_creature.attack_gauge, dead_legendary_creature.MIN_ATTACK_GAUGE)
+
+        # The counts change as soon as HP crosses zero, without scanning the teams
+        dead_legendary_creature.curr_hp = mpf("1")
+        self.assertEqual(battle.get_alive_count(team1), 2)
+        dead_legendary_creature.curr_hp -= mpf("1")
+        dead_legendary_creature.curr_hp -= mpf("1")
+        self.assertEqual(battle.get_alive_count(team1), 1)
+        self.assertNotIn("Battle", str(dead_legendary_creature))
+
+        # Copies of the battle count HP changes of their own legendary creatures
+        battle_copy: Battle = battle.clone()
+        battle_copy.team2.get_legendary_creatures()[0].curr_hp = mpf("0")
+        self.assertEqual(battle_copy.winner, battle_copy.team1)
+        self.assertIsNone(battle.winner)
+
+        # Nobody moves once the battle has a winner
+        with patch.object(Battle, "get_alive_legendary_creatures") as get_alive_legendary_creatures:
+            team2.get_legendary_creatures()[0].curr_hp = mpf("0")
+            self.assertEqual(battle.get_alive_count(team2), 0)
+            self.assertEqual(battle.winner, team1)
+            battle.get_someone_to_move()
+
+        get_alive_legendary_creatures.assert_not_called()
+        self.assertIsNone(battle.whose_turn)
+
+        # Healing after the battle is over no longer changes its counts
+        team1.recover_all()
+        self.assertEqual(battle.get_alive_count(team1), 1)
+        self.assertEqual(pickle.loads(pickle.dumps(team1)).get_legendary_creatures()[0].curr_hp,
+                         dead_legendary_creature.curr_hp)
+
+    ################################################################################################################
+    # Tests for the index of buildings in the player's base
+    def test_building_locations(self):
+        player: Player = Player("Test Player")
+        player.gold = mpf("1e10")
+        player.add_island_to_player_base()
+        summonhenge: Summonhenge = Summonhenge(mpf("0"), mpf("0"))
+        other_summonhenge: Summonhenge = Summonhenge(mpf("0"), mpf("0"))
+        self.assertFalse(player.player_base.has_building(summonhenge))
+        self.assertTrue(player.build_at_island_tile(0, 9, 0, summonhenge))
+        self.assertTrue(player.build_at_island_tile(1, 0, 9, other_summonhenge))
+        self.assertFalse(player.build_at_island_tile(1, 0, 9, summonhenge))
+        self.assertEqual(player.player_base.get_buildings(Summonhenge), [summonhenge, other_summonhenge])
+        self.assertEqual(player.player_base.get_building_location(other_summonhenge), (1, 0, 9))
+        self.assertTrue(player.remove_building_from_island_tile(0, 9, 0))
+        self.assertFalse(player.player_base.has_building(summonhenge))
+        self.assertEqual(player.player_base.get_buildings(Summonhenge), [other_summonhenge])
+
+    def test_manage_player_base(self):
+        player: Player = Player("Test Player")
+        gold_mine: GoldMine = GoldMine(mpf("1e5"), mpf("0"))
+        operations: list = [BaseOperation("BUILD", 0, 0, 0, gold_mine), BaseOperation("LEVEL UP", 0, 0, 0),
+                            BaseOperation("LEVEL UP", 0, 0, 0), BaseOperation("BUILD", 0, 9, 9, Tree(mpf("0"), mpf("0"))),
+                            BaseOperation("REMOVE", 0, 9, 9)]
+
+        # Levelling up the gold mine costs 1e5 gold and then 1e5 * 10 ** 2 gold
+        player.gold = mpf("1e5") + mpf("1e5") + mpf("1e7") - 1
+        self.assertFalse(player.manage_player_base(operations))
+        self.assertTrue(all(operation.succeeded for operation in operations))
+        self.assertIsNone(player.player_base.get_islands()[0].get_tile_at(0, 0).building)
+        player.gold += 1
+        self.assertTrue(player.manage_player_base(operations))
+        self.assertEqual(gold_mine.level, 3)
+        self.assertIs(player.player_base.get_islands()[0].get_tile_at(0, 0).building, gold_mine)
+        self.assertIsNone(player.player_base.get_islands()[0].get_tile_at(9, 9).building)
+        self.assertEqual(player.player_base.get_buildings(GoldMine), [gold_mine])
+
+        # Nothing is applied if any operation is invalid
+        operations = [BaseOperation("REMOVE", 0, 0, 0), BaseOperation("BUILD", 0, 9, 0, Tree(mpf("0"), mpf("0"))),
+                      BaseOperation("LEVEL UP", 0, 0, 0), BaseOperation("BUILD", 1, 0, 0, Tree(mpf("0"), mpf("0")))]
+        self.assertFalse(player.manage_player_base(operations))
+        self.assertEqual([operation.succeeded for operation in operations], [True, True, False, False])
+        self.assertIs(player.player_base.get_islands()[0].get_tile_at(0, 0).building, gold_mine)
+        self.assertIsNone(player.player_base.get_islands()[0].get_tile_at(9, 0).building)
+
+        # A building cannot be built on two tiles, and only buildings which change when levelled up can be levelled up
+        other_gold_mine: GoldMine = GoldMine(mpf("0"), mpf("0"))
+        operations = [BaseOperation("BUILD", 0, 9, 0, other_gold_mine),
+                      BaseOperation("BUILD", 0, 0, 9, other_gold_mine), BaseOperation("BUILD", 0, 9, 9, gold_mine)]
+        self.assertFalse(player.manage_player_base(operations))
+        self.assertEqual([operation.succeeded for operation in operations], [True, False, False])
+        tree: Tree = Tree(mpf("0"), mpf("0"))
+        player.build_at_island_tile(0, 9, 0, tree)
+        obstacle_x, obstacle_y = player.player_base.get_islands()[0].get_building_tiles(Obstacle)[0]
+        operations = [BaseOperation("LEVEL UP", 0, 9, 0), BaseOperation("LEVEL UP", 0, obstacle_x, obstacle_y)]
+        self.assertFalse(player.manage_player_base(operations))
+        self.assertEqual([operation.succeeded for operation in operations], [False, False])
+
+        # Valid operations are applied without checking each of them again and without copying any building
+        player.gold = mpf("1e20")
+        operations = [BaseOperation("BUILD", 0, 0, 9, other_gold_mine), BaseOperation("LEVEL UP", 0, 0, 9),
+                      BaseOperation("LEVEL UP", 0, 0, 9), BaseOperation("REMOVE", 0, 9, 0)]
+        with patch.object(Player, "build_at_island_tile") as build_at_island_tile, \
+                patch.object(Player, "level_up_building_at_island_tile") as level_up_building_at_island_tile, \
+                patch.object(Player, "remove_building_from_island_tile") as remove_building_from_island_tile, \
+                patch.object(Building, "clone") as clone:
+            self.assertTrue(player.manage_player_base(operations))
+
+        for method in [build_at_island_tile, level_up_building_at_island_tile, remove_building_from_island_tile,
+                       clone]:
+            method.assert_not_called()
+
+        self.assertEqual(player.gold, mpf("1e20") + tree.sell_gold_gain)
+        self.assertEqual(other_gold_mine.level, 3)
+        self.assertIs(player.player_base.get_islands()[0].get_tile_at(0, 9).building, other_gold_mine)
+        self.assertIsNone(player.player_base.get_islands()[0].get_tile_at(9, 0).building)
+        self.assertEqual(player.gold_per_second, gold_mine.gold_per_second + other_gold_mine.gold_per_second)
+
+    def test_upgrade_costs_after_level_ups(self):
+        gold_mine: GoldMine = GoldMine(mpf("1e5"), mpf("1e2"))
+        levelled_up_gold_mine: GoldMine = gold_mine.clone()
+        for level_ups in range(4):
+            self.assertEqual(gold_mine.get_upgrade_costs_after(level_ups),
+                             (levelled_up_gold_mine.upgrade_gold_cost, levelled_up_gold_mine.upgrade_gem_cost))
+            levelled_up_gold_mine.level_up()
+
+        self.assertEqual(gold_mine.level, 1)
+
+    def test_upgrade_planner(self):
+        player: Player = Player("Test Player")
+        player.gold = mpf("1e12")
+        gold_mines: list = [GoldMine(mpf("1e5"), mpf("0")), GoldMine(mpf("1e6"), mpf("0")),
+                            GoldMine(mpf("1e7"), mpf("0"))]
+        for gold_mine, (tile_x, tile_y) in zip(gold_mines, [(0, 0), (9, 0), (0, 9)]):
+            player.build_at_island_tile(0, tile_x, tile_y, gold_mine)
+
+        planner: UpgradePlanner = UpgradePlanner()
+        for gold in [mpf("0"), mpf("1e5"), mpf("2e6"), mpf("5e7"), mpf("1e9"), mpf("1e11")]:
+            player.gold = gold
+            operations: list = planner.plan(player, "GOLD")
+
+            # Comparing the plan with the best of all combinations of level ups
+            cost_curves: list = [planner.get_cost_curve(gold_mine, "gold_per_second", gold, mpf("0")) for gold_mine in
+                                 gold_mines]
+            best_gain: mpf = max(sum(point[2] for point in points) for points in
+                                 itertools.product(*cost_curves) if sum(point[0] for point in points) <= gold)
+            test_player: Player = player.clone()
+            old_gold_per_second: mpf = test_player.gold_per_second
+            self.assertTrue(test_player.manage_player_base(operations))
+            self.assertEqual(test_player.gold_per_second - old_gold_per_second, best_gain)
+
+        self.assertEqual(planner.plan(player, "NOT AN OBJECTIVE"), [])
+        self.assertEqual(planner.plan(player, "DEFENSE"), [])
+
+    ################################################################################################################
+    # Tests for the bonuses given to legendary creatures by buildings
+    def test_building_bonuses(self):
+        player: Player = Player("Test Player")
+        player.gold = mpf("1e10")
+        legendary_creatures: list = [new_test_legendary_creature(3) for i in range(100)]
+        for legendary_creature in legendary_creatures:
+            player.add_legendary_creature(legendary_creature)
+
+        guardstone: Guardstone = Guardstone(mpf("0"), mpf("0"))
+        player.build_at_island_tile(0, 0, 0, guardstone)
+        player.build_at_island_tile(0, 9, 9, BoosterTower(mpf("0"), mpf("0")))
+        player.level_up_building_at_island_tile(0, 0, 0)
+        self.assertEqual(guardstone.level, 2)
+        self.assertEqual(player.building_bonuses.defense_percentage_up,
+                         guardstone.legendary_creature_defense_percentage_up)
+        new_legendary_creature: LegendaryCreature = new_test_legendary_creature(3)
+        player.add_legendary_creature(new_legendary_creature)
+        for legendary_creature in [legendary_creatures[0], new_legendary_creature]:
+            legendary_creature.restore()
+            self.assertEqual(legendary_creature.defense_percentage_up, mpf("6"))
+            self.assertEqual(legendary_creature.attack_speed_percentage_up, mpf("3"))
+
+        player.remove_building_from_island_tile(0, 0, 0)
+        legendary_creatures[0].restore()
+        self.assertEqual(legendary_creatures[0].defense_percentage_up, mpf("0"))
+        self.assertEqual(LegendaryCreature.DEFAULT_DEFENSE_PERCENTAGE_UP, mpf("0"))
+
+    ################################################################################################################
+    # Tests for the tiles of an island
+    def test_island_tiles(self):
+        island: Island = Island(2021)
+        self.assertEqual(str(island), str(Island(2021)))
+        self.assertEqual(island.seed, 2021)
+        obstacles: list = [island.get_tile_at(x, y).building for y in range(island.height) for x in
+                           range(island.width) if isinstance(island.get_tile_at(x, y).building, Obstacle)]
+        self.assertTrue(0 < len(obstacles) < island.width * island.height)
+        for obstacle in obstacles:
+            self.assertTrue(mpf("1e5") <= obstacle.remove_gold_gain <= mpf("1e10"))
+            self.assertTrue(mpf("1e2") <= obstacle.remove_gem_gain <= mpf("1e6"))
+
+        self.assertIsNone(island.get_tile_at(0, 0).building)
+        self.assertIsNone(island.get_tile_at(island.width, 0))
+        summonhenge: Summonhenge = Summonhenge(mpf("0"), mpf("0"))
+        island.set_building_at(3, 4, summonhenge)
+        self.assertIs(island.get_tile_at(3, 4).building, summonhenge)
+        self.assertIs(island.get_tiles()[4][3].building, summonhenge)
+        self.assertIn("SUMMONHENGE", str(island))
+        loaded_island: Island = pickle.loads(pickle.dumps(island))
+        self.assertEqual(str(loaded_island), str(island))
+        island.remove_building_at(3, 4)
+        self.assertIsNone(island.get_tile_at(3, 4).building)
+        self.assertNotIn("SUMMONHENGE", str(island))
+
+    def test_load_old_player_base(self):
+        player_base: PlayerBase = PlayerBase()
+        player_base.add_island()
+        gold_mine: GoldMine = GoldMine(mpf("0"), mpf("0"))
+        player_base.get_islands()[1].set_building_at(2, 3, gold_mine)
+
+        # Player bases saved by older versions of the game do not index their buildings
+        state: dict = player_base.__dict__.copy()
+        del state["_PlayerBase__building_locations"]
+        old_player_base: PlayerBase = PlayerBase.__new__(PlayerBase)
+        old_player_base.__setstate__(state)
+        self.assertTrue(old_player_base.has_building(gold_mine))
+        self.assertEqual(old_player_base.get_building_location(gold_mine), (1, 2, 3))
+        self.assertEqual(old_player_base.get_buildings(GoldMine), [gold_mine])
+        self.assertEqual(old_player_base.get_buildings(Obstacle), [])
+
+    def test_load_old_island(self):
+        # Islands saved by older versions of the game keep a grid of island tiles
+        gold_mine: GoldMine = GoldMine(mpf("0"), mpf("0"))
+        tiles: list = [[IslandTile() for x in range(4)] for y in range(3)]
+        tiles[1][2] = IslandTile(Obstacle(mpf("1e7"), mpf("1e3")))
+        tiles[2][3] = IslandTile(gold_mine)
+        island: Island = Island.__new__(Island)
+        island.__setstate__({"_Island__tiles": tiles})
+        self.assertEqual((island.width, island.height), (4, 3))
+        self.assertEqual(island.get_building_tiles(Obstacle), [(2, 1)])
+        self.assertEqual(island.get_tile_at(2, 1).building.remove_gold_gain, mpf("1e7"))
+        self.assertEqual(island.get_tile_at(2, 1).building.remove_gem_gain, mpf("1e3"))
+        self.assertIs(island.get_tile_at(3, 2).building, gold_mine)
+        self.assertEqual(island.get_building_tiles(GoldMine), [(3, 2)])
+        self.assertEqual(len(island.get_free_tiles()), 10)
+        self.assertIn("GOLD MINE", str(island))
+        loaded_island: Island = pickle.loads(pickle.dumps(island))
+        self.assertEqual(str(loaded_island), str(island))
+
+    def test_island_spatial_queries(self):
+        island: Island = Island(2021, 30, 20)
+        self.assertEqual((island.width, island.height), (30, 20))
+        self.assertIsNone(island.get_tile_at(30, 0))
+        self.assertIsNotNone(island.get_tile_at(29, 19))
+        self.assertEqual(len(island.get_tiles()), 20)
+        self.assertEqual(len(island.get_tiles()[0]), 30)
+        for x, y in island.get_free_tiles():
+            self.assertIsNone(island.get_tile_at(x, y).building)
+
+        for x, y in island.get_building_tiles(Obstacle):
+            self.assertIsInstance(island.get_tile_at(x, y).building, Obstacle)
+
+        self.assertEqual(len(island.get_free_tiles()) + len(island.get_building_tiles(Obstacle)), 30 * 20)
+        self.assertEqual(island.get_nearest_building(0, 0, GoldMine), None)
+        island.set_building_at(0, 0, GoldMine(mpf("0"), mpf("0")))
+        island.set_building_at(29, 19, GoldMine(mpf("0"), mpf("0")))
+        self.assertNotIn((0, 0), island.get_free_tiles())
+        self.assertEqual(island.get_nearest_building(5, 5, GoldMine), (0, 0))
+        self.assertEqual(island.get_nearest_building(25, 15, GoldMine), (29, 19))
+        self.assertEqual(island.get_tiles_in_rectangle(-5, -5, 1, 0), [(0, 0), (1, 0)])
+        self.assertEqual(island.get_tiles_in_rectangle(0, 0, 100, 100, GoldMine), [(0, 0), (29, 19)])
+        self.assertEqual(island.get_adjacent_tiles(0, 0), {(1, 0), (0, 1)})
+        self.assertEqual(island.get_adjacent_tiles(5, 5), {(5, 4), (6, 5), (5, 6), (4, 5)})
+        island.remove_building_at(0, 0)
+        self.assertIn((0, 0), island.get_free_tiles())
+        self.assertEqual(island.get_building_tiles(GoldMine), [(29, 19)])
+
+        player: Player = Player("Test Player")
+        player.gold = mpf("1e10")
+        self.assertTrue(player.add_island_to_player_base(20, 15))
+        self.assertEqual(player.player_base.get_islands()[1].width, 20)
+        self.assertTrue(player.build_at_island_tile(1, 19, 14, Tree(mpf("0"), mpf("0"))))
+
+    def test_island_rendering_cache(self):
+        island: Island = Island(2021)
+        rendered_island: str = str(island)
+        self.assertIs(str(island), rendered_island)
+
+        # The island is rendered again after its cache is cleared or a building on it changes
+        island.clear_rendered_tiles()
+        self.assertIsNot(str(island), rendered_island)
+        self.assertEqual(str(island), rendered_island)
+        rendered_island = str(island)
+        island.set_building_at(0, 0, Tree(mpf("0"), mpf("0")))
+        self.assertIsNot(str(island), rendered_island)
+        self.assertIn("TREE", str(island))
+
+    ################################################################################################################
+    # Tests for the scheduler of periodic events
+    def test_event_scheduler(self):
+        times_run: list = []
+        scheduler: EventScheduler = EventScheduler()
+        first_event: ScheduledEvent = ScheduledEvent(datetime(2021, 1, 1, 1), timedelta(days=1), times_run.append)
+        second_event: ScheduledEvent = ScheduledEvent(datetime(2021, 1, 1, 2), timedelta(hours=1),
+                                                      times_run.append, "OWNER")
+        scheduler.schedule(second_event)
+        scheduler.schedule(first_event)
+        self.assertEqual(scheduler.run_due_events(datetime(2021, 1, 1, 0)), 0)
+        self.assertEqual(scheduler.run_due_events(datetime(2021, 1, 1, 1, 30)), 1)
+        self.assertEqual(first_event.next_time, datetime(2021, 1, 2, 1))
+
+        # Each event is run once, however many times it became due while the player was away
+        self.assertEqual(scheduler.run_due_events(datetime(2021, 1, 8, 12, 30)), 2)
+        self.assertEqual(first_event.next_time, datetime(2021, 1, 9, 1))
+        self.assertEqual(second_event.next_time, datetime(2021, 1, 8, 13))
+        self.assertTrue(scheduler.cancel("OWNER"))
+        self.assertEqual(scheduler.get_events(), [first_event])
+        self.assertEqual(scheduler.run_due_events(datetime(2021, 1, 8, 23)), 0)
+        self.assertEqual(len(times_run), 3)
+
     ################################################################################################################
     # Delete all the created files with "SAVED DATA" in their name from the directory "ANCIENT_INVASION" in the
     # project after test execution is complete. This is to ensure that all other test cases pass